@@ -0,0 +1,178 @@
+# apps/core/assets.py
+"""
+Static asset bundles.
+
+``ASSET_BUNDLES`` maps a bundle name (``site.css``) to the static files it
+is built from. ``build_bundle`` concatenates and minifies them; the
+``build_assets`` command writes the result under ``static/bundles/`` and
+runs ``collectstatic``. ``CompressedManifestStaticFilesStorage`` then gives
+every file a content-hashed name, so it can be cached forever, and writes
+``.gz`` and ``.br`` variants next to it for the web server to send as-is.
+
+The minifiers only remove comments and whitespace: enough for hand-written
+CSS and JS without a node toolchain, and nothing that can change meaning.
+"""
+import gzip
+import os
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only without Brotli
+    brotli = None
+
+BUNDLE_DIR = 'bundles'
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.json', '.txt', '.html', '.map')
+
+_CSS_TOKEN = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/|\s+|[{};,>:]|[^"\'/\s{};,>:]+|/', re.S)
+_CSS_PUNCTUATION = set('{};,>')
+_JS_TOKEN = re.compile(r'\w+|\s+|.', re.S)
+# After one of these, a "/" starts a regular expression rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^') | {'', 'return', 'typeof', 'case', 'do', 'else'}
+
+
+def bundle_path(name):
+    return f'{BUNDLE_DIR}/{name}'
+
+
+def minify_css(source):
+    out = []
+    # One entry per open block: True when it holds declarations, False for
+    # @media and friends, which hold rules whose selectors may contain ":"
+    blocks = []
+    prelude = 0
+    for token in _CSS_TOKEN.findall(source):
+        if token.startswith('/*'):
+            continue
+        in_declarations = bool(blocks) and blocks[-1]
+        if token.isspace():
+            # Kept only where it separates words ("0 auto", "nav a")
+            if out and out[-1] != ' ' and out[-1] not in _CSS_PUNCTUATION:
+                if not (out[-1] == ':' and in_declarations):
+                    out.append(' ')
+            continue
+        if out and out[-1] == ' ' and (token in _CSS_PUNCTUATION or (token == ':' and in_declarations)):
+            out.pop()
+        if token == '}' and out and out[-1] == ';':
+            out.pop()
+        out.append(token)
+        if token == '{':
+            at_rule = ''.join(out[prelude:]).lstrip()
+            blocks.append(not at_rule.startswith('@') or at_rule.startswith(('@font-face', '@page')))
+        elif token == '}' and blocks:
+            blocks.pop()
+        if token in '{};':
+            prelude = len(out)
+    return ''.join(out).strip()
+
+
+def minify_js(source):
+    """
+    Drop comments, indentation and blank lines. Line breaks stay, so
+    automatic semicolon insertion behaves exactly as before. Strings,
+    template literals (without nested backticks) and regular expressions
+    are copied verbatim.
+    """
+    out, last, i, n = [], '', 0, len(source)
+
+    def space(text):
+        newline = '\n' in text
+        if out and out[-1] in (' ', '\n'):
+            if newline:
+                out[-1] = '\n'
+        elif out:
+            out.append('\n' if newline else ' ')
+
+    while i < n:
+        char = source[i]
+        if char in '\'"`':
+            end = i + 1
+            while end < n and source[end] != char:
+                end += 2 if source[end] == '\\' else 1
+            out.append(source[i:end + 1])
+            last, i = char, end + 1
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end == -1 else end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            space(' ')
+        elif char == '/' and last in _REGEX_PRECEDERS:
+            end, in_class = i + 1, False
+            while end < n and (source[end] != '/' or in_class):
+                if source[end] == '\\':
+                    end += 1
+                elif source[end] == '[':
+                    in_class = True
+                elif source[end] == ']':
+                    in_class = False
+                end += 1
+            out.append(source[i:end + 1])
+            last, i = '/', end + 1
+        else:
+            token = _JS_TOKEN.match(source, i).group()
+            if token.isspace():
+                space(token)
+            else:
+                out.append(token)
+                last = token
+            i += len(token)
+    return ''.join(out).strip()
+
+
+def build_bundle(name, sources=None):
+    """Concatenate and minify the static files of bundle ``name``"""
+    sources = sources if sources is not None else settings.ASSET_BUNDLES[name]
+    minify = minify_css if name.endswith('.css') else minify_js
+    parts = []
+    for source in sources:
+        path = finders.find(source)
+        if path is None:
+            raise FileNotFoundError(f'Static file {source!r} in bundle {name!r} was not found')
+        with open(path, encoding='utf-8') as f:
+            parts.append(minify(f.read()))
+    # A newline (and for scripts a semicolon) keeps one file's last
+    # statement from running into the next file's first
+    return (';\n' if name.endswith('.js') else '\n').join(part for part in parts if part) + '\n'
+
+
+def compress(data):
+    """Return ``{'.gz': bytes, '.br': bytes}`` for the encodings available"""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that also writes gzip and brotli variants of each
+    hashed text file, skipping those that compress by less than 5%.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        hashed_names = []
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            if hashed_name and not isinstance(processed, Exception):
+                hashed_names.append(hashed_name)
+            yield name, hashed_name, processed
+        if not dry_run:
+            for hashed_name in hashed_names:
+                self.compress_file(hashed_name)
+
+    def compress_file(self, name):
+        if os.path.splitext(name)[1] not in COMPRESSIBLE_EXTENSIONS:
+            return
+        with self.open(name) as f:
+            data = f.read()
+        for suffix, compressed in compress(data).items():
+            if len(compressed) < len(data) * 0.95:
+                if self.exists(name + suffix):
+                    self.delete(name + suffix)
+                self._save(name + suffix, ContentFile(compressed))
@@ -0,0 +1,205 @@
+# apps/core/cache.py
+"""
+Cache backends with hit/miss accounting.
+
+``LRUCache`` is an in-process store bounded by entry count *and* total
+pickled size, evicting the least recently used entries first and honouring
+per-key timeouts. ``FileBasedCache`` is Django's file backend with the same
+counters, for running several gunicorn workers against one cache directory.
+Select one with the ``CACHE_BACKEND`` environment variable (see
+``config/settings/base.py``).
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends import filebased
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+_MISSING = object()
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def as_dict(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+# Django creates one backend instance per thread, so anything that must be
+# shared between requests lives in these module-level maps, keyed by LOCATION.
+_stats = {}
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class CacheStatsMixin:
+    """Count hits and misses on ``get`` (and therefore ``get_many``)"""
+
+    def _init_stats(self, name):
+        with _stores_lock:
+            self.stats = _stats.setdefault((type(self).__name__, name), CacheStats())
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        self.stats.record(value is not _MISSING)
+        return default if value is _MISSING else value
+
+
+class _LRUStore:
+    def __init__(self):
+        self.data = OrderedDict()  # key -> (pickled value, expiry or None)
+        self.size = 0
+        self.lock = threading.Lock()
+
+
+class _LRUBackend(BaseCache):
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, name, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._max_bytes = int(options.get('MAX_BYTES', 64 * 1024 * 1024))
+        with _stores_lock:
+            self._store = _stores.setdefault(name, _LRUStore())
+
+    # Internal helpers; callers hold the store lock.
+
+    def _live(self, key):
+        """Return the pickled value for ``key``, dropping it if expired"""
+        entry = self._store.data.get(key)
+        if entry is None:
+            return None
+        pickled, expiry = entry
+        if expiry is not None and expiry <= time.time():
+            self._delete(key)
+            return None
+        self._store.data.move_to_end(key)
+        return pickled
+
+    def _set(self, key, pickled, timeout):
+        store = self._store
+        self._delete(key)
+        if len(pickled) > self._max_bytes:
+            return
+        store.data[key] = (pickled, self.get_backend_timeout(timeout))
+        store.size += len(pickled)
+        while len(store.data) > self._max_entries or store.size > self._max_bytes:
+            _, (evicted, _) = store.data.popitem(last=False)
+            store.size -= len(evicted)
+
+    def _delete(self, key):
+        entry = self._store.data.pop(key, None)
+        if entry is None:
+            return False
+        self._store.size -= len(entry[0])
+        return True
+
+    # BaseCache API
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        with self._store.lock:
+            if self._live(key) is not None:
+                return False
+            self._set(key, pickled, timeout)
+            return True
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            pickled = self._live(key)
+        if pickled is None:
+            return default
+        return pickle.loads(pickled)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        with self._store.lock:
+            self._set(key, pickled, timeout)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            pickled = self._live(key)
+            if pickled is None:
+                return False
+            self._store.data[key] = (pickled, self.get_backend_timeout(timeout))
+            return True
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            pickled = self._live(key)
+            if pickled is None:
+                raise ValueError("Key '%s' not found" % key)
+            new_value = pickle.loads(pickled) + delta
+            expiry = self._store.data[key][1]
+            new_pickled = pickle.dumps(new_value, self.pickle_protocol)
+            self._store.data[key] = (new_pickled, expiry)
+            self._store.size += len(new_pickled) - len(pickled)
+        return new_value
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            return self._live(key) is not None
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            return self._delete(key)
+
+    def clear(self):
+        with self._store.lock:
+            self._store.data.clear()
+            self._store.size = 0
+
+
+class LRUCache(CacheStatsMixin, _LRUBackend):
+    """
+    In-process LRU cache.
+
+    OPTIONS: ``MAX_ENTRIES`` (entry count, Django's standard option) and
+    ``MAX_BYTES`` (total pickled size, default 64 MiB).
+    """
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        self._init_stats(name)
+
+
+class FileBasedCache(CacheStatsMixin, filebased.FileBasedCache):
+    """Django's file-based cache with hit/miss counters"""
+
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self._init_stats(dir)
+
+
+def cache_stats():
+    """Return ``{alias: {'hits', 'misses', 'hit_rate'}}`` for counting caches"""
+    return {
+        alias: caches[alias].stats.as_dict()
+        for alias in caches
+        if hasattr(caches[alias], 'stats')
+    }
@@ -0,0 +1,135 @@
+# apps/core/fetch.py
+"""
+Bounded-concurrency HTTP fetching on aiohttp.
+
+``FetchEngine.fetch_all(urls)`` runs a fixed pool of worker tasks over a
+bounded queue of URLs and yields a ``FetchResult`` per URL as each one
+completes, so neither pending URLs nor finished results pile up in memory
+when the consumer is slower than the network. The connector caps open
+connections overall and per host; connecting and reading time out, and
+connection errors, timeouts, 429 and 5xx answers are retried with
+exponential backoff and full jitter. Any other exception stops its worker
+and is re-raised once the remaining workers have finished.
+"""
+import asyncio
+import random
+import time
+
+import aiohttp
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchResult:
+    def __init__(self, url, status=None, body=None, error=None, attempts=0, elapsed=0.0):
+        self.url = url
+        self.status = status
+        self.body = body
+        self.error = error
+        self.attempts = attempts
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None and self.status is not None and self.status < 400
+
+    def __repr__(self):
+        return f'<FetchResult {self.url} status={self.status} error={self.error!r}>'
+
+
+class FetchEngine:
+    """
+    Fetch many URLs with at most ``concurrency`` requests in flight and
+    ``per_host`` connections to any one host.
+
+    ``method='HEAD'`` suits link checking; servers that refuse HEAD (405,
+    501) are asked again with GET. ``read_body=False`` skips downloading
+    bodies.
+    """
+
+    def __init__(self, concurrency=20, per_host=4, timeout=10, retries=2, backoff=0.5,
+                 method='GET', headers=None, read_body=True):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.method = method
+        self.headers = headers
+        self.read_body = read_body
+
+    async def fetch_all(self, urls):
+        """Yield a ``FetchResult`` per URL of the (async) iterable, in completion order"""
+        pending = asyncio.Queue(maxsize=self.concurrency * 2)
+        results = asyncio.Queue(maxsize=self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+        # Socket timeouts only: a request waiting for a free per-host
+        # connection has not started yet and should not time out.
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers) as session:
+            failures = []
+
+            async def feed():
+                try:
+                    if hasattr(urls, '__aiter__'):
+                        async for url in urls:
+                            await pending.put(url)
+                    else:
+                        for url in urls:
+                            await pending.put(url)
+                except Exception as exc:
+                    failures.append(exc)  # re-raised once the workers drain
+                for _ in range(self.concurrency):
+                    await pending.put(None)
+
+            async def work():
+                try:
+                    while (url := await pending.get()) is not None:
+                        await results.put(await self.fetch(session, url))
+                except Exception as exc:
+                    failures.append(exc)  # re-raised once the other workers drain
+                # Always signal the collector, which otherwise waits forever
+                await results.put(None)
+
+            tasks = [asyncio.create_task(feed())]
+            tasks += [asyncio.create_task(work()) for _ in range(self.concurrency)]
+            try:
+                running = self.concurrency
+                while running:
+                    result = await results.get()
+                    if result is None:
+                        running -= 1
+                    else:
+                        yield result
+                if failures:
+                    raise failures[0]
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def fetch(self, session, url):
+        started = time.perf_counter()
+        method, attempt = self.method, 0
+        while True:
+            attempt += 1
+            status, body, error = None, None, None
+            try:
+                async with session.request(method, url, allow_redirects=True) as response:
+                    status = response.status
+                    if self.read_body and method != 'HEAD':
+                        # A body that does not match its declared charset is not worth failing on
+                        body = await response.text(errors='replace')
+            except aiohttp.InvalidURL as exc:
+                error = f'invalid URL: {exc}'
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                error = str(exc) or exc.__class__.__name__
+            if method == 'HEAD' and status in (405, 501):
+                method = 'GET'
+                continue
+            if (error is None and status not in RETRY_STATUSES) or attempt > self.retries:
+                break
+            await asyncio.sleep(random.uniform(0, self.backoff * 2 ** (attempt - 1)))
+        return FetchResult(url, status, body, error, attempt, time.perf_counter() - started)
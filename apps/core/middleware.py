@@ -0,0 +1,68 @@
+# apps/core/middleware.py
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .querycount import query_budget, record_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCountMiddleware:
+    """
+    Development-only middleware that reports SQL cost per request.
+
+    Adds ``X-Query-Count`` and ``X-Query-Time-Ms`` headers to every response,
+    plus ``X-Query-Repeated`` when a query shape looks like an N+1 loop and
+    ``X-Query-Budget`` when the view has an entry in ``QUERY_BUDGETS``.
+    Problems are also logged as warnings under ``apps.core.middleware``.
+    Works under both WSGI and ASGI, so async views stay async in development.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DEBUG:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        return self.report(request, response, recorder)
+
+    async def __acall__(self, request):
+        # The ORM runs on the request's sync thread, which has its own
+        # connections, so install the wrappers there.
+        recording = record_queries()
+        recorder = await sync_to_async(recording.__enter__)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(recording.__exit__)(None, None, None)
+        return self.report(request, response, recorder)
+
+    def report(self, request, response, recorder):
+        view_name = request.resolver_match.view_name if request.resolver_match else request.path
+        response['X-Query-Count'] = str(recorder.count)
+        response['X-Query-Time-Ms'] = f'{recorder.total_time * 1000:.2f}'
+
+        repeated = recorder.repeated()
+        if repeated:
+            response['X-Query-Repeated'] = str(max(repeated.values()))
+            for shape, count in repeated.items():
+                logger.warning('Possible N+1 in %s: %d x %s', view_name, count, shape)
+
+        budget = query_budget(view_name)
+        if budget is not None:
+            response['X-Query-Budget'] = str(budget)
+            if recorder.count > budget:
+                logger.warning('%s ran %d queries, over its budget of %d',
+                               view_name, recorder.count, budget)
+        return response
@@ -0,0 +1,261 @@
+# apps/core/pagination.py
+"""
+Keyset (cursor) pagination.
+
+Pages are selected with a ``WHERE (a, b, id) > (x, y, z)`` predicate on a
+unique composite ordering instead of ``OFFSET``, so a deep page is the same
+index range scan as the first one. Cursors are opaque URL-safe tokens that
+carry the boundary row's key and the direction of travel.
+
+``EstimatedCountPaginator`` is an offset paginator for the admin that
+skips ``COUNT(*)`` on large unfiltered tables.
+"""
+import base64
+import binascii
+import datetime
+import json
+from collections import OrderedDict
+
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.functional import cached_property
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from .db import estimate_row_count
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    Keeps the microseconds DjangoJSONEncoder drops: a truncated key no longer
+    equals the boundary row's value, and the strict keyset comparison then
+    repeats or skips rows.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(key, reverse=False):
+    payload = json.dumps({'k': key, 'r': reverse}, cls=CursorJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, ordering):
+    """Return ``(key, reverse)`` for ``cursor``; raise InvalidCursor if it does not fit ``ordering``"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        key, reverse = payload['k'], bool(payload['r'])
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError):
+        raise InvalidCursor(cursor)
+    if not isinstance(key, list) or len(key) != len(ordering):
+        raise InvalidCursor(cursor)
+    return key, reverse
+
+
+def keyset_filter(ordering, key, reverse=False):
+    """
+    Return a Q selecting rows strictly after ``key`` in ``ordering``.
+
+    ``(a, b) > (x, y)`` expands to ``a > x OR (a = x AND b > y)``; ``-field``
+    entries compare the other way, and ``reverse`` flips every comparison to
+    walk backwards. The redundant bound on the first column lets the
+    database seek into the index instead of filtering it from the start.
+    """
+    def descending(field):
+        return field.startswith('-') != reverse
+
+    condition = Q()
+    for position, field in enumerate(ordering):
+        lookup = 'lt' if descending(field) else 'gt'
+        clause = Q(**{f'{field.lstrip("-")}__{lookup}': key[position]})
+        for previous, value in zip(ordering[:position], key):
+            clause &= Q(**{previous.lstrip('-'): value})
+        condition |= clause
+    first = ordering[0]
+    bound = Q(**{f'{first.lstrip("-")}__{"lte" if descending(first) else "gte"}': key[0]})
+    return bound & condition
+
+
+def _reverse_ordering(ordering):
+    return [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+
+
+class KeysetPage:
+    """One page of rows plus the cursors leading away from it"""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def paginate_keyset(queryset, ordering, cursor, page_size):
+    """
+    Return the ``KeysetPage`` of ``queryset`` that ``cursor`` points at.
+
+    ``ordering`` must be unique (end it with the primary key) and name
+    attributes of the model itself, e.g. ``category_id`` rather than
+    ``category``, so both the ORDER BY and the cursor key stay on one table.
+    """
+    ordering = list(ordering)
+    queryset, reverse = _keyset_queryset(queryset, ordering, cursor)
+    return _keyset_page(list(queryset[:page_size + 1]), ordering, cursor, reverse, page_size)
+
+
+async def apaginate_keyset(queryset, ordering, cursor, page_size):
+    """``paginate_keyset`` fetching the page through the async ORM"""
+    ordering = list(ordering)
+    queryset, reverse = _keyset_queryset(queryset, ordering, cursor)
+    rows = [row async for row in queryset[:page_size + 1]]
+    return _keyset_page(rows, ordering, cursor, reverse, page_size)
+
+
+def _keyset_queryset(queryset, ordering, cursor):
+    reverse = False
+    if cursor:
+        key, reverse = decode_cursor(cursor, ordering)
+        queryset = queryset.filter(keyset_filter(ordering, key, reverse))
+    return queryset.order_by(*(_reverse_ordering(ordering) if reverse else ordering)), reverse
+
+
+def _keyset_page(rows, ordering, cursor, reverse, page_size):
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+    if not rows:
+        return KeysetPage(rows)
+
+    def key_of(row):
+        return [getattr(row, field.lstrip('-')) for field in ordering]
+
+    # Walking forwards, the cursor proves there is a previous page; walking
+    # backwards, it proves there is a next one.
+    has_next = has_more if not reverse else True
+    has_previous = bool(cursor) if not reverse else has_more
+    return KeysetPage(
+        rows,
+        next_cursor=encode_cursor(key_of(rows[-1])) if has_next else None,
+        previous_cursor=encode_cursor(key_of(rows[0]), reverse=True) if has_previous else None,
+    )
+
+
+class KeysetPagination(BasePagination):
+    """
+    DRF pagination over ``view.ordering`` (or a validated ``?ordering=``).
+
+    The response keeps the ``count``/``next``/``previous``/``results`` shape;
+    pass ``?count=false`` to skip the ``COUNT(*)`` and omit ``count``.
+    """
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    ordering = ('id',)
+    include_count = True
+
+    def get_ordering(self, request, view=None):
+        ordering = list(getattr(view, 'ordering', None) or self.ordering)
+        param = request.query_params.get(api_settings.ORDERING_PARAM)
+        allowed = getattr(view, 'ordering_fields', None) or ()
+        if param:
+            requested = [field.strip() for field in param.split(',')]
+            requested = [field for field in requested if field.lstrip('-') in allowed]
+            if requested:
+                ordering = requested + ['id']
+        return ordering
+
+    def get_include_count(self, request):
+        value = request.query_params.get(self.count_query_param)
+        if value is None:
+            return self.include_count
+        return value.lower() not in ('0', 'false', 'no')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.count = queryset.count() if self.get_include_count(request) else None
+        try:
+            self.page = paginate_keyset(
+                queryset,
+                self.get_ordering(request, view),
+                request.query_params.get(self.cursor_query_param),
+                self.page_size,
+            )
+        except InvalidCursor:
+            raise NotFound('Invalid cursor.')
+        return self.page.object_list
+
+    def get_next_link(self):
+        if not self.page.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.page.next_cursor)
+
+    def get_previous_link(self):
+        if not self.page.has_previous:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.page.previous_cursor)
+
+    def get_paginated_response(self, data):
+        body = OrderedDict()
+        if self.count is not None:
+            body['count'] = self.count
+        body['next'] = self.get_next_link()
+        body['previous'] = self.get_previous_link()
+        body['results'] = data
+        return Response(body)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'count': {'type': 'integer'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Use the planner's row estimate instead of ``COUNT(*)`` when the
+    queryset is the whole table and the estimate is at least
+    ``threshold`` rows; filtered querysets and small tables get an exact
+    count. The last page number is approximate for estimated counts.
+    """
+    threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if hasattr(queryset, 'query') and not queryset.query.where and not queryset.query.distinct:
+            estimate = estimate_row_count(queryset.model, using=queryset.db)
+            if estimate is not None and estimate >= self.threshold:
+                return estimate
+        return super().count
@@ -0,0 +1,178 @@
+# apps/core/pipeline.py
+"""
+Staged processing pipeline with bounded queues.
+
+``Pipeline(stages).run(source)`` pulls items from ``source`` in the calling
+thread, passes them through each ``Stage`` on that stage's worker threads,
+and yields the last stage's results back in the calling thread. Database
+reads (the source) and writes (the loop over results) therefore stay on the
+caller's connection, while the stages in between overlap with them.
+
+Every queue is bounded, so a slow stage blocks the ones before it instead
+of letting work pile up in memory. The first exception raised by a stage
+stops all workers and is re-raised from ``run``. Each stage records how
+many items it processed, its busy time, its slowest item and how long it
+waited on the next stage (backpressure).
+"""
+import queue
+import threading
+import time
+
+_DONE = object()
+_POLL = 0.05
+
+
+class StageMetrics:
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+        self.max_latency = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency, blocked):
+        with self._lock:
+            self.items += 1
+            self.busy += latency
+            self.blocked += blocked
+            self.max_latency = max(self.max_latency, latency)
+
+    def summary(self, elapsed):
+        rate = self.items / elapsed if elapsed else 0
+        mean = self.busy / self.items * 1000 if self.items else 0
+        return (
+            f'{self.name}: {self.items} items, {rate:,.1f}/s, x{self.workers} workers, '
+            f'{mean:.1f} ms mean / {self.max_latency * 1000:.1f} ms max, '
+            f'{self.blocked:.2f}s blocked downstream'
+        )
+
+
+class Stage:
+    """
+    ``func(item)`` run on ``workers`` threads; its return value moves on
+    to the next stage, and ``None`` drops the item. ``queue_size`` bounds
+    the stage's input queue (default: two items per worker).
+    """
+
+    def __init__(self, name, func, workers=1, queue_size=None):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.queue_size = queue_size or workers * 2
+
+
+class Pipeline:
+    def __init__(self, stages, output_size=None):
+        self.stages = list(stages)
+        self.output_size = output_size or self.stages[-1].workers * 2
+        self.metrics = [StageMetrics(stage.name, stage.workers) for stage in self.stages]
+        self.elapsed = 0.0
+
+    def summary(self):
+        return [metrics.summary(self.elapsed) for metrics in self.metrics]
+
+    def run(self, source):
+        """Yield the results of the last stage, in completion order"""
+        started = time.perf_counter()
+        queues = [queue.Queue(stage.queue_size) for stage in self.stages]
+        queues.append(queue.Queue(self.output_size))
+        stop = threading.Event()
+        errors = []
+        remaining = [stage.workers for stage in self.stages]
+        remaining_lock = threading.Lock()
+
+        def put(target, item):
+            """Put unless the pipeline stops first; return seconds spent blocked"""
+            waited = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=_POLL)
+                    break
+                except queue.Full:
+                    pass
+            return time.perf_counter() - waited
+
+        def work(position):
+            stage, metrics = self.stages[position], self.metrics[position]
+            inbox, outbox = queues[position], queues[position + 1]
+            try:
+                while not stop.is_set():
+                    try:
+                        item = inbox.get(timeout=_POLL)
+                    except queue.Empty:
+                        continue
+                    if item is _DONE:
+                        break
+                    began = time.perf_counter()
+                    result = stage.func(item)
+                    latency = time.perf_counter() - began
+                    blocked = put(outbox, result) if result is not None else 0.0
+                    metrics.record(latency, blocked)
+            except Exception as exc:
+                errors.append(exc)
+                stop.set()
+                return
+            with remaining_lock:
+                remaining[position] -= 1
+                last = remaining[position] == 0
+            if last:
+                # Downstream workers (or run itself) each take one marker
+                downstream = self.stages[position + 1].workers if position + 1 < len(self.stages) else 1
+                for _ in range(downstream):
+                    put(outbox, _DONE)
+
+        threads = [
+            threading.Thread(target=work, args=(position,), name=f'{stage.name}-{number}', daemon=True)
+            for position, stage in enumerate(self.stages)
+            for number in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        inbox, outbox = queues[0], queues[-1]
+
+        def drain(block):
+            """Yield finished results; return True once the last stage is done"""
+            while not stop.is_set():
+                try:
+                    result = outbox.get(timeout=_POLL) if block else outbox.get_nowait()
+                except queue.Empty:
+                    if block:
+                        continue
+                    return False
+                if result is _DONE:
+                    return True
+                yield result
+            return False
+
+        def feed(item):
+            """Put ``item`` on the first stage, yielding results while it is full"""
+            while not stop.is_set():
+                try:
+                    inbox.put(item, timeout=_POLL)
+                    return
+                except queue.Full:
+                    # The first stage is saturated: make room downstream
+                    yield from drain(block=False)
+
+        try:
+            for item in source:
+                yield from feed(item)
+                yield from drain(block=False)
+                if stop.is_set():
+                    break
+            if not stop.is_set():
+                # The markers queue behind unfinished items, so keep draining
+                # while they go in or a full output queue blocks every stage
+                for _ in range(self.stages[0].workers):
+                    yield from feed(_DONE)
+                yield from drain(block=True)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            self.elapsed = time.perf_counter() - started
+        if errors:
+            raise errors[0]
@@ -0,0 +1,82 @@
+# apps/core/querycount.py
+"""
+Per-request SQL instrumentation.
+
+``record_queries()`` installs a ``connection.execute_wrapper`` on every
+database connection and collects each statement with its duration. Queries
+are fingerprinted (literals and ``IN`` lists collapsed) so the same shape
+issued over and over - the signature of an N+1 loop - can be flagged.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+# A query shape repeated this many times in one request is reported as N+1.
+N_PLUS_ONE_THRESHOLD = 3
+
+FINGERPRINT_RULES = [
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'\bIN \((?:%s|\?)(?:, ?(?:%s|\?))*\)', re.IGNORECASE), 'IN (...)'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def fingerprint(sql):
+    """Reduce ``sql`` to its shape so repeated queries compare equal"""
+    for pattern, replacement in FINGERPRINT_RULES:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+class QueryRecorder:
+    """``execute_wrapper`` that records every statement and its duration"""
+
+    def __init__(self):
+        self.queries = []  # (sql, seconds)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def total_time(self):
+        return sum(duration for _, duration in self.queries)
+
+    def repeated(self, threshold=N_PLUS_ONE_THRESHOLD):
+        """Return ``{fingerprint: count}`` for shapes issued ``threshold`` times or more"""
+        counts = Counter(fingerprint(sql) for sql, _ in self.queries)
+        return {shape: count for shape, count in counts.items() if count >= threshold}
+
+    def summary(self):
+        lines = [f'{self.count} queries in {self.total_time * 1000:.1f} ms']
+        lines.extend(f'  {duration * 1000:7.2f} ms  {sql}' for sql, duration in self.queries)
+        for shape, count in self.repeated().items():
+            lines.append(f'  repeated {count}x: {shape}')
+        return '\n'.join(lines)
+
+
+@contextmanager
+def record_queries():
+    """Record the queries run on every configured database inside the block"""
+    recorder = QueryRecorder()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        yield recorder
+
+
+def query_budget(view_name):
+    """Return the configured maximum query count for a URL name, if any"""
+    return getattr(settings, 'QUERY_BUDGETS', {}).get(view_name)
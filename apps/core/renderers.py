@@ -0,0 +1,44 @@
+# apps/core/renderers.py
+"""
+JSON rendering through orjson when it is installed.
+
+``FastJSONRenderer`` is a drop-in for DRF's ``JSONRenderer``: orjson
+encodes dicts, lists, strings, numbers, datetimes, dates and UUIDs itself
+and hands anything else (Decimal, lazy translation strings, ...) to DRF's
+encoder. Without orjson, or for output it cannot produce (indentation
+other than 2, ASCII-only or non-compact JSON), it defers to
+``JSONRenderer``.
+"""
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# DRF escapes these so the JSON is also valid JavaScript
+_LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+def json_dumps(data, indent=None):
+    """Encode ``data`` to UTF-8 JSON bytes, with orjson when available"""
+    if orjson is None or indent not in (None, 2):
+        return JSONEncoder(ensure_ascii=False, indent=indent, separators=(',', ':')).encode(data).encode()
+    option = orjson.OPT_UTC_Z | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(data, default=JSONEncoder().default, option=option)
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if orjson is None or indent not in (None, 2) or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        content = json_dumps(data, indent)
+        for separator, escaped in _LINE_SEPARATORS:
+            if separator in content:
+                content = content.replace(separator, escaped)
+        return content
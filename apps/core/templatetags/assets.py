@@ -0,0 +1,23 @@
+# apps/core/templatetags/assets.py
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html_join
+
+from apps.core.assets import bundle_path
+
+register = template.Library()
+
+
+@register.simple_tag
+def bundle(name):
+    """
+    ``<link>`` or deferred ``<script>`` tags for an ``ASSET_BUNDLES`` entry:
+    the built bundle when ``ASSETS_USE_BUNDLES`` is on, else its sources.
+    """
+    paths = [bundle_path(name)] if settings.ASSETS_USE_BUNDLES else settings.ASSET_BUNDLES[name]
+    if name.endswith('.css'):
+        tag = '<link rel="stylesheet" href="{}">'
+    else:
+        tag = '<script src="{}" defer></script>'
+    return format_html_join('\n', tag, ((static(path),) for path in paths))
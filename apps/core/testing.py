@@ -0,0 +1,87 @@
+# apps/core/testing.py
+import re
+
+from django.db import connections
+from django.urls import reverse
+
+from .querycount import query_budget, record_queries
+
+
+class QueryBudgetMixin:
+    """TestCase mixin asserting views stay within ``settings.QUERY_BUDGETS``"""
+
+    def assertWithinQueryBudget(self, view_name, args=None, data=None):
+        budget = query_budget(view_name)
+        self.assertIsNotNone(budget, f'No QUERY_BUDGETS entry for {view_name!r}')
+
+        with record_queries() as recorder:
+            response = self.client.get(reverse(view_name, args=args), data)
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(
+            recorder.count, budget,
+            f'{view_name} ran {recorder.count} queries, budget is {budget}\n{recorder.summary()}',
+        )
+        self.assertFalse(
+            recorder.repeated(),
+            f'{view_name} repeats a query shape (N+1)\n{recorder.summary()}',
+        )
+        return response
+
+
+# Plan lines that mean "read the whole table" or "sort the rows afterwards".
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (\w+)\b(?! USING)'),
+    'postgresql': re.compile(r'\bSeq Scan on (\w+)'),
+}
+SEEK_PATTERNS = {
+    'sqlite': re.compile(r'\bSEARCH \w+ USING (?:COVERING )?INDEX'),
+    'postgresql': re.compile(r'\bIndex Cond\b'),
+}
+SORT_PATTERNS = {
+    'sqlite': re.compile(r'USE TEMP B-TREE FOR ORDER BY'),
+    'postgresql': re.compile(r'\bSort\b'),
+}
+
+
+def explain(queryset):
+    """
+    Return the query plan of ``queryset``.
+
+    On PostgreSQL sequential scans and sorts are disabled first: with the
+    tiny tables of a test database the planner would otherwise pick them
+    even where an index applies, and it still does where none does.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.explain()
+    with connection.cursor() as cursor:
+        cursor.execute('SET enable_seqscan = off')
+        cursor.execute('SET enable_sort = off')
+        try:
+            return queryset.explain()
+        finally:
+            cursor.execute('RESET enable_seqscan')
+            cursor.execute('RESET enable_sort')
+
+
+class QueryPlanMixin:
+    """TestCase mixin asserting querysets are answered from indexes"""
+
+    def assertUsesIndex(self, queryset, index=None, seek=False, sort=False):
+        """
+        Fail if the plan of ``queryset`` scans a whole table, does not use
+        ``index`` (when given), does not seek into an index when ``seek`` is
+        True, or sorts rows when ``sort`` is False.
+        """
+        vendor = connections[queryset.db].vendor
+        if vendor not in FULL_SCAN_PATTERNS:
+            self.skipTest(f'No query plan rules for {vendor}')
+        plan = explain(queryset)
+        self.assertIsNone(FULL_SCAN_PATTERNS[vendor].search(plan), f'Full table scan:\n{plan}')
+        if index is not None:
+            self.assertIn(index, plan, f'{index} not used:\n{plan}')
+        if seek:
+            self.assertIsNotNone(SEEK_PATTERNS[vendor].search(plan), f'Index is scanned, not searched:\n{plan}')
+        if not sort:
+            self.assertIsNone(SORT_PATTERNS[vendor].search(plan), f'Sort step:\n{plan}')
+        return plan
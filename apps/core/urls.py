@@ -1,7 +1,9 @@
 # apps/core/urls.py
 from django.urls import path
-from .views import api_stats
+from .views import api_stats, search, suggest
 
 urlpatterns = [
     path('stats/', api_stats, name='api_stats'),
+    path('search/', search, name='api_search'),
+    path('suggest/', suggest, name='api_suggest'),
 ]
\ No newline at end of file
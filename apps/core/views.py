@@ -1,29 +1,60 @@
 # apps/core/views.py
+from django.db.models import Count
 from django.shortcuts import render
 from django.views.generic import TemplateView
 from django.http import JsonResponse
 from apps.topics.models import Category, Topic
+from apps.topics.search import aget_search_index
+from apps.topics.stats import aget_stats
+from apps.topics.suggest import MAX_LIMIT as MAX_SUGGESTIONS, aget_suggest_index
 
 class HomeView(TemplateView):
     template_name = 'index.html'
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['categories'] = Category.objects.all()
-        context['featured_topics'] = Topic.objects.filter(is_featured=True)[:6]
-        context['total_topics'] = Topic.objects.count()
-        context['total_categories'] = Category.objects.count()
+        categories = list(
+            Category.objects.annotate(topic_count=Count('topics')).order_by('order', 'name')
+        )
+        context['categories'] = categories
+        context['featured_topics'] = Topic.objects.filter(is_featured=True).with_counts()[:6]
+        # Every topic belongs to exactly one category, so the totals fall out
+        # of the annotated category rows without further queries.
+        context['total_topics'] = sum(category.topic_count for category in categories)
+        context['total_categories'] = len(categories)
         return context
 
-def api_stats(request):
+# The API views below are async: under ASGI they wait on the database
+# without holding a worker thread.
+
+async def api_stats(request):
     """API endpoint for dashboard statistics"""
-    stats = {
-        'total_topics': Topic.objects.count(),
-        'total_categories': Category.objects.count(),
-        'difficulty_breakdown': {
-            'beginner': Topic.objects.filter(difficulty='beginner').count(),
-            'intermediate': Topic.objects.filter(difficulty='intermediate').count(),
-            'advanced': Topic.objects.filter(difficulty='advanced').count(),
-        }
-    }
-    return JsonResponse(stats)
+    return JsonResponse(await aget_stats())
+
+async def search(request):
+    """Full-text search across topics, code examples and interview questions"""
+    query = request.GET.get('q', '').strip()
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 50)
+    except ValueError:
+        limit = 10
+
+    results = (await aget_search_index()).search(query, limit=limit) if query else []
+    return JsonResponse({
+        'query': query,
+        'count': len(results),
+        'results': results,
+    })
+
+async def suggest(request):
+    """Typeahead suggestions for topic titles, tags and category names"""
+    prefix = request.GET.get('prefix', '')
+    try:
+        limit = min(max(int(request.GET.get('limit', 8)), 1), MAX_SUGGESTIONS)
+    except ValueError:
+        limit = 8
+
+    return JsonResponse({
+        'prefix': prefix,
+        'suggestions': (await aget_suggest_index()).suggest(prefix, limit=limit),
+    })
@@ -1 +1,164 @@
-# This file is intentionally left blank.
\ No newline at end of file
+# apps/examples/fastapi_examples/crud.py
+"""
+User repositories for the FastAPI example service.
+
+Every lookup goes through an index: the in-memory store keeps dicts keyed
+by id and by email, the SQL store a primary key and a UNIQUE email column.
+Email uniqueness is enforced by the store itself rather than by a
+check-then-insert in the endpoint, so concurrent requests cannot both
+create the same user.
+"""
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from itertools import count, islice
+
+from .database import IntegrityError
+
+USER_FIELDS = ('name', 'email', 'age')
+
+
+class DuplicateEmail(Exception):
+    pass
+
+
+class UserRepository(ABC):
+    """Interface shared by the stores; users are plain dicts"""
+
+    @abstractmethod
+    async def create(self, data):
+        pass
+
+    @abstractmethod
+    async def get(self, user_id):
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, email):
+        pass
+
+    @abstractmethod
+    async def list(self, skip=0, limit=10):
+        pass
+
+    @abstractmethod
+    async def update(self, user_id, changes):
+        """Return the updated user, or None if there is no such user"""
+
+    @abstractmethod
+    async def delete(self, user_id):
+        """Return True if a user was deleted"""
+
+
+class InMemoryUserRepository(UserRepository):
+    """
+    Dicts keyed by id and by email.
+
+    Writes check and update both indexes under one lock that is never held
+    across an ``await``, so they are atomic on the event loop and from
+    threadpool callers alike. The store lives in one process: run several
+    workers against ``SQLUserRepository`` instead.
+    """
+
+    def __init__(self):
+        self.by_id = {}
+        self.by_email = {}
+        self._ids = count(1)
+        self._lock = threading.Lock()
+
+    async def create(self, data):
+        user = {field: data.get(field) for field in USER_FIELDS}
+        with self._lock:
+            if user['email'] in self.by_email:
+                raise DuplicateEmail(user['email'])
+            user.update(id=next(self._ids), created_at=datetime.now())
+            self.by_id[user['id']] = user
+            self.by_email[user['email']] = user
+        return user
+
+    async def get(self, user_id):
+        return self.by_id.get(user_id)
+
+    async def get_by_email(self, email):
+        return self.by_email.get(email)
+
+    async def list(self, skip=0, limit=10):
+        # dicts keep insertion order, i.e. id order. Iterating while another
+        # thread inserts would raise "dictionary changed size during iteration"
+        with self._lock:
+            return list(islice(self.by_id.values(), skip, skip + limit))
+
+    async def update(self, user_id, changes):
+        with self._lock:
+            user = self.by_id.get(user_id)
+            if user is None:
+                return None
+            email = changes.get('email', user['email'])
+            if email != user['email'] and email in self.by_email:
+                raise DuplicateEmail(email)
+            updated = {**user, **{field: changes[field] for field in USER_FIELDS if field in changes}}
+            del self.by_email[user['email']]
+            self.by_id[user_id] = self.by_email[email] = updated
+        return updated
+
+    async def delete(self, user_id):
+        with self._lock:
+            user = self.by_id.pop(user_id, None)
+            if user is None:
+                return False
+            del self.by_email[user['email']]
+        return True
+
+
+class SQLUserRepository(UserRepository):
+    """Users in a ``users`` table of a pooled ``database.py`` database"""
+
+    def __init__(self, database):
+        self.database = database
+
+    async def create_table(self):
+        await self.database.execute_script(f"""
+            CREATE TABLE IF NOT EXISTS users (
+                id {self.database.autoincrement_pk},
+                name TEXT NOT NULL,
+                email TEXT NOT NULL UNIQUE,
+                age INTEGER,
+                created_at TEXT NOT NULL
+            );
+        """)
+
+    async def create(self, data):
+        try:
+            return await self.database.fetch_one(
+                'INSERT INTO users (name, email, age, created_at) VALUES (?, ?, ?, ?) RETURNING *',
+                data['name'], data['email'], data.get('age'), datetime.now().isoformat(),
+            )
+        except IntegrityError:
+            raise DuplicateEmail(data['email'])
+
+    async def get(self, user_id):
+        return await self.database.fetch_one('SELECT * FROM users WHERE id = ?', user_id)
+
+    async def get_by_email(self, email):
+        return await self.database.fetch_one('SELECT * FROM users WHERE email = ?', email)
+
+    async def list(self, skip=0, limit=10):
+        return await self.database.fetch_all(
+            'SELECT * FROM users ORDER BY id LIMIT ? OFFSET ?', limit, skip,
+        )
+
+    async def update(self, user_id, changes):
+        fields = [field for field in USER_FIELDS if field in changes]
+        if not fields:
+            return await self.get(user_id)
+        assignments = ', '.join(f'{field} = ?' for field in fields)
+        try:
+            return await self.database.fetch_one(
+                f'UPDATE users SET {assignments} WHERE id = ? RETURNING *',
+                *(changes[field] for field in fields), user_id,
+            )
+        except IntegrityError:
+            raise DuplicateEmail(changes.get('email'))
+
+    async def delete(self, user_id):
+        return await self.database.execute('DELETE FROM users WHERE id = ?', user_id) > 0
@@ -1 +1,145 @@
-# This file is intentionally left blank.
\ No newline at end of file
+# apps/examples/fastapi_examples/database.py
+"""
+Async connection pools for the FastAPI example service.
+
+``SQLiteDatabase`` keeps a fixed set of ``sqlite3`` connections (WAL mode,
+so readers do not block the writer) and runs each statement on a worker
+thread, letting the event loop serve other requests meanwhile.
+``PostgresDatabase`` wraps an ``asyncpg`` pool (``pip install asyncpg``).
+Both expose the same small API with ``?`` placeholders and raise
+``IntegrityError`` for constraint violations.
+"""
+import asyncio
+import re
+import sqlite3
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+DEFAULT_POOL_SIZE = 5
+
+
+class IntegrityError(Exception):
+    """A unique or other constraint was violated"""
+
+
+class SQLiteDatabase:
+    autoincrement_pk = 'INTEGER PRIMARY KEY AUTOINCREMENT'
+
+    def __init__(self, path, pool_size=DEFAULT_POOL_SIZE):
+        self.path = path
+        self.pool_size = pool_size
+        self._pool = None
+
+    async def connect(self):
+        self._pool = asyncio.Queue()
+        for _ in range(self.pool_size):
+            self._pool.put_nowait(await asyncio.to_thread(self._open))
+
+    def _open(self):
+        # Connections are handed between worker threads, one at a time.
+        # An in-memory database is private to its connection unless shared.
+        path, uri = self.path, self.path.startswith('file:')
+        if path == ':memory:':
+            path, uri = f'file:memdb{id(self)}?mode=memory&cache=shared', True
+        connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, uri=uri)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA busy_timeout=5000')
+        return connection
+
+    async def disconnect(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+    @asynccontextmanager
+    async def _connection(self):
+        connection = await self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put_nowait(connection)
+
+    async def _run(self, sql, params, fetch):
+        def run(connection):
+            try:
+                cursor = connection.execute(sql, params)
+                if fetch == 'one':
+                    row = cursor.fetchone()
+                    return dict(row) if row is not None else None
+                if fetch == 'all':
+                    return [dict(row) for row in cursor.fetchall()]
+                return cursor.rowcount
+            except sqlite3.IntegrityError as exc:
+                raise IntegrityError(str(exc)) from exc
+
+        async with self._connection() as connection:
+            return await asyncio.to_thread(run, connection)
+
+    async def execute(self, sql, *params):
+        """Run a statement and return the number of affected rows"""
+        return await self._run(sql, params, None)
+
+    async def fetch_one(self, sql, *params):
+        return await self._run(sql, params, 'one')
+
+    async def fetch_all(self, sql, *params):
+        return await self._run(sql, params, 'all')
+
+    async def execute_script(self, sql):
+        async with self._connection() as connection:
+            await asyncio.to_thread(connection.executescript, sql)
+
+
+class PostgresDatabase:
+    autoincrement_pk = 'SERIAL PRIMARY KEY'
+
+    def __init__(self, dsn, pool_size=DEFAULT_POOL_SIZE):
+        self.dsn = dsn
+        self.pool_size = pool_size
+        self._pool = None
+
+    async def connect(self):
+        import asyncpg
+        self._asyncpg = asyncpg
+        self._pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=self.pool_size)
+
+    async def disconnect(self):
+        await self._pool.close()
+
+    @staticmethod
+    def _placeholders(sql):
+        counter = iter(range(1, sql.count('?') + 1))
+        return re.sub(r'\?', lambda _: f'${next(counter)}', sql)
+
+    async def _run(self, method, sql, params):
+        try:
+            async with self._pool.acquire() as connection:
+                return await getattr(connection, method)(self._placeholders(sql), *params)
+        except self._asyncpg.IntegrityConstraintViolationError as exc:
+            raise IntegrityError(str(exc)) from exc
+
+    async def execute(self, sql, *params):
+        status = await self._run('execute', sql, params)
+        # asyncpg returns the command tag, e.g. "UPDATE 1"
+        return int(status.rsplit(' ', 1)[-1]) if status[-1:].isdigit() else 0
+
+    async def fetch_one(self, sql, *params):
+        row = await self._run('fetchrow', sql, params)
+        return dict(row) if row is not None else None
+
+    async def fetch_all(self, sql, *params):
+        return [dict(row) for row in await self._run('fetch', sql, params)]
+
+    async def execute_script(self, sql):
+        async with self._pool.acquire() as connection:
+            await connection.execute(sql)
+
+
+def database_from_url(url, pool_size=DEFAULT_POOL_SIZE):
+    """Build a database for ``sqlite:///path`` or ``postgresql://...`` URLs"""
+    scheme = urlparse(url).scheme
+    if scheme == 'sqlite':
+        return SQLiteDatabase(url[len('sqlite:///'):] or ':memory:', pool_size)
+    if scheme in ('postgres', 'postgresql'):
+        return PostgresDatabase(url, pool_size)
+    raise ValueError(f'Unsupported database URL: {url}')
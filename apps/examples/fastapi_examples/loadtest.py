@@ -0,0 +1,166 @@
+# apps/examples/fastapi_examples/loadtest.py
+"""
+Concurrent-create load test for the user endpoints.
+
+Fires ``--creates`` POST /users/ requests, ``--concurrency`` at a time,
+where every email is sent ``--duplicates`` times, then checks that each
+email was accepted exactly once, the ids handed out are unique and the
+store holds exactly one user per email.
+
+Without ``--url`` the app is driven in-process through ASGI. Point it at a
+running server to test several workers against a shared database::
+
+    USERS_DATABASE_URL=sqlite:///users.db uvicorn apps.examples.fastapi_examples.main:app --workers 4 --port 8001
+    python -m apps.examples.fastapi_examples.loadtest --url http://127.0.0.1:8001 --creates 5000
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from urllib.parse import urlsplit
+
+
+class ASGIClient:
+    """Send requests straight to an ASGI app"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method, path, body=None):
+        path, _, query = path.partition('?')
+        messages = [{'type': 'http.request', 'body': json.dumps(body).encode() if body is not None else b''}]
+        sent = []
+
+        async def receive():
+            return messages.pop() if messages else {'type': 'http.disconnect'}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+            'method': method, 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+            'query_string': query.encode(), 'root_path': '',
+            'headers': [(b'content-type', b'application/json')],
+            'client': ('127.0.0.1', 0), 'server': ('testserver', 80),
+        }
+        await self.app(scope, receive, send)
+        content = b''.join(message.get('body', b'') for message in sent[1:])
+        return sent[0]['status'], json.loads(content) if content else None
+
+
+class HTTPClient:
+    """Minimal HTTP/1.1 client on asyncio streams, one connection per request"""
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+
+    async def request(self, method, path, body=None):
+        content = json.dumps(body).encode() if body is not None else b''
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(
+                f'{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nConnection: close\r\n'
+                f'Content-Type: application/json\r\nContent-Length: {len(content)}\r\n\r\n'.encode() + content
+            )
+            await writer.drain()
+            response = await reader.read()
+        finally:
+            writer.close()
+        head, _, content = response.partition(b'\r\n\r\n')
+        if b'transfer-encoding: chunked' in head.lower():
+            content = _dechunk(content)
+        status = int(head.split(b' ', 2)[1])
+        return status, json.loads(content) if content else None
+
+
+def _dechunk(content):
+    chunks = []
+    while content:
+        size, _, content = content.partition(b'\r\n')
+        size = int(size, 16)
+        if not size:
+            break
+        chunks.append(content[:size])
+        content = content[size + 2:]
+    return b''.join(chunks)
+
+
+async def run_load_test(client, creates=1000, concurrency=100, duplicates=2):
+    """Return a summary dict; ``problems`` lists every violated invariant"""
+    run = uuid.uuid4().hex[:8]
+    emails = [f'load-{run}-{n // duplicates}@example.com' for n in range(creates)]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(n, email):
+        async with semaphore:
+            return await client.request('POST', '/users/', {
+                'name': f'Load {n}', 'email': email, 'password': 'secret',
+            })
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(create(n, email) for n, email in enumerate(emails)))
+    elapsed = time.perf_counter() - started
+
+    problems = []
+    accepted = {}
+    for (status, body), email in zip(results, emails):
+        if status == 201:
+            if email in accepted:
+                problems.append(f'{email} was created twice')
+            accepted[email] = body['id']
+        elif status != 400:
+            problems.append(f'unexpected status {status} for {email}: {body}')
+    unique_emails = set(emails)
+    if len(accepted) != len(unique_emails):
+        problems.append(f'{len(accepted)} of {len(unique_emails)} emails were created')
+    if len(set(accepted.values())) != len(accepted):
+        problems.append('duplicate ids were handed out')
+
+    for email, user_id in accepted.items():
+        status, body = await client.request('GET', f'/users/{user_id}')
+        if status != 200 or body['email'] != email:
+            problems.append(f'user {user_id} does not hold {email}')
+    return {
+        'requests': creates,
+        'created': len(accepted),
+        'elapsed': elapsed,
+        'rate': creates / elapsed if elapsed else 0,
+        'problems': problems,
+    }
+
+
+async def _in_process(creates, concurrency, duplicates):
+    from .main import app
+
+    async with app.router.lifespan_context(app):
+        return await run_load_test(ASGIClient(app), creates, concurrency, duplicates)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help='Base URL of a running server (default: drive the app in-process)')
+    parser.add_argument('--creates', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--duplicates', type=int, default=2, help='Requests per email')
+    options = parser.parse_args(argv)
+
+    if options.url:
+        summary = asyncio.run(run_load_test(
+            HTTPClient(options.url), options.creates, options.concurrency, options.duplicates,
+        ))
+    else:
+        summary = asyncio.run(_in_process(options.creates, options.concurrency, options.duplicates))
+
+    print(f'{summary["requests"]} requests, {summary["created"]} users created in '
+          f'{summary["elapsed"]:.2f}s ({summary["rate"]:,.0f} requests/s)')
+    for problem in summary['problems'][:20]:
+        print(f'FAIL: {problem}')
+    return 1 if summary['problems'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,47 @@
 # apps/examples/fastapi_examples/main.py
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, validator
 from typing import List, Optional
+from contextlib import asynccontextmanager
 from datetime import datetime
 import asyncio
+import os
+
+from .crud import DuplicateEmail, InMemoryUserRepository, SQLUserRepository, UserRepository
+from .database import database_from_url
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson encodes datetimes itself and is several times faster than the
+# stdlib json behind JSONResponse; fall back to that when it is missing.
+DefaultResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+# User store: the indexed in-memory repository by default, or a pooled
+# database when USERS_DATABASE_URL is set (sqlite:///users.db, postgresql://...)
+DATABASE_URL = os.environ.get("USERS_DATABASE_URL")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if DATABASE_URL:
+        database = database_from_url(DATABASE_URL)
+        await database.connect()
+        app.state.users = SQLUserRepository(database)
+        await app.state.users.create_table()
+        yield
+        await database.disconnect()
+    else:
+        app.state.users = InMemoryUserRepository()
+        yield
+
 
-app = FastAPI(title="Interview Prep API Examples", version="1.0.0")
+app = FastAPI(title="Interview Prep API Examples", version="1.0.0", lifespan=lifespan,
+              default_response_class=DefaultResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -43,9 +78,15 @@ class APIResponse(BaseModel):
     message: str
     data: Optional[dict] = None
 
-# In-memory database for demo
-users_db = []
-user_id_counter = 1
+def get_users_repository(request: Request) -> UserRepository:
+    return request.app.state.users
+
+
+def user_not_found(user_id: int):
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"User with id {user_id} not found"
+    )
 
 @app.get("/")
 async def root():
@@ -57,74 +98,49 @@ async def health_check():
 
 # CRUD Operations Example
 @app.post("/users/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def create_user(user: UserCreate):
+async def create_user(user: UserCreate, users: UserRepository = Depends(get_users_repository)):
     """Create a new user - demonstrates POST endpoint with validation"""
-    global user_id_counter
-    
-    # Check if user already exists
-    for existing_user in users_db:
-        if existing_user['email'] == user.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User with this email already exists"
-            )
-    
-    new_user = {
-        "id": user_id_counter,
-        "name": user.name,
-        "email": user.email,
-        "age": user.age,
-        "created_at": datetime.now()
-    }
-    users_db.append(new_user)
-    user_id_counter += 1
-    
-    return new_user
+    try:
+        return await users.create(user.dict(exclude={"password"}))
+    except DuplicateEmail:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists"
+        )
 
 @app.get("/users/", response_model=List[UserResponse])
-async def get_users(skip: int = 0, limit: int = 10):
+async def get_users(skip: int = Query(0, ge=0), limit: int = Query(10, ge=0),
+                    users: UserRepository = Depends(get_users_repository)):
     """Get all users with pagination - demonstrates GET with query parameters"""
-    return users_db[skip: skip + limit]
+    return await users.list(skip=skip, limit=limit)
 
 @app.get("/users/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int):
+async def get_user(user_id: int, users: UserRepository = Depends(get_users_repository)):
     """Get user by ID - demonstrates path parameters and error handling"""
-    for user in users_db:
-        if user['id'] == user_id:
-            return user
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"User with id {user_id} not found"
-    )
+    user = await users.get(user_id)
+    if user is None:
+        raise user_not_found(user_id)
+    return user
 
 @app.put("/users/{user_id}", response_model=UserResponse)
-async def update_user(user_id: int, user_update: UserBase):
+async def update_user(user_id: int, user_update: UserBase, users: UserRepository = Depends(get_users_repository)):
     """Update user - demonstrates PUT endpoint"""
-    for i, user in enumerate(users_db):
-        if user['id'] == user_id:
-            updated_user = user.copy()
-            updated_user.update(user_update.dict(exclude_unset=True))
-            users_db[i] = updated_user
-            return updated_user
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"User with id {user_id} not found"
-    )
+    try:
+        user = await users.update(user_id, user_update.dict(exclude_unset=True))
+    except DuplicateEmail:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists"
+        )
+    if user is None:
+        raise user_not_found(user_id)
+    return user
 
 @app.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(user_id: int):
+async def delete_user(user_id: int, users: UserRepository = Depends(get_users_repository)):
     """Delete user - demonstrates DELETE endpoint"""
-    for i, user in enumerate(users_db):
-        if user['id'] == user_id:
-            del users_db[i]
-            return
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"User with id {user_id} not found"
-    )
+    if not await users.delete(user_id):
+        raise user_not_found(user_id)
 
 # Async Operations Example
 @app.get("/async-example/")
@@ -4,10 +4,11 @@ Async/Await Examples for Interview Preparation
 """
 
 import asyncio
-import aiohttp
 import time
 from concurrent.futures import ThreadPoolExecutor
 
+from apps.core.fetch import FetchEngine
+
 async def fetch_data(url, session):
     """Async function to fetch data from URL"""
     try:
@@ -16,35 +17,44 @@ async def fetch_data(url, session):
     except Exception as e:
         return f"Error fetching {url}: {str(e)}"
 
-async def fetch_multiple_urls(urls):
-    """Fetch multiple URLs concurrently"""
-    async with aiohttp.ClientSession() as session:
-        tasks = [fetch_data(url, session) for url in urls]
-        results = await asyncio.gather(*tasks)
-        return results
+async def fetch_multiple_urls(urls, concurrency=10):
+    """
+    Fetch multiple URLs concurrently, at most ``concurrency`` at a time.
 
-async def producer(queue, items):
+    A bare ``asyncio.gather`` over every URL opens as many requests as
+    there are URLs; FetchEngine bounds them with a worker pool, limits
+    connections per host, and adds timeouts and retries.
+    """
+    results = {}
+    async for result in FetchEngine(concurrency=concurrency).fetch_all(urls):
+        if result.ok:
+            results[result.url] = result.body
+        else:
+            results[result.url] = f"Error fetching {result.url}: {result.error or result.status}"
+    return [results[url] for url in urls]
+
+async def producer(queue, items, consumers=1):
     """Producer coroutine for async queue"""
     for item in items:
-        await queue.put(item)
+        await queue.put(item)  # waits while a bounded queue is full
         print(f"Produced: {item}")
         await asyncio.sleep(0.1)  # Simulate work
     
-    # Signal completion
-    await queue.put(None)
+    # Signal completion: one sentinel per consumer
+    for _ in range(consumers):
+        await queue.put(None)
 
 async def consumer(queue, name):
     """Consumer coroutine for async queue"""
     while True:
         item = await queue.get()
-        if item is None:
-            # Signal received, stop consuming
-            await queue.put(None)  # Re-add signal for other consumers
-            break
-        
-        print(f"Consumer {name} consumed: {item}")
-        await asyncio.sleep(0.2)  # Simulate processing
-        queue.task_done()
+        try:
+            if item is None:
+                break
+            print(f"Consumer {name} consumed: {item}")
+            await asyncio.sleep(0.2)  # Simulate processing
+        finally:
+            queue.task_done()  # for the sentinel too, so queue.join() returns
 
 async def async_context_manager_example():
     """Example of async context manager"""
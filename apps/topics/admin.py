@@ -1,7 +1,16 @@
 
 # apps/topics/admin.py
 from django.contrib import admin
-from .models import Category, Topic, CodeExample, InterviewQuestion
+from django.db.models import Count
+
+from apps.core.pagination import EstimatedCountPaginator
+from .models import Category, Tag, Topic, CodeExample, InterviewQuestion
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """Changelists that avoid COUNT(*) over the whole table on each load"""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -9,10 +18,19 @@ class CategoryAdmin(admin.ModelAdmin):
     list_editable = ('order',)
     search_fields = ('name', 'description')
     ordering = ('order', 'name')
-    
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(topic_count=Count('topics'))
+
     def topic_count(self, obj):
-        return obj.topics.count()
+        return obj.topic_count
     topic_count.short_description = 'Topics'
+    topic_count.admin_order_field = 'topic_count'
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ('name',)
+    search_fields = ('name',)
 
 class CodeExampleInline(admin.TabularInline):
     model = CodeExample
@@ -25,11 +43,14 @@ class InterviewQuestionInline(admin.TabularInline):
     fields = ('question', 'difficulty', 'order')
 
 @admin.register(Topic)
-class TopicAdmin(admin.ModelAdmin):
+class TopicAdmin(LargeTableAdmin):
     list_display = ('title', 'category', 'difficulty', 'is_featured', 'estimated_time', 'created_at')
     list_filter = ('category', 'difficulty', 'is_featured', 'created_at')
-    search_fields = ('title', 'description', 'tags')
+    list_select_related = ('category',)
+    # Prefix matches on one short column, never LIKE '%term%' over long text
+    search_fields = ('^title',)
     list_editable = ('is_featured', 'difficulty')
+    filter_horizontal = ('tags',)
     ordering = ('category__order', 'order', 'title')
     inlines = [CodeExampleInline, InterviewQuestionInline]
     
@@ -43,11 +64,15 @@ class TopicAdmin(admin.ModelAdmin):
     )
 
 @admin.register(CodeExample)
-class CodeExampleAdmin(admin.ModelAdmin):
+class CodeExampleAdmin(LargeTableAdmin):
     list_display = ('title', 'topic', 'language', 'has_github_url', 'order')
     list_filter = ('language', 'topic__category', 'created_at')
-    search_fields = ('title', 'description', 'code')
-    ordering = ('topic', 'order', 'title')
+    list_select_related = ('topic',)
+    # Not the code itself: LIKE '%term%' over code bodies reads the whole table
+    search_fields = ('^title',)
+    # topic_id rather than topic, which would sort by Topic.Meta.ordering
+    # through two joins; this order is codeexample_topic_order_idx
+    ordering = ('topic_id', 'order', 'title')
     
     def has_github_url(self, obj):
         return bool(obj.github_url)
@@ -55,11 +80,12 @@ class CodeExampleAdmin(admin.ModelAdmin):
     has_github_url.short_description = 'GitHub Link'
 
 @admin.register(InterviewQuestion)
-class InterviewQuestionAdmin(admin.ModelAdmin):
+class InterviewQuestionAdmin(LargeTableAdmin):
     list_display = ('question_preview', 'topic', 'difficulty', 'has_tips', 'order')
     list_filter = ('difficulty', 'topic__category', 'created_at')
-    search_fields = ('question', 'sample_answer', 'tips')
-    ordering = ('topic', 'order')
+    list_select_related = ('topic',)
+    search_fields = ('^question',)
+    ordering = ('topic_id', 'order', 'id')  # question_topic_order_idx
     
     def question_preview(self, obj):
         return obj.question[:80] + "..." if len(obj.question) > 80 else obj.question
@@ -0,0 +1,10 @@
+# apps/topics/apps.py
+from django.apps import AppConfig
+
+
+class TopicsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.topics'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,91 @@
+# apps/topics/async_views.py
+"""
+Async read-only JSON endpoints for topics and categories.
+
+DRF views are synchronous, so under ASGI every request to the viewsets
+holds a worker thread until its response is written. These views query
+through Django's async ORM and serialize rows that are already in memory,
+so slow queries and slow clients wait on the event loop instead. They
+render the same representations as the viewsets' list and retrieve
+actions (``?fields=``, ``?expand=``, ``?tag=``, ``?cursor=``,
+``?count=false``), without the response cache and conditional GET.
+"""
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from apps.core.pagination import InvalidCursor, apaginate_keyset
+from apps.core.renderers import json_dumps
+
+from .filters import filter_by_tags, parse_tag_params
+from .models import Category, Topic
+from .serializers import CategorySerializer, TopicListSerializer, TopicSerializer, parse_fieldset
+from .views import CATEGORY_ORDERING, TOPIC_ORDERING, CategoryViewSet
+
+
+def json_response(data, status=200):
+    return HttpResponse(json_dumps(data), status=status, content_type='application/json')
+
+
+def not_found(detail='Not found.'):
+    # Same body as DRF's NotFound
+    return json_response({'detail': detail}, status=404)
+
+
+async def paginated_response(request, queryset, ordering, serialize):
+    include_count = request.GET.get('count', '').lower() not in ('0', 'false', 'no')
+    cursor = request.GET.get('cursor')
+    try:
+        page = await apaginate_keyset(queryset, ordering, cursor, api_settings.PAGE_SIZE)
+    except InvalidCursor:
+        return not_found('Invalid cursor.')
+    url = request.build_absolute_uri()
+    body = {}
+    if include_count:
+        body['count'] = await queryset.acount()
+    body['next'] = replace_query_param(url, 'cursor', page.next_cursor) if page.has_next else None
+    body['previous'] = replace_query_param(url, 'cursor', page.previous_cursor) if page.has_previous else None
+    body['results'] = serialize(page.object_list)
+    return json_response(body)
+
+
+def _fieldset(request):
+    return parse_fieldset(request.GET.get('fields')), parse_fieldset(request.GET.get('expand'))
+
+
+async def topic_list(request):
+    fields, expand = _fieldset(request)
+    names = TopicListSerializer.selected_fields(fields, expand) + list(TOPIC_ORDERING)
+    tags = parse_tag_params(request.GET.getlist('tag'))
+    # Resolving tag names is a small indexed lookup; do it off the loop
+    topics = await sync_to_async(filter_by_tags)(Topic.objects.all(), tags)
+    return await paginated_response(
+        request, topics.for_fields(names), TOPIC_ORDERING,
+        lambda rows: TopicListSerializer(rows, many=True, fields=fields, expand=expand).data,
+    )
+
+
+async def topic_detail(request, pk):
+    fields, expand = _fieldset(request)
+    names = TopicSerializer.selected_fields(fields, expand)
+    try:
+        topic = await Topic.objects.for_fields(names).aget(pk=pk)
+    except Topic.DoesNotExist:
+        return not_found()
+    return json_response(TopicSerializer(topic, fields=fields, expand=expand).data)
+
+
+async def category_list(request):
+    return await paginated_response(
+        request, CategoryViewSet.queryset.all(), CATEGORY_ORDERING,
+        lambda rows: CategorySerializer(rows, many=True).data,
+    )
+
+
+async def category_detail(request, pk):
+    try:
+        category = await CategoryViewSet.queryset.aget(pk=pk)
+    except Category.DoesNotExist:
+        return not_found()
+    return json_response(CategorySerializer(category).data)
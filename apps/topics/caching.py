@@ -0,0 +1,52 @@
+# apps/topics/caching.py
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from .generations import get_generations
+from .models import Category, Tag, Topic, CodeExample, InterviewQuestion
+
+CATALOGUE_MODELS = (Category, Topic, Tag, CodeExample, InterviewQuestion)
+
+
+class GenerationCacheMixin:
+    """
+    Cache the serialized data of read-only viewset actions.
+
+    Keys combine the action, the request's host, path and sorted query
+    parameters, and the current generations of ``cache_models``. A write to
+    any of those models moves its generation, so stale entries are never
+    read again and simply age out of the cache.
+    """
+    cache_models = CATALOGUE_MODELS
+
+    def get_response_cache_key(self, request):
+        query = sorted(request.query_params.lists())
+        raw = '|'.join([
+            request.get_host(),
+            request.path,
+            repr(query),
+            repr(get_generations(*self.cache_models)),
+        ])
+        digest = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+        return f'api:{self.basename}:{self.action}:{digest}'
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data, headers={'X-Cache': 'HIT'})
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,94 @@
+# apps/topics/conditional.py
+"""
+Conditional GET (ETag / Last-Modified) for topic and category views.
+
+Validators are computed from an aggregate over ``updated_at`` and the row
+count of the queryset a view would render, so a client revalidating an
+unchanged page costs one small query and no serialization. Child edits
+reach the parent's validator because saving or deleting a code example or
+interview question (or retagging a topic) touches ``Topic.updated_at``;
+see ``signals.py``. The topic page shows its category, so its validators
+cover ``Category.updated_at`` as well.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def build_validators(request, last_modified, *parts):
+    """
+    Return ``(etag, last_modified_timestamp)``.
+
+    The ETag also covers the full path and ``Accept`` header because the
+    same rows render differently per page, filter and representation.
+    """
+    raw = '|'.join(str(part) for part in (
+        request.get_full_path(),
+        request.META.get('HTTP_ACCEPT', ''),
+        last_modified.isoformat() if last_modified else '',
+        *parts,
+    ))
+    etag = quote_etag(hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest())
+    return etag, int(last_modified.timestamp()) if last_modified else None
+
+
+def queryset_validators(request, queryset, *extra_parts):
+    """Validators for the rows of ``queryset``: ``Max(updated_at)`` and count"""
+    state = queryset.order_by().aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+    return build_validators(request, state['last_modified'], state['count'], *extra_parts)
+
+
+def topic_validators(request, queryset, *extra_parts):
+    """Validators for topics rendered with their category's name and details"""
+    state = queryset.order_by().aggregate(
+        topic_modified=Max('updated_at'),
+        category_modified=Max('category__updated_at'),
+        count=Count('pk'),
+    )
+    last_modified = max(filter(None, [state['topic_modified'], state['category_modified']]), default=None)
+    return build_validators(request, last_modified, state['count'], *extra_parts)
+
+
+def category_validators(request, queryset):
+    """Validators for categories rendered together with their topics"""
+    state = queryset.order_by().aggregate(
+        category_modified=Max('updated_at'),
+        topic_modified=Max('topics__updated_at'),
+        count=Count('pk', distinct=True),
+        topic_count=Count('topics', distinct=True),
+    )
+    last_modified = max(filter(None, [state['category_modified'], state['topic_modified']]), default=None)
+    return build_validators(request, last_modified, state['count'], state['topic_count'])
+
+
+class ConditionalResponseMixin:
+    """
+    Answer GETs with 304 when the client's validators still match.
+
+    Views implement ``get_validators(request, **url_kwargs)`` returning
+    ``(etag, last_modified_timestamp)``; ``conditional_response`` wraps the
+    handler that would otherwise build the full response.
+    """
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        etag, last_modified = self.get_validators(request, **kwargs)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class ConditionalGetMixin(ConditionalResponseMixin):
+    """Viewset mixin applying ``conditional_response`` to list and retrieve"""
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
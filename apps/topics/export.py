@@ -0,0 +1,90 @@
+# apps/topics/export.py
+"""
+Streaming NDJSON export of the topic catalogue.
+
+Topics, code examples and interview questions are read as three cursors
+ordered by topic id (each backed by an index) and merged as they stream, so
+only one topic's children are in memory at a time however large the corpus
+is, and the first line goes out as soon as the first rows arrive. Tags are
+small per topic and are prefetched per chunk by ``iterator(chunk_size=...)``.
+
+Under ASGI a sync iterator would be drained into a list before the first
+byte is sent, so ``aiter_ndjson`` hands the same generator to a worker
+thread one chunk of lines at a time instead.
+"""
+import itertools
+from operator import attrgetter
+
+from asgiref.sync import sync_to_async
+from rest_framework import serializers
+
+from apps.core.renderers import json_dumps
+
+from .models import Topic, CodeExample, InterviewQuestion
+from .serializers import CodeExampleSerializer, InterviewQuestionSerializer, TopicSerializer
+
+EXPORT_CHUNK_SIZE = 200
+
+
+class TopicExportSerializer(TopicSerializer):
+    category = serializers.CharField(source='category.name', read_only=True)
+
+    class Meta(TopicSerializer.Meta):
+        fields = [
+            'id', 'category', 'title', 'description', 'difficulty', 'estimated_time',
+            'tags', 'tags_list', 'is_featured',
+        ]
+
+
+class _ChildStream:
+    """Rows of one child model grouped by topic, consumed in topic id order"""
+
+    def __init__(self, queryset, chunk_size):
+        ordering = ('topic_id', *queryset.model._meta.ordering)
+        rows = queryset.order_by(*ordering).iterator(chunk_size=chunk_size)
+        self.groups = itertools.groupby(rows, key=attrgetter('topic_id'))
+        self.head = next(self.groups, None)
+
+    def take(self, topic_id):
+        """Return the rows of ``topic_id``, skipping any earlier topics"""
+        while self.head is not None and self.head[0] < topic_id:
+            self.head = next(self.groups, None)
+        if self.head is None or self.head[0] != topic_id:
+            return []
+        rows = list(self.head[1])
+        self.head = next(self.groups, None)
+        return rows
+
+
+def iter_topic_documents(chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield one dict per topic with its code examples and interview questions nested"""
+    topics = (
+        Topic.objects.select_related('category').prefetch_related('tags')
+        .order_by('id').iterator(chunk_size=chunk_size)
+    )
+    examples = _ChildStream(CodeExample.objects.all(), chunk_size)
+    questions = _ChildStream(InterviewQuestion.objects.all(), chunk_size)
+    for topic in topics:
+        document = TopicExportSerializer(topic).data
+        document['code_examples'] = CodeExampleSerializer(examples.take(topic.pk), many=True).data
+        document['interview_questions'] = InterviewQuestionSerializer(questions.take(topic.pk), many=True).data
+        yield document
+
+
+def iter_ndjson(chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield one JSON-encoded line (``str``, newline included) per topic"""
+    for document in iter_topic_documents(chunk_size):
+        yield json_dumps(document).decode() + '\n'
+
+
+async def aiter_ndjson(chunk_size=EXPORT_CHUNK_SIZE):
+    """``iter_ndjson`` for ASGI: yield the lines of each chunk joined into one ``str``"""
+    lines = iter_ndjson(chunk_size)
+    # thread_sensitive keeps every step on the thread that opened the cursors
+    next_chunk = sync_to_async(lambda: ''.join(itertools.islice(lines, chunk_size)))
+    try:
+        while chunk := await next_chunk():
+            yield chunk
+    finally:
+        # Close the cursors now if the client went away mid-stream
+        await sync_to_async(lines.close)()
@@ -0,0 +1,50 @@
+# apps/topics/filters.py
+from django.db.models import Count
+from rest_framework import filters
+
+from .models import Tag, Topic
+
+
+def parse_tag_params(values):
+    """Flatten ``?tag=a&tag=b`` and ``?tag=a,b`` into a set of tag names"""
+    return {
+        Tag.normalize(name)
+        for value in values
+        for name in value.split(',')
+    } - {''}
+
+
+def filter_by_tags(queryset, names):
+    """
+    Restrict ``queryset`` to topics carrying every tag in ``names``.
+
+    Tag names are resolved to ids through the unique index on ``Tag.name``,
+    then the AND is computed as a set intersection over the topic/tag join
+    table: rows for the requested tags are grouped by topic and only topics
+    that matched all of them survive. Only the posting lists of the
+    requested tags are read, so the cost follows the number of matches
+    rather than the number of topics.
+    """
+    if not names:
+        return queryset
+
+    tag_ids = list(Tag.objects.filter(name__in=names).values_list('id', flat=True))
+    if len(tag_ids) < len(names):
+        return queryset.none()
+
+    matching = (
+        Topic.tags.through.objects
+        .filter(tag_id__in=tag_ids)
+        .values('topic_id')
+        .annotate(matched=Count('tag_id'))
+        .filter(matched=len(tag_ids))
+        .values('topic_id')
+    )
+    return queryset.filter(pk__in=matching)
+
+
+class TagFilterBackend(filters.BaseFilterBackend):
+    """Filter topics by ``?tag=``; repeat or comma-separate for AND queries"""
+
+    def filter_queryset(self, request, queryset, view):
+        return filter_by_tags(queryset, parse_tag_params(request.query_params.getlist('tag')))
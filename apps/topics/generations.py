@@ -0,0 +1,44 @@
+# apps/topics/generations.py
+"""
+Per-model generation counters for the topics models.
+
+Every committed write to a model bumps its counter (see ``signals.py``), so
+anything derived from the catalogue can be tagged with the generations it
+was built from and treated as stale once they move. Counters live in the
+default cache, which makes them shared across workers when a shared cache
+backend is configured.
+"""
+import time
+
+from django.core.cache import cache
+
+KEY_TEMPLATE = 'topics:generation:{}'
+
+
+def _key(model):
+    return KEY_TEMPLATE.format(model._meta.label_lower)
+
+
+def _fresh_generation():
+    # A counter missing from the cache (first use, eviction, restart) must
+    # never restart at a value an older snapshot was tagged with.
+    return time.time_ns()
+
+
+def get_generations(*models):
+    """Return the current generation of each model, in order"""
+    keys = [_key(model) for model in models]
+    found = cache.get_many(keys)
+    missing = {key: _fresh_generation() for key in keys if key not in found}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        found.update(missing)
+    return tuple(found[key] for key in keys)
+
+
+def bump_generation(model):
+    key = _key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _fresh_generation(), timeout=None)
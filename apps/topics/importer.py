@@ -0,0 +1,359 @@
+# apps/topics/importer.py
+"""
+Bulk content importer behind ``import_content`` and ``load_sample_data``.
+
+Records are dicts with a ``type`` of ``category``, ``topic``,
+``code_example`` or ``interview_question`` plus the model's fields. Parents
+are referenced by natural key: a topic's ``category`` is a category name, a
+code example's or question's ``topic`` is a topic title. Keys are resolved
+from in-memory name -> id maps and rows are written with ``bulk_create`` /
+``bulk_update`` in one transaction per batch, instead of a ``get_or_create``
+round trip per row.
+
+Existing rows (same name, title, or topic + title/question) are skipped,
+or overwritten with the record's fields when ``update=True``.
+"""
+import json
+import time
+from collections import Counter
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from .generations import bump_generation
+from .models import Category, Tag, Topic, CodeExample, InterviewQuestion
+from .search import reset_search_index
+from .suggest import mark_suggest_index_stale
+
+RECORD_TYPES = {
+    'category': Category,
+    'topic': Topic,
+    'code_example': CodeExample,
+    'interview_question': InterviewQuestion,
+}
+# Parents are written before children within every batch.
+FLUSH_ORDER = ['category', 'topic', 'code_example', 'interview_question']
+# bulk_update emits one CASE WHEN per field and row; its cost per row grows
+# with the batch, so updates go out in smaller statements than inserts.
+UPDATE_BATCH_SIZE = 100
+# Natural key field of each record type (children add their topic)
+KEY_FIELDS = {
+    'category': 'name',
+    'topic': 'title',
+    'code_example': 'title',
+    'interview_question': 'question',
+}
+# Stored fields computed from others; bulk writes skip the save() that would
+# refresh them, so they are written whenever a record sets one of their sources
+DERIVED_FIELDS = {
+    CodeExample: {
+        'code': ('highlighted_code', 'highlight_key'),
+        'language': ('highlighted_code', 'highlight_key'),
+    },
+}
+
+
+class ContentError(ValueError):
+    pass
+
+
+def read_records(path):
+    """
+    Yield ``(location, record)`` pairs from a JSON Lines or YAML file.
+
+    Files are streamed: JSON Lines one line at a time, YAML one document at
+    a time (a document may be a single record or a list of them).
+    """
+    if str(path).endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise ContentError('PyYAML is required to import YAML files')
+        with open(path, encoding='utf-8') as stream:
+            for number, document in enumerate(yaml.safe_load_all(stream), 1):
+                records = document if isinstance(document, list) else [document]
+                for index, record in enumerate(records):
+                    yield f'{path}: document {number}, record {index + 1}', record
+    else:
+        with open(path, encoding='utf-8') as stream:
+            for number, line in enumerate(stream, 1):
+                if line.strip():
+                    try:
+                        yield f'{path}:{number}', json.loads(line)
+                    except ValueError as exc:
+                        raise ContentError(f'{path}:{number}: invalid JSON ({exc})')
+
+
+def _split_tags(tags):
+    if isinstance(tags, str):
+        tags = tags.split(',')
+    return tags or []
+
+
+class ContentImporter:
+    """
+    Buffer records and write them in batches.
+
+    Call ``add()`` per record and ``finish()`` at the end; ``finish()``
+    returns ``{type: Counter(created=, updated=, skipped=)}``. Problems with
+    single records are reported through ``warn`` and the record is skipped.
+    """
+
+    def __init__(self, batch_size=1000, update=False, warn=None):
+        self.batch_size = batch_size
+        self.update = update
+        self.warn = warn or (lambda message: None)
+        self.buffers = {record_type: [] for record_type in FLUSH_ORDER}
+        self.stats = {record_type: Counter() for record_type in FLUSH_ORDER}
+        self.errors = 0
+        self.started = time.perf_counter()
+        self.category_ids = dict(Category.objects.values_list('name', 'id'))
+        self.topic_ids = dict(Topic.objects.values_list('title', 'id'))
+        # {record type: {topic id: {key: pk}}}, loaded once per topic
+        self.child_ids = {'code_example': {}, 'interview_question': {}}
+        self.allowed_fields = {
+            model: {
+                field.name for field in model._meta.concrete_fields
+                if field.editable and not field.primary_key
+            } - {'created_at', 'updated_at'}
+            for model in RECORD_TYPES.values()
+        }
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def add(self, record, location=''):
+        record_type = record.get('type') if isinstance(record, dict) else None
+        if record_type not in RECORD_TYPES:
+            self._reject(location, f'unknown record type {record_type!r}')
+            return
+        self.buffers[record_type].append((location, record))
+        if len(self.buffers[record_type]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not any(self.buffers.values()):
+            return
+        with transaction.atomic():
+            for record_type in FLUSH_ORDER:
+                records, self.buffers[record_type] = self.buffers[record_type], []
+                if records:
+                    getattr(self, f'_flush_{record_type}')(records)
+
+    def finish(self):
+        self.flush()
+        self._refresh_derived_state()
+        return self.stats
+
+    # Per-type writers
+
+    def _flush_category(self, records):
+        objects, sources = {}, {}
+        for location, record in records:
+            fields = self._fields(Category, record, location)
+            if fields is not None:
+                objects[fields['name']] = Category(**fields)
+                sources[fields['name']] = record
+        created = self._write(Category, 'category', objects, self.category_ids, sources)
+        self._remember_ids(Category, 'name', created, self.category_ids)
+
+    def _flush_topic(self, records):
+        objects, sources, tags = {}, {}, {}
+        for location, record in records:
+            fields = self._fields(Topic, record, location, exclude=('category', 'tags'))
+            category_id = self.category_ids.get(record.get('category'))
+            if fields is None:
+                continue
+            if category_id is None:
+                self._reject(location, f'unknown category {record.get("category")!r}')
+                continue
+            objects[fields['title']] = Topic(category_id=category_id, **fields)
+            sources[fields['title']] = record
+            if 'tags' in record:
+                tags[fields['title']] = _split_tags(record['tags'])
+        created = self._write(Topic, 'topic', objects, self.topic_ids, sources)
+        self._remember_ids(Topic, 'title', created, self.topic_ids)
+        written = created if not self.update else objects
+        self._write_tags({
+            self.topic_ids[title]: names for title, names in tags.items() if title in written
+        })
+
+    def _flush_code_example(self, records):
+        self._flush_children(CodeExample, 'code_example', records)
+
+    def _flush_interview_question(self, records):
+        self._flush_children(InterviewQuestion, 'interview_question', records)
+
+    def _flush_children(self, model, record_type, records):
+        key_field = KEY_FIELDS[record_type]
+        objects, sources = {}, {}
+        for location, record in records:
+            fields = self._fields(model, record, location, exclude=('topic',))
+            topic_id = self.topic_ids.get(record.get('topic'))
+            if fields is None:
+                continue
+            if topic_id is None:
+                self._reject(location, f'unknown topic {record.get("topic")!r}')
+                continue
+            objects[(topic_id, fields[key_field])] = model(topic_id=topic_id, **fields)
+            sources[(topic_id, fields[key_field])] = record
+
+        # Load each topic's existing keys once rather than looking the batch
+        # up by text, which no index covers.
+        known = self.child_ids[record_type]
+        unloaded = {topic_id for topic_id, _ in objects} - known.keys()
+        for topic_id in unloaded:
+            known[topic_id] = {}
+        if unloaded:
+            rows = model.objects.filter(topic_id__in=unloaded).values_list('topic_id', key_field, 'id')
+            for topic_id, key, pk in rows.iterator():
+                known[topic_id][key] = pk
+        existing = {
+            (topic_id, key): known[topic_id][key]
+            for topic_id, key in objects if key in known[topic_id]
+        }
+
+        if model is CodeExample:
+            self._refresh_highlights(objects, existing, sources)
+
+        created = self._write(model, record_type, objects, existing, sources)
+        for (topic_id, key), obj in created.items():
+            if obj.pk is None:
+                known.pop(topic_id, None)  # reload on next use
+            elif topic_id in known:
+                known[topic_id][key] = obj.pk
+        # Moves the parents' Last-Modified/ETag validators, as the signals would
+        written = created if not self.update else objects
+        topic_ids = {topic_id for topic_id, _ in written}
+        if topic_ids:
+            Topic.objects.filter(pk__in=topic_ids).update(updated_at=timezone.now())
+
+    def _refresh_highlights(self, objects, existing, sources):
+        """
+        Render highlighting for new examples and for updates that set code
+        or language. An update that sets only one of them is rendered with
+        the stored value of the other, not the model default.
+        """
+        rendered = {
+            key: obj for key, obj in objects.items()
+            if key not in existing or (self.update and {'code', 'language'} & sources[key].keys())
+        }
+        # pk -> natural key of updates that leave code or language as stored
+        partial = {
+            existing[key]: key for key in rendered
+            if key in existing and not {'code', 'language'} <= sources[key].keys()
+        }
+        if partial:
+            stored = CodeExample.objects.filter(pk__in=partial).values_list('id', 'code', 'language')
+            for pk, code, language in stored.iterator():
+                key = partial[pk]
+                rendered[key].code = sources[key].get('code', code)
+                rendered[key].language = sources[key].get('language', language)
+        for obj in rendered.values():
+            obj.refresh_highlight()
+
+    # Helpers
+
+    def _fields(self, model, record, location, exclude=()):
+        """Return the record's model fields, or None after reporting a problem"""
+        fields = {key: value for key, value in record.items() if key not in ('type', *exclude)}
+        unknown = set(fields) - self.allowed_fields[model]
+        if unknown:
+            self._reject(location, f'unknown field(s) {", ".join(sorted(unknown))}')
+            return None
+        key_field = KEY_FIELDS[record['type']]
+        if not fields.get(key_field):
+            self._reject(location, f'missing {key_field!r}')
+            return None
+        for name, value in fields.items():
+            try:
+                fields[name] = model._meta.get_field(name).to_python(value)
+            except ValidationError as exc:
+                self._reject(location, f'invalid {name!r}: {" ".join(exc.messages)}')
+                return None
+        return fields
+
+    def _write(self, model, record_type, objects, existing, sources):
+        """
+        Create the new ``objects`` (natural key -> instance) and update or
+        skip the ones in ``existing`` (natural key -> pk). ``sources`` maps
+        each natural key to its record: an update writes only the fields
+        that record carries, plus the ``DERIVED_FIELDS`` computed from them.
+        Return the created ones as natural key -> instance.
+        """
+        created, changed = {}, []
+        now = timezone.now()
+        for key, obj in objects.items():
+            pk = existing.get(key)
+            if pk is None:
+                created[key] = obj
+            elif self.update:
+                obj.pk = pk
+                obj.updated_at = now
+                changed.append((key, obj))
+        if changed:
+            # Natural keys matched, so they are left out of the UPDATE. Rows
+            # are grouped by the fields their record carries, so a field one
+            # record omits keeps its stored value instead of the model default.
+            unchanged = {'type', 'tags', 'topic', KEY_FIELDS[record_type]}
+            derived = DERIVED_FIELDS.get(model, {})
+            groups = {}
+            for key, obj in changed:
+                fields = {field for field in sources[key] if field not in unchanged}
+                fields.update(name for field in list(fields) for name in derived.get(field, ()))
+                groups.setdefault(frozenset(fields), []).append(obj)
+            for fields, group in groups.items():
+                model.objects.bulk_update(
+                    group, sorted({'updated_at', *fields}),
+                    batch_size=min(self.batch_size, UPDATE_BATCH_SIZE),
+                )
+        model.objects.bulk_create(created.values(), batch_size=self.batch_size)
+
+        stats = self.stats[record_type]
+        stats['created'] += len(created)
+        stats['updated'] += len(changed)
+        stats['skipped'] += len(objects) - len(created) - len(changed)
+        return created
+
+    def _remember_ids(self, model, key_field, created, ids):
+        ids.update((key, obj.pk) for key, obj in created.items() if obj.pk is not None)
+        missing = [key for key in created if key not in ids]
+        if missing:
+            # bulk_create only sets primary keys on PostgreSQL and SQLite >= 3.35
+            ids.update(model.objects.filter(**{f'{key_field}__in': missing}).values_list(key_field, 'id'))
+
+    def _write_tags(self, tags_by_topic):
+        if not tags_by_topic:
+            return
+        tag_ids = {
+            tag.name: tag.pk
+            for tag in Tag.objects.from_names({name for names in tags_by_topic.values() for name in names})
+        }
+        through = Topic.tags.through
+        through.objects.filter(topic_id__in=tags_by_topic).delete()
+        through.objects.bulk_create(
+            [
+                through(topic_id=topic_id, tag_id=tag_ids[Tag.normalize(name)])
+                for topic_id, names in tags_by_topic.items()
+                for name in {Tag.normalize(name) for name in names} - {''}
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+    def _reject(self, location, message):
+        self.errors += 1
+        self.warn(f'{location}: {message}' if location else message)
+
+    def _refresh_derived_state(self):
+        # bulk_create and bulk_update send no model signals, so do what the
+        # handlers in signals.py would have done, once.
+        def refresh():
+            for model in (Category, Topic, Tag, CodeExample, InterviewQuestion):
+                bump_generation(model)
+            reset_search_index()
+            mark_suggest_index_stale()
+
+        transaction.on_commit(refresh)
@@ -0,0 +1,72 @@
+# apps/topics/management/commands/benchmark_json.py
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import FastJSONRenderer, orjson
+from apps.topics.models import Topic
+from apps.topics.serializers import TopicSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare JSON rendering throughput on topic API payloads (DRF JSONRenderer '
+        'vs FastJSONRenderer) and on FastAPI user lists (JSONResponse vs ORJSONResponse). '
+        'Run load_sample_data or import_content first.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--topics', type=int, default=100, help='Topics per payload (default: 100)')
+        parser.add_argument('--users', type=int, default=1000, help='Users per FastAPI payload (default: 1000)')
+        parser.add_argument('--repeat', type=int, default=50, help='Renders per encoder (default: 50)')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stderr.write(self.style.WARNING('orjson is not installed; the fast paths fall back to json'))
+        repeat = options['repeat']
+
+        topics = list(
+            Topic.objects.select_related('category')
+            .prefetch_related('tags', 'code_examples', 'interview_questions')
+            .order_by('id')[:options['topics']]
+        )
+        if not topics:
+            raise CommandError('No topics to render; load some content first')
+        # Serialize once: only rendering is compared
+        payload = {'count': len(topics), 'next': None, 'previous': None,
+                   'results': TopicSerializer(topics, many=True).data}
+        self.compare(f'{len(topics)} nested topics', repeat, [
+            ('JSONRenderer', JSONRenderer().render, payload),
+            ('FastJSONRenderer', FastJSONRenderer().render, payload),
+        ])
+
+        from fastapi.responses import JSONResponse, ORJSONResponse
+        from apps.examples.fastapi_examples.main import UserResponse
+
+        now = datetime.now()
+        users = [
+            UserResponse(id=n, name=f'User {n}', email=f'user{n}@example.com', age=30, created_at=now)
+            .model_dump(mode='json')
+            for n in range(options['users'])
+        ]
+        responses = [('JSONResponse', lambda content: JSONResponse(content).body, users)]
+        if orjson is not None:
+            responses.append(('ORJSONResponse', lambda content: ORJSONResponse(content).body, users))
+        self.compare(f'{len(users)} FastAPI users', repeat, responses)
+
+    def compare(self, label, repeat, encoders):
+        self.stdout.write(label)
+        baseline = None
+        for name, render, payload in encoders:
+            size = len(render(payload))  # warm up
+            started = time.perf_counter()
+            for _ in range(repeat):
+                render(payload)
+            per_render = (time.perf_counter() - started) / repeat
+            baseline = baseline or per_render
+            self.stdout.write(
+                f'  {name:<18} {per_render * 1000:8.2f} ms/render  '
+                f'{size / per_render / 2**20:8.1f} MiB/s  x{baseline / per_render:.1f}'
+            )
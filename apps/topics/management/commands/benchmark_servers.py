@@ -0,0 +1,127 @@
+# apps/topics/management/commands/benchmark_servers.py
+import asyncio
+import random
+import socket
+import subprocess
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_PATHS = ['/api/stats/', '/api/search/?q=python', '/topics/api/async/topics/?fields=id,title']
+
+SERVERS = {
+    # Sync workers: one request per worker process at a time
+    'wsgi': ['gunicorn', 'config.wsgi:application', '--worker-class', 'sync'],
+    'asgi': ['uvicorn', 'config.asgi:application', '--log-level', 'warning'],
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Start the site under gunicorn (WSGI) and uvicorn (ASGI) with the same number of '
+        'workers and compare requests/s and latency percentiles under many concurrent slow '
+        'clients, each of which trickles its request headers. Needs content in the database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--servers', nargs='+', choices=sorted(SERVERS), default=['wsgi', 'asgi'])
+        parser.add_argument('--workers', type=int, default=2, help='Server worker processes (default: 2)')
+        parser.add_argument('--clients', type=int, default=200, help='Concurrent clients (default: 200)')
+        parser.add_argument('--requests', type=int, default=5, help='Requests per client (default: 5)')
+        parser.add_argument('--slow', type=float, default=0.1,
+                            help='Mean seconds each client spends sending its headers (default: 0.1)')
+        parser.add_argument('--path', action='append', dest='paths',
+                            help=f'Path to request, repeatable (default: {" ".join(DEFAULT_PATHS)})')
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or DEFAULT_PATHS
+        for name in options['servers']:
+            port = free_port()
+            command = SERVERS[name] + ['--workers', str(options['workers'])]
+            command += ['--bind', f'127.0.0.1:{port}'] if name == 'wsgi' else ['--port', str(port)]
+            try:
+                # The servers inherit DJANGO_SETTINGS_MODULE from this process
+                server = subprocess.Popen(
+                    command, cwd=settings.BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                )
+            except FileNotFoundError:
+                raise CommandError(f'{command[0]} is not installed')
+            try:
+                self.wait_for(port, server)
+                latencies, errors, elapsed = asyncio.run(self.load(
+                    port, paths, options['clients'], options['requests'], options['slow'],
+                ))
+            finally:
+                server.terminate()
+                server.wait()
+            self.report(name, latencies, errors, elapsed)
+
+    def wait_for(self, port, server, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f'{server.args[0]} exited with status {server.returncode}')
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise CommandError(f'{server.args[0]} did not start listening on port {port}')
+
+    async def load(self, port, paths, clients, requests, slow):
+        latencies, errors = [], 0
+
+        async def request(path):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            try:
+                writer.write(f'GET {path} HTTP/1.1\r\n'.encode())
+                await writer.drain()
+                # A slow client still sending headers; varying the delay keeps
+                # clients out of lockstep, as real ones are
+                await asyncio.sleep(random.uniform(0, 2 * slow))
+                writer.write(b'Host: localhost\r\nConnection: close\r\n\r\n')
+                await writer.drain()
+                response = await reader.read()
+            finally:
+                writer.close()
+            return response.split(b' ', 2)[1] if response else b''
+
+        async def client(number):
+            nonlocal errors
+            for index in range(requests):
+                started = time.perf_counter()
+                try:
+                    status = await request(paths[(number + index) % len(paths)])
+                except OSError:
+                    status = b''
+                if status == b'200':
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client(number) for number in range(clients)))
+        return sorted(latencies), errors, time.perf_counter() - started
+
+    def report(self, name, latencies, errors, elapsed):
+        if not latencies:
+            self.stdout.write(f'{name}: no successful requests, {errors} errors')
+            return
+        self.stdout.write(
+            f'{name}: {len(latencies) / elapsed:8.1f} req/s  '
+            f'p50 {percentile(latencies, 0.50) * 1000:7.1f} ms  '
+            f'p95 {percentile(latencies, 0.95) * 1000:7.1f} ms  '
+            f'p99 {percentile(latencies, 0.99) * 1000:7.1f} ms  '
+            f'max {latencies[-1] * 1000:7.1f} ms  {errors} errors'
+        )
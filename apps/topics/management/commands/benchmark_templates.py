@@ -0,0 +1,57 @@
+# apps/topics/management/commands/benchmark_templates.py
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import get_template
+
+from apps.topics.models import Topic
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure the per-card cost of rendering topic cards with a cold fragment cache '
+        '(every card rendered and stored) and a warm one (every card read back). '
+        'Run load_sample_data or import_content first.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--topics', type=int, default=100, help='Cards per render (default: 100)')
+        parser.add_argument('--repeat', type=int, default=20, help='Renders per pass (default: 20)')
+
+    def handle(self, *args, **options):
+        # The same rows TopicListView renders
+        topics = list(
+            Topic.objects.select_related('category').prefetch_related('tags').with_counts()
+            .order_by('id')[:options['topics']]
+        )
+        if not topics:
+            raise CommandError('No topics to render; load some content first')
+        template = get_template('components/topic_card.html')
+        repeat = options['repeat']
+
+        self.stdout.write(f'{len(topics)} topic cards')
+        for compact in (False, True):
+            def render_cards():
+                for topic in topics:
+                    template.render({'topic': topic, 'compact': compact})
+
+            cold = self.time(repeat, render_cards, before=cache.clear)
+            warm = self.time(repeat, render_cards)
+            label = 'compact' if compact else 'full'
+            for name, seconds in (('cold', cold), ('warm', warm)):
+                self.stdout.write(
+                    f'  {label:<8} {name}  {seconds / len(topics) * 1e6:8.1f} us/card  x{cold / seconds:.1f}'
+                )
+
+    def time(self, repeat, render, before=None):
+        """Mean seconds per call of ``render``, excluding ``before``"""
+        render()  # warm up the template and, for the warm pass, the cache
+        total = 0.0
+        for _ in range(repeat):
+            if before is not None:
+                before()
+            started = time.perf_counter()
+            render()
+            total += time.perf_counter() - started
+        return total / repeat
@@ -0,0 +1,46 @@
+# apps/topics/management/commands/build_assets.py
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.assets import BUNDLE_DIR, brotli, build_bundle, bundle_path, compress
+
+
+class Command(BaseCommand):
+    help = (
+        'Minify and concatenate ASSET_BUNDLES into static/bundles/, then run collectstatic. '
+        'With the production settings collectstatic gives every file a content-hashed name '
+        'and writes gzip and brotli variants next to it.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--no-collect', action='store_true', help='Only write the bundles')
+
+    def handle(self, *args, **options):
+        if brotli is None:
+            self.stderr.write(self.style.WARNING('Brotli is not installed; only gzip variants are written'))
+        output_dir = Path(settings.STATICFILES_DIRS[0]) / BUNDLE_DIR
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        for name, sources in settings.ASSET_BUNDLES.items():
+            try:
+                content = build_bundle(name, sources).encode()
+            except FileNotFoundError as exc:
+                raise CommandError(str(exc))
+            (output_dir / name).write_bytes(content)
+            self.report(name, sources, content)
+
+        if not options['no_collect']:
+            call_command('collectstatic', interactive=False, verbosity=0)
+            for name in settings.ASSET_BUNDLES:
+                self.stdout.write(f'{bundle_path(name)} -> {staticfiles_storage.url(bundle_path(name))}')
+
+    def report(self, name, sources, content):
+        original = sum(Path(finders.find(source)).stat().st_size for source in sources)
+        sizes = [f'{len(sources)} files {original:,} B', f'minified {len(content):,} B']
+        sizes += [f'{suffix[1:]} {len(data):,} B' for suffix, data in compress(content).items()]
+        self.stdout.write(f'{name}: ' + ', '.join(sizes))
@@ -0,0 +1,57 @@
+# apps/topics/management/commands/check_github_links.py
+import asyncio
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.fetch import FetchEngine
+from apps.topics.models import CodeExample
+
+
+class Command(BaseCommand):
+    help = 'Check that every code example\'s github_url answers, with bounded concurrency and retries'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=20, help='Requests in flight (default: 20)')
+        parser.add_argument('--per-host', type=int, default=4, help='Connections per host (default: 4)')
+        parser.add_argument('--timeout', type=float, default=10, help='Connect/read timeout in seconds (default: 10)')
+        parser.add_argument('--retries', type=int, default=2, help='Retries after errors, 429 and 5xx (default: 2)')
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['per_host'] < 1:
+            raise CommandError('--concurrency and --per-host must be positive')
+
+        # URL -> examples linking to it; each URL is fetched once
+        examples = defaultdict(list)
+        rows = CodeExample.objects.exclude(github_url='').values_list('github_url', 'id', 'title')
+        for url, pk, title in rows.iterator():
+            examples[url].append((pk, title))
+
+        engine = FetchEngine(
+            concurrency=options['concurrency'],
+            per_host=options['per_host'],
+            timeout=options['timeout'],
+            retries=options['retries'],
+            method='HEAD',
+            read_body=False,
+        )
+        started = time.perf_counter()
+        broken = asyncio.run(self.check(engine, examples))
+        self.stdout.write(
+            f'Checked {len(examples)} links in {time.perf_counter() - started:.2f}s, {len(broken)} broken'
+        )
+        if broken:
+            raise CommandError(f'{len(broken)} broken link(s)')
+
+    async def check(self, engine, examples):
+        broken = []
+        async for result in engine.fetch_all(list(examples)):
+            if not result.ok:
+                broken.append(result)
+                problem = result.error or f'HTTP {result.status}'
+                for pk, title in examples[result.url]:
+                    self.stdout.write(self.style.ERROR(
+                        f'Code example {pk} ({title}): {result.url} -> {problem}'
+                    ))
+        return broken
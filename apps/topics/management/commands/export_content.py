@@ -0,0 +1,31 @@
+# apps/topics/management/commands/export_content.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.topics.export import EXPORT_CHUNK_SIZE, iter_ndjson
+
+
+class Command(BaseCommand):
+    help = 'Stream every topic with its code examples and interview questions as NDJSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', '-o', help='File to write (default: stdout)')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE,
+                            help=f'Topics fetched per query batch (default: {EXPORT_CHUNK_SIZE})')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as stream:
+                count = self.export(stream.write, options['chunk_size'])
+        else:
+            count = self.export(self.stdout.write, options['chunk_size'])
+        self.stderr.write(f'Exported {count} topics in {time.perf_counter() - started:.2f}s')
+
+    def export(self, write, chunk_size):
+        count = 0
+        for line in iter_ndjson(chunk_size=chunk_size):
+            write(line)
+            count += 1
+        return count
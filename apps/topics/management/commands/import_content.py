@@ -0,0 +1,52 @@
+# apps/topics/management/commands/import_content.py
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.topics.importer import ContentError, ContentImporter, FLUSH_ORDER, read_records
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk-import categories, topics, code examples and interview questions '
+        'from JSON Lines (.jsonl) or YAML (.yaml) files. Each record has a "type" '
+        '(category, topic, code_example, interview_question) and the model fields; '
+        'topics name their "category", examples and questions their "topic" title.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='Content files to import, in order')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Records per type written in one transaction (default: 1000)')
+        parser.add_argument('--update', action='store_true',
+                            help='Overwrite existing rows instead of skipping them')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+        importer = ContentImporter(
+            batch_size=options['batch_size'],
+            update=options['update'],
+            warn=lambda message: self.stderr.write(self.style.WARNING(message)),
+        )
+        try:
+            for path in options['paths']:
+                for location, record in read_records(path):
+                    importer.add(record, location)
+            stats = importer.finish()
+        except (ContentError, OSError) as exc:
+            raise CommandError(exc)
+
+        total = 0
+        for record_type in FLUSH_ORDER:
+            counts = stats[record_type]
+            total += sum(counts.values())
+            if counts:
+                self.stdout.write(
+                    f'{record_type}: {counts["created"]} created, '
+                    f'{counts["updated"]} updated, {counts["skipped"]} skipped'
+                )
+        elapsed = importer.elapsed
+        rate = total / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {total} records in {elapsed:.2f}s ({rate:,.0f} records/s), '
+            f'{importer.errors} rejected'
+        ))
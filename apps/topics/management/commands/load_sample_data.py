@@ -1,7 +1,6 @@
 # apps/topics/management/commands/load_sample_data.py
-import os
 from django.core.management.base import BaseCommand
-from apps.topics.models import Category, Topic, CodeExample, InterviewQuestion
+from apps.topics.importer import ContentImporter, FLUSH_ORDER
 
 class Command(BaseCommand):
     help = 'Load sample data for interview preparation'
@@ -48,18 +47,10 @@ class Command(BaseCommand):
             }
         ]
 
-        for cat_data in categories_data:
-            category, created = Category.objects.get_or_create(
-                name=cat_data['name'],
-                defaults=cat_data
-            )
-            if created:
-                self.stdout.write(f'Created category: {category.name}')
-
-        # Create Topics
-        python_fundamentals = Category.objects.get(name='Python Fundamentals')
-        django_category = Category.objects.get(name='Django Framework')
-        fastapi_category = Category.objects.get(name='FastAPI')
+        # Create Topics (parents are referenced by name, see apps/topics/importer.py)
+        python_fundamentals = 'Python Fundamentals'
+        django_category = 'Django Framework'
+        fastapi_category = 'FastAPI'
 
         topics_data = [
             {
@@ -104,16 +95,8 @@ class Command(BaseCommand):
             },
         ]
 
-        for topic_data in topics_data:
-            topic, created = Topic.objects.get_or_create(
-                title=topic_data['title'],
-                defaults=topic_data
-            )
-            if created:
-                self.stdout.write(f'Created topic: {topic.title}')
-
         # Create Code Examples
-        python_ds_topic = Topic.objects.get(title='Python Data Structures & Algorithms')
+        python_ds_topic = 'Python Data Structures & Algorithms'
         
         code_examples = [
             {
@@ -194,14 +177,6 @@ def two_sum(nums, target):
             }
         ]
 
-        for example_data in code_examples:
-            example, created = CodeExample.objects.get_or_create(
-                title=example_data['title'],
-                topic=example_data['topic'],
-                defaults=example_data
-            )
-            if created:
-                self.stdout.write(f'Created code example: {example.title}')
 
         # Create Interview Questions
         interview_questions = [
@@ -272,14 +247,18 @@ The Counter approach is most readable and handles edge cases well.''',
             }
         ]
 
-        for question_data in interview_questions:
-            question, created = InterviewQuestion.objects.get_or_create(
-                question=question_data['question'],
-                topic=question_data['topic'],
-                defaults=question_data
-            )
-            if created:
-                self.stdout.write(f'Created interview question: {question.question[:50]}...')
+        importer = ContentImporter(warn=lambda message: self.stderr.write(self.style.WARNING(message)))
+        for record_type, records in [
+            ('category', categories_data),
+            ('topic', topics_data),
+            ('code_example', code_examples),
+            ('interview_question', interview_questions),
+        ]:
+            for record in records:
+                importer.add({'type': record_type, **record})
+        stats = importer.finish()
+        for record_type in FLUSH_ORDER:
+            self.stdout.write(f'Created {stats[record_type]["created"]} {record_type.replace("_", " ")}(s)')
 
         self.stdout.write(
             self.style.SUCCESS('Successfully loaded sample data!')
@@ -0,0 +1,72 @@
+# Generated by Django 4.2.7 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+def copy_tags_forward(apps, schema_editor):
+    Tag = apps.get_model('topics', 'Tag')
+    Topic = apps.get_model('topics', 'Topic')
+    TopicTag = Topic.tags.through
+    db_alias = schema_editor.connection.alias
+
+    topic_names = {}
+    for topic_id, legacy_tags in Topic.objects.using(db_alias).exclude(legacy_tags='').values_list('id', 'legacy_tags'):
+        names = {name.strip().lower()[:50] for name in legacy_tags.split(',')} - {''}
+        if names:
+            topic_names[topic_id] = names
+
+    all_names = set().union(*topic_names.values())
+    Tag.objects.using(db_alias).bulk_create([Tag(name=name) for name in sorted(all_names)], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.using(db_alias).values_list('name', 'id'))
+
+    TopicTag.objects.using(db_alias).bulk_create(
+        [
+            TopicTag(topic_id=topic_id, tag_id=tag_ids[name])
+            for topic_id, names in topic_names.items()
+            for name in names
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+def copy_tags_backward(apps, schema_editor):
+    Topic = apps.get_model('topics', 'Topic')
+    for topic in Topic.objects.using(schema_editor.connection.alias).prefetch_related('tags'):
+        topic.legacy_tags = ', '.join(tag.name for tag in topic.tags.all())[:200]
+        topic.save(update_fields=['legacy_tags'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RenameField(
+            model_name='topic',
+            old_name='tags',
+            new_name='legacy_tags',
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='topics', to='topics.tag'),
+        ),
+        migrations.RunPython(copy_tags_forward, copy_tags_backward),
+        migrations.RemoveField(
+            model_name='topic',
+            name='legacy_tags',
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-18 04:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0004_keyset_indexes'),
+    ]
+
+    # Create the composite indexes before dropping the single-column FK
+    # indexes they make redundant.
+    operations = [
+        migrations.AddIndex(
+            model_name='codeexample',
+            index=models.Index(fields=['topic', 'order', 'title'], name='codeexample_topic_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewquestion',
+            index=models.Index(fields=['topic', 'order', 'id'], name='question_topic_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topic',
+            index=models.Index(fields=['difficulty', 'category', 'order', 'title', 'id'], name='topic_difficulty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topic',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['category', 'order', 'title', 'id'], name='topic_featured_idx'),
+        ),
+        migrations.AlterField(
+            model_name='codeexample',
+            name='topic',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='code_examples', to='topics.topic'),
+        ),
+        migrations.AlterField(
+            model_name='interviewquestion',
+            name='topic',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='interview_questions', to='topics.topic'),
+        ),
+        migrations.AlterField(
+            model_name='topic',
+            name='category',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='topics', to='topics.category'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-18 05:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0005_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='codeexample',
+            name='highlight_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='codeexample',
+            name='highlighted_code',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+    ]
@@ -1,6 +1,11 @@
 # apps/topics/models.py
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.urls import reverse
+from django.utils.safestring import mark_safe
+
+from .highlighting import highlight_key, render_code
 
 class Category(models.Model):
     name = models.CharField(max_length=100)
@@ -9,14 +14,92 @@ class Category(models.Model):
     color = models.CharField(max_length=7, default='#3B82F6')  # Hex color
     order = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Categories"
         ordering = ['order', 'name']
+        indexes = [
+            models.Index(fields=['order', 'name', 'id'], name='category_keyset_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+class TagManager(models.Manager):
+    def from_names(self, names):
+        """Return Tag rows for ``names``, creating any that do not exist yet"""
+        names = {Tag.normalize(name) for name in names} - {''}
+        existing = set(self.filter(name__in=names).values_list('name', flat=True))
+        missing = names - existing
+        if missing:
+            # ignore_conflicts covers a concurrent insert of the same name
+            self.bulk_create([Tag(name=name) for name in missing], ignore_conflicts=True)
+        return list(self.filter(name__in=names))
+
+class Tag(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+
+    objects = TagManager()
+
+    class Meta:
+        ordering = ['name']
 
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def normalize(name):
+        return name.strip().lower()[:50]
+
+def _child_count(model):
+    # Correlated COUNT subquery; unlike Count() over two joins it does not
+    # multiply rows when several child tables are counted at once.
+    counts = (
+        model.objects.filter(topic=OuterRef('pk'))
+        .order_by()
+        .values('topic')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts), Value(0))
+
+class TopicQuerySet(models.QuerySet):
+    def with_details(self):
+        """Prefetch every relation TopicSerializer renders"""
+        return self.prefetch_related('tags', 'code_examples', 'interview_questions')
+
+    def for_fields(self, names):
+        """
+        Load only what rendering the serializer fields ``names`` needs.
+
+        Unrequested columns are deferred, and relations and counts are only
+        prefetched or annotated when asked for.
+        """
+        names = set(names)
+        columns = [
+            field.name for field in self.model._meta.concrete_fields
+            if field.name in names or field.attname in names
+        ]
+        queryset = self.only('id', *columns)
+        if names & {'tags', 'tags_list'}:
+            queryset = queryset.prefetch_related('tags')
+        for relation in ('code_examples', 'interview_questions'):
+            if relation in names:
+                queryset = queryset.prefetch_related(relation)
+        if 'example_count' in names:
+            queryset = queryset.annotate(example_count=_child_count(CodeExample))
+        if 'question_count' in names:
+            queryset = queryset.annotate(question_count=_child_count(InterviewQuestion))
+        return queryset
+
+    def with_counts(self):
+        """Annotate ``example_count`` and ``question_count``"""
+        return self.annotate(
+            example_count=_child_count(CodeExample),
+            question_count=_child_count(InterviewQuestion),
+        )
+
 class Topic(models.Model):
     DIFFICULTY_CHOICES = [
         ('beginner', 'Beginner'),
@@ -26,17 +109,32 @@ class Topic(models.Model):
 
     title = models.CharField(max_length=200)
     description = models.TextField()
-    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='topics')
+    # Indexed by topic_keyset_idx, which leads with category_id
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='topics', db_index=False)
     difficulty = models.CharField(max_length=20, choices=DIFFICULTY_CHOICES, default='intermediate')
     estimated_time = models.CharField(max_length=50, help_text="e.g., '15 minutes', '1 hour'")
-    tags = models.CharField(max_length=200, blank=True, help_text="Comma-separated tags")
+    tags = models.ManyToManyField(Tag, related_name='topics', blank=True)
     is_featured = models.BooleanField(default=False)
     order = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TopicQuerySet.as_manager()
+
     class Meta:
         ordering = ['category__order', 'order', 'title']
+        indexes = [
+            # Keyset pagination key of the topic listings
+            models.Index(fields=['category', 'order', 'title', 'id'], name='topic_keyset_idx'),
+            # ?difficulty= and by_difficulty, in listing order
+            models.Index(fields=['difficulty', 'category', 'order', 'title', 'id'], name='topic_difficulty_idx'),
+            # Featured topics are a handful of rows; keep their index small
+            models.Index(
+                fields=['category', 'order', 'title', 'id'],
+                condition=models.Q(is_featured=True),
+                name='topic_featured_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -45,9 +143,12 @@ class Topic(models.Model):
         return reverse('topic_detail', kwargs={'pk': self.pk})
 
     def get_tags_list(self):
-        if self.tags:
-            return [tag.strip() for tag in self.tags.split(',')]
-        return []
+        # Served from the prefetch cache when the queryset used prefetch_related('tags')
+        return [tag.name for tag in self.tags.all()]
+
+    def set_tags(self, names):
+        """Replace this topic's tags with the given tag names"""
+        self.tags.set(Tag.objects.from_names(names))
 
 class CodeExample(models.Model):
     LANGUAGE_CHOICES = [
@@ -57,7 +158,7 @@ class CodeExample(models.Model):
         ('bash', 'Bash'),
     ]
 
-    topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='code_examples')
+    topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='code_examples', db_index=False)
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     language = models.CharField(max_length=20, choices=LANGUAGE_CHOICES, default='python')
@@ -65,25 +166,57 @@ class CodeExample(models.Model):
     explanation = models.TextField(blank=True)
     github_url = models.URLField(blank=True, help_text="Link to full code on GitHub")
     order = models.PositiveIntegerField(default=0)
+    # Rendered on save; see highlighting.py and the highlight_code command
+    highlighted_code = models.TextField(blank=True, default='', editable=False)
+    highlight_key = models.CharField(max_length=64, blank=True, default='', editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['order', 'title']
+        indexes = [
+            # Per-topic prefetch in display order
+            models.Index(fields=['topic', 'order', 'title'], name='codeexample_topic_order_idx'),
+        ]
 
     def __str__(self):
         return f"{self.topic.title} - {self.title}"
 
+    def save(self, *args, **kwargs):
+        if self.refresh_highlight() and kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'highlighted_code', 'highlight_key'}
+        super().save(*args, **kwargs)
+
+    def refresh_highlight(self):
+        """Re-render ``highlighted_code`` if the code or language changed; return whether it did"""
+        key = highlight_key(self.code, self.language)
+        if key == self.highlight_key:
+            return False
+        self.highlighted_code = render_code(self.code, self.language)
+        self.highlight_key = key
+        return True
+
+    def get_highlighted_code(self):
+        """Highlighted HTML, rendered on the fly for rows the backfill has not reached"""
+        if self.highlight_key != highlight_key(self.code, self.language):
+            return mark_safe(render_code(self.code, self.language))
+        return mark_safe(self.highlighted_code)
+
 class InterviewQuestion(models.Model):
-    topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='interview_questions')
+    topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='interview_questions', db_index=False)
     question = models.TextField()
     sample_answer = models.TextField()
     tips = models.TextField(blank=True)
     difficulty = models.CharField(max_length=20, choices=Topic.DIFFICULTY_CHOICES, default='intermediate')
     order = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['order', 'id']
+        indexes = [
+            models.Index(fields=['topic', 'order', 'id'], name='question_topic_order_idx'),
+        ]
 
     def __str__(self):
         return f"{self.topic.title} - {self.question[:50]}..."
@@ -0,0 +1,254 @@
+# apps/topics/search.py
+"""
+In-process inverted index with BM25 ranking over topics, code examples
+and interview questions.
+
+The index is built lazily on first use and then kept up to date from the
+model signals in ``apps.topics.signals``.
+"""
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.urls import reverse
+
+TOKEN_RE = re.compile(r'[a-z0-9_]+')
+
+STOP_WORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how',
+    'in', 'is', 'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was',
+    'what', 'when', 'with', 'you', 'your',
+])
+
+
+def stem(token):
+    """Fold simple English plurals so 'generators' matches 'generator'"""
+    if len(token) <= 3:
+        return token
+    if token.endswith('ies'):
+        return token[:-3] + 'y'
+    if token.endswith('sses'):
+        return token[:-2]
+    if token.endswith('s') and token[-2] not in 'siu':
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Lowercase ``text`` and split it into stemmed index terms"""
+    if not text:
+        return []
+    return [
+        stem(token) for token in TOKEN_RE.findall(text.lower())
+        if token not in STOP_WORDS
+    ]
+
+
+class InvertedIndex:
+    """Thread-safe inverted index scored with Okapi BM25"""
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings = {}   # term -> {doc_key: weighted term frequency}
+        self._doc_terms = {}  # doc_key -> Counter of the document's terms
+        self._doc_lengths = {}
+        self._documents = {}  # doc_key -> stored result payload
+        self._total_length = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def __contains__(self, doc_key):
+        return doc_key in self._documents
+
+    def add(self, doc_key, fields, payload):
+        """
+        Index a document, replacing any previous version.
+
+        ``fields`` is an iterable of ``(text, weight)`` pairs; ``payload`` is
+        the dict returned for the document in search results.
+        """
+        terms = Counter()
+        for text, weight in fields:
+            for token in tokenize(text):
+                terms[token] += weight
+
+        with self._lock:
+            self._remove(doc_key)
+            for term, freq in terms.items():
+                self._postings.setdefault(term, {})[doc_key] = freq
+            length = sum(terms.values())
+            self._doc_terms[doc_key] = terms
+            self._doc_lengths[doc_key] = length
+            self._documents[doc_key] = payload
+            self._total_length += length
+
+    def remove(self, doc_key):
+        with self._lock:
+            self._remove(doc_key)
+
+    def _remove(self, doc_key):
+        terms = self._doc_terms.pop(doc_key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_key]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(doc_key)
+        del self._documents[doc_key]
+
+    def search(self, query, limit=10):
+        """Return up to ``limit`` payloads ranked by BM25 score"""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        with self._lock:
+            doc_count = len(self._documents)
+            if not doc_count:
+                return []
+            avg_length = self._total_length / doc_count
+            scores = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                for doc_key, tf in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_key] / avg_length)
+                    scores[doc_key] = scores.get(doc_key, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [
+                dict(self._documents[doc_key], score=round(score, 4))
+                for doc_key, score in top
+            ]
+
+
+# Document builders ---------------------------------------------------------
+
+def _excerpt(text, length=160):
+    text = ' '.join(text.split())
+    return text if len(text) <= length else text[:length].rsplit(' ', 1)[0] + '...'
+
+
+def topic_document(topic):
+    fields = [
+        (topic.title, 3),
+        (' '.join(topic.get_tags_list()), 2),
+        (topic.description, 1),
+    ]
+    payload = {
+        'type': 'topic',
+        'id': topic.pk,
+        'title': topic.title,
+        'description': _excerpt(topic.description),
+        'url': reverse('topic_detail', kwargs={'pk': topic.pk}),
+    }
+    return ('topic', topic.pk), fields, payload
+
+
+def code_example_document(example):
+    fields = [
+        (example.title, 3),
+        (example.description, 1),
+        (example.code, 1),
+        (example.explanation, 1),
+    ]
+    payload = {
+        'type': 'code_example',
+        'id': example.pk,
+        'title': example.title,
+        'description': _excerpt(example.description or example.explanation),
+        'url': reverse('topic_detail', kwargs={'pk': example.topic_id}),
+    }
+    return ('codeexample', example.pk), fields, payload
+
+
+def interview_question_document(question):
+    fields = [
+        (question.question, 2),
+        (question.sample_answer, 1),
+    ]
+    payload = {
+        'type': 'interview_question',
+        'id': question.pk,
+        'title': _excerpt(question.question, 100),
+        'description': _excerpt(question.sample_answer),
+        'url': reverse('topic_detail', kwargs={'pk': question.topic_id}),
+    }
+    return ('interviewquestion', question.pk), fields, payload
+
+
+DOCUMENT_BUILDERS = {
+    'topic': topic_document,
+    'codeexample': code_example_document,
+    'interviewquestion': interview_question_document,
+}
+
+
+def build_index():
+    """Build a fresh index from the database"""
+    from .models import Topic, CodeExample, InterviewQuestion
+
+    index = InvertedIndex()
+    querysets = [
+        (topic_document, Topic.objects.only('id', 'title', 'description').prefetch_related('tags')),
+        (code_example_document, CodeExample.objects.only(
+            'id', 'topic_id', 'title', 'description', 'code', 'explanation')),
+        (interview_question_document, InterviewQuestion.objects.only(
+            'id', 'topic_id', 'question', 'sample_answer')),
+    ]
+    for builder, queryset in querysets:
+        for obj in queryset.order_by().iterator(chunk_size=2000):
+            index.add(*builder(obj))
+    return index
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index():
+    """Return the process-wide index, building it on first use"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = build_index()
+    return _index
+
+
+async def aget_search_index():
+    """``get_search_index`` for async views; only a first build leaves the event loop"""
+    if _index is not None:
+        return _index
+    return await sync_to_async(get_search_index)()
+
+
+def reset_search_index():
+    """Drop the process-wide index so the next search rebuilds it"""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def index_instance(instance):
+    """Add or refresh a model instance in the index if it has been built"""
+    builder = DOCUMENT_BUILDERS.get(instance._meta.model_name)
+    if builder is not None and _index is not None:
+        _index.add(*builder(instance))
+
+
+def unindex_instance(model_name, pk):
+    """Remove a deleted instance from the index if it has been built"""
+    if _index is not None:
+        _index.remove((model_name, pk))
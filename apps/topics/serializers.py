@@ -2,19 +2,61 @@
 from rest_framework import serializers
 from .models import Category, Topic, CodeExample, InterviewQuestion
 
+def parse_fieldset(value):
+    """Parse a comma-separated ``?fields=`` or ``?expand=`` value into a set of names"""
+    return {name.strip() for name in (value or '').split(',')} - {''}
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin for sparse fieldsets.
+
+    ``expandable_fields`` are only rendered when named in ``expand`` (or in
+    ``fields``); a non-empty ``fields`` then keeps just the fields listed.
+    """
+    expandable_fields = ()
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.selected_fields(fields, expand)
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
+
+    @classmethod
+    def selected_fields(cls, fields=None, expand=None):
+        """Return the field names rendered for the given ``fields`` and ``expand``"""
+        expand = set(expand or ()) | (set(fields or ()) & set(cls.expandable_fields))
+        names = [
+            name for name in cls.Meta.fields
+            if name not in cls.expandable_fields or name in expand
+        ]
+        if fields:
+            names = [name for name in names if name in fields]
+        return names
+
 class CodeExampleSerializer(serializers.ModelSerializer):
     class Meta:
         model = CodeExample
         fields = ['id', 'title', 'description', 'language', 'code', 'explanation', 'github_url']
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # ?code_format=html adds the server-side highlighted markup. (DRF
+        # reserves ?format= for choosing the renderer.)
+        request = self.context.get('request')
+        if request is not None and request.query_params.get('code_format') == 'html':
+            data['code_html'] = instance.get_highlighted_code()
+        return data
+
 class InterviewQuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = InterviewQuestion
         fields = ['id', 'question', 'sample_answer', 'tips', 'difficulty']
 
-class TopicSerializer(serializers.ModelSerializer):
+class TopicSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     code_examples = CodeExampleSerializer(many=True, read_only=True)
     interview_questions = InterviewQuestionSerializer(many=True, read_only=True)
+    tags = serializers.SerializerMethodField()
     tags_list = serializers.SerializerMethodField()
 
     class Meta:
@@ -24,9 +66,26 @@ class TopicSerializer(serializers.ModelSerializer):
             'tags', 'tags_list', 'is_featured', 'code_examples', 'interview_questions'
         ]
 
+    def get_tags(self, obj):
+        return ', '.join(obj.get_tags_list())
+
     def get_tags_list(self, obj):
         return obj.get_tags_list()
 
+class TopicListSerializer(TopicSerializer):
+    """Slim list representation; child rows are counted unless expanded"""
+    example_count = serializers.IntegerField(read_only=True)
+    question_count = serializers.IntegerField(read_only=True)
+
+    expandable_fields = ('code_examples', 'interview_questions')
+
+    class Meta(TopicSerializer.Meta):
+        fields = [
+            'id', 'title', 'description', 'difficulty', 'estimated_time',
+            'tags', 'tags_list', 'is_featured', 'example_count', 'question_count',
+            'code_examples', 'interview_questions'
+        ]
+
 class CategorySerializer(serializers.ModelSerializer):
     topics = TopicSerializer(many=True, read_only=True)
     topic_count = serializers.SerializerMethodField()
@@ -36,4 +95,8 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'icon', 'color', 'topics', 'topic_count']
 
     def get_topic_count(self, obj):
-        return obj.topics.count()
+        # Annotated by CategoryViewSet.queryset
+        topic_count = getattr(obj, 'topic_count', None)
+        if topic_count is None:
+            return obj.topics.count()
+        return topic_count
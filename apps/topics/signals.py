@@ -0,0 +1,111 @@
+# apps/topics/signals.py
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .generations import bump_generation
+from .models import Category, Tag, Topic, CodeExample, InterviewQuestion
+from .search import index_instance, unindex_instance
+from .suggest import mark_suggest_index_stale
+
+
+@receiver(post_save, sender=Topic)
+@receiver(post_save, sender=CodeExample)
+@receiver(post_save, sender=InterviewQuestion)
+def update_search_index(sender, instance, **kwargs):
+    transaction.on_commit(lambda: index_instance(instance))
+
+
+@receiver(post_delete, sender=Topic)
+@receiver(post_delete, sender=CodeExample)
+@receiver(post_delete, sender=InterviewQuestion)
+def remove_from_search_index(sender, instance, **kwargs):
+    # The primary key is cleared once the delete finishes, so capture it now.
+    model_name, pk = instance._meta.model_name, instance.pk
+    transaction.on_commit(lambda: unindex_instance(model_name, pk))
+
+
+@receiver(m2m_changed, sender=Topic.tags.through)
+def reindex_retagged_topics(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        topics = [instance]
+    elif pk_set:
+        topics = list(Topic.objects.filter(pk__in=pk_set))
+    else:
+        return
+
+    def reindex():
+        for topic in topics:
+            index_instance(topic)
+
+    transaction.on_commit(reindex)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Topic)
+@receiver(post_save, sender=CodeExample)
+@receiver(post_save, sender=InterviewQuestion)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Topic)
+@receiver(post_delete, sender=CodeExample)
+@receiver(post_delete, sender=InterviewQuestion)
+@receiver(post_delete, sender=Tag)
+@receiver(m2m_changed, sender=Topic.tags.through)
+def invalidate_suggest_index(sender, **kwargs):
+    transaction.on_commit(mark_suggest_index_stale)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Topic)
+@receiver(post_save, sender=CodeExample)
+@receiver(post_save, sender=InterviewQuestion)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Topic)
+@receiver(post_delete, sender=CodeExample)
+@receiver(post_delete, sender=InterviewQuestion)
+@receiver(post_delete, sender=Tag)
+def bump_model_generation(sender, **kwargs):
+    transaction.on_commit(lambda: bump_generation(sender))
+
+
+@receiver(m2m_changed, sender=Topic.tags.through)
+def bump_topic_generation(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        transaction.on_commit(lambda: bump_generation(Topic))
+
+
+@receiver(post_save, sender=CodeExample)
+@receiver(post_save, sender=InterviewQuestion)
+@receiver(post_delete, sender=CodeExample)
+@receiver(post_delete, sender=InterviewQuestion)
+def touch_parent_topic(sender, instance, **kwargs):
+    # Moves the parent's Last-Modified/ETag validators (see conditional.py)
+    Topic.objects.filter(pk=instance.topic_id).update(updated_at=timezone.now())
+
+
+@receiver(m2m_changed, sender=Topic.tags.through)
+def touch_retagged_topics(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        Topic.objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+    elif pk_set:
+        Topic.objects.filter(pk__in=pk_set).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Tag)
+def touch_renamed_tag_topics(sender, instance, created, **kwargs):
+    # Topic cards and validators show tag names; a new tag has no topics yet
+    if not created:
+        Topic.objects.filter(tags=instance).update(updated_at=timezone.now())
+
+
+@receiver(pre_delete, sender=Tag)
+def touch_deleted_tag_topics(sender, instance, **kwargs):
+    # The through rows go without an m2m_changed signal, so touch the topics while they still link
+    Topic.objects.filter(tags=instance).update(updated_at=timezone.now())
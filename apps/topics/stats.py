@@ -0,0 +1,110 @@
+# apps/topics/stats.py
+"""
+Dashboard statistics computed in one aggregate query and memoized in
+memory until a write to the topics models bumps their generations.
+"""
+import threading
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .generations import get_generations
+from .models import Category, Topic, CodeExample
+
+DIFFICULTIES = [value for value, _ in Topic.DIFFICULTY_CHOICES]
+LANGUAGES = [value for value, _ in CodeExample.LANGUAGE_CHOICES]
+
+
+def _language_count(language):
+    counts = (
+        CodeExample.objects.filter(topic__category=OuterRef('pk'), language=language)
+        .order_by()
+        .values('topic__category')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts), Value(0))
+
+
+def build_stats():
+    """
+    Compute the statistics with a single SQL statement.
+
+    Counts are grouped per category with conditional aggregation for each
+    difficulty and a correlated subquery for each language; the site-wide
+    totals are sums of the per-category rows.
+    """
+    return _summarize_stats(_stats_queryset())
+
+
+def _stats_queryset():
+    annotations = {'topic_count': Count('topics')}
+    for difficulty in DIFFICULTIES:
+        annotations[f'difficulty_{difficulty}'] = Count('topics', filter=Q(topics__difficulty=difficulty))
+    for language in LANGUAGES:
+        annotations[f'language_{language}'] = _language_count(language)
+    return Category.objects.annotate(**annotations).order_by('order', 'name').values(
+        'id', 'name', *annotations
+    )
+
+
+def _summarize_stats(rows):
+    """Build the statistics from the per-category rows"""
+    difficulty_totals = dict.fromkeys(DIFFICULTIES, 0)
+    language_totals = dict.fromkeys(LANGUAGES, 0)
+    categories = []
+    for row in rows:
+        difficulty_breakdown = {d: row[f'difficulty_{d}'] for d in DIFFICULTIES}
+        language_breakdown = {lang: row[f'language_{lang}'] for lang in LANGUAGES}
+        for difficulty, count in difficulty_breakdown.items():
+            difficulty_totals[difficulty] += count
+        for language, count in language_breakdown.items():
+            language_totals[language] += count
+        categories.append({
+            'id': row['id'],
+            'name': row['name'],
+            'topic_count': row['topic_count'],
+            'difficulty_breakdown': difficulty_breakdown,
+            'language_breakdown': language_breakdown,
+        })
+
+    return {
+        'total_topics': sum(category['topic_count'] for category in categories),
+        'total_categories': len(categories),
+        'total_code_examples': sum(language_totals.values()),
+        'difficulty_breakdown': difficulty_totals,
+        'language_breakdown': language_totals,
+        'categories': categories,
+    }
+
+
+_snapshot = None  # (generations, stats)
+_snapshot_lock = threading.Lock()
+
+
+def get_stats():
+    """Return the memoized statistics, rebuilding them after any write"""
+    global _snapshot
+    generations = get_generations(Category, Topic, CodeExample)
+    snapshot = _snapshot
+    if snapshot is not None and snapshot[0] == generations:
+        return snapshot[1]
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot[0] != generations:
+            _snapshot = (generations, build_stats())
+        return _snapshot[1]
+
+
+async def aget_stats():
+    """``get_stats`` for async views: the aggregate runs through the async ORM"""
+    global _snapshot
+    generations = await sync_to_async(get_generations)(Category, Topic, CodeExample)
+    snapshot = _snapshot
+    if snapshot is not None and snapshot[0] == generations:
+        return snapshot[1]
+    # No lock: a threading.Lock would block the event loop, and two
+    # concurrent rebuilds only cost a duplicate query.
+    stats = _summarize_stats([row async for row in _stats_queryset()])
+    _snapshot = (generations, stats)
+    return stats
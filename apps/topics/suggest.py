@@ -0,0 +1,167 @@
+# apps/topics/suggest.py
+"""
+Typeahead suggestions over topic titles, tags and category names.
+
+Every word suffix of a suggestion ("python generators", "generators") is
+stored in one sorted array so a prefix lookup is two ``bisect`` calls. The
+index is immutable once built; writes to the topics models only mark it
+stale and the next lookup rebuilds it.
+"""
+import heapq
+import re
+import threading
+from array import array
+from urllib.parse import urlencode
+from bisect import bisect_left
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count
+from django.urls import reverse
+
+WORD_RE = re.compile(r'[a-z0-9]+')
+RESULT_CACHE_SIZE = 2048
+MAX_LIMIT = 20
+# Prefixes this short match a large slice of the array, so their answers are
+# computed once at build time instead of on the first request.
+PRECOMPUTED_PREFIX_LEN = 2
+
+
+def normalize(text):
+    return ' '.join(WORD_RE.findall(text.lower()))
+
+
+class PrefixIndex:
+    """Sorted-array prefix index answering top-k-by-popularity lookups"""
+
+    def __init__(self, entries):
+        """``entries`` is a list of ``(popularity, payload)`` pairs"""
+        keys = []
+        for entry_id, (popularity, payload) in enumerate(entries):
+            words = normalize(payload['text']).split()
+            for start in range(len(words)):
+                keys.append((' '.join(words[start:]), entry_id))
+        keys.sort()
+
+        self._keys = [key for key, _ in keys]
+        self._entry_ids = array('l', [entry_id for _, entry_id in keys])
+        self._popularity = array('l', [popularity for popularity, _ in entries])
+        self._payloads = [payload for _, payload in entries]
+        self._cache = {}
+        self._precomputed = {
+            prefix: self._top_ids(prefix, MAX_LIMIT)
+            for prefix in {key[:length] for key in self._keys
+                           for length in range(1, PRECOMPUTED_PREFIX_LEN + 1)}
+        }
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def suggest(self, prefix, limit=10):
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        limit = min(limit, MAX_LIMIT)
+        precomputed = self._precomputed.get(prefix)
+        if precomputed is not None:
+            return [self._payloads[i] for i in precomputed[:limit]]
+
+        cache_key = (prefix, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        results = [self._payloads[i] for i in self._top_ids(prefix, limit)]
+
+        if len(self._cache) >= RESULT_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[cache_key] = results
+        return results
+
+    def _top_ids(self, prefix, limit):
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + '\uffff', lo)
+        matches = set(self._entry_ids[lo:hi])
+        return heapq.nlargest(limit, matches, key=lambda i: (self._popularity[i], -i))
+
+
+def build_suggest_index():
+    """Build a fresh index from the database in three queries"""
+    from .models import Category, Tag, Topic
+
+    topic_list_url = reverse('topic_list')
+    entries = []
+
+    topics = (
+        Topic.objects.order_by()
+        .with_counts()
+        .values_list('id', 'title', 'is_featured', 'example_count', 'question_count')
+    )
+    for pk, title, is_featured, example_count, question_count in topics:
+        popularity = example_count + question_count + (10 if is_featured else 0)
+        entries.append((popularity, {
+            'text': title,
+            'type': 'topic',
+            'url': reverse('topic_detail', kwargs={'pk': pk}),
+        }))
+
+    tags = (
+        Tag.objects.order_by()
+        .annotate(topic_count=Count('topics'))
+        .filter(topic_count__gt=0)
+        .values_list('name', 'topic_count')
+    )
+    for name, topic_count in tags:
+        entries.append((topic_count, {
+            'text': name,
+            'type': 'tag',
+            'url': f'{topic_list_url}?{urlencode({"tag": name})}',
+        }))
+
+    categories = (
+        Category.objects.order_by()
+        .annotate(topic_count=Count('topics'))
+        .values_list('id', 'name', 'topic_count')
+    )
+    for pk, name, topic_count in categories:
+        entries.append((topic_count, {
+            'text': name,
+            'type': 'category',
+            'url': f'{topic_list_url}?category={pk}',
+        }))
+
+    return PrefixIndex(entries)
+
+
+_index = None
+_stale = True
+_index_lock = threading.Lock()
+
+
+def get_suggest_index():
+    """Return the process-wide index, rebuilding it if it has gone stale"""
+    global _index, _stale
+    if _stale or _index is None:
+        # Callers arriving during the first build wait here for it
+        with _index_lock:
+            if _stale or _index is None:
+                # Clear the flag first so writes that land mid-build re-mark it.
+                _stale = False
+                try:
+                    _index = build_suggest_index()
+                except Exception:
+                    _stale = True
+                    raise
+    return _index
+
+
+async def aget_suggest_index():
+    """``get_suggest_index`` for async views; only a rebuild leaves the event loop"""
+    if not _stale and _index is not None:
+        return _index
+    return await sync_to_async(get_suggest_index)()
+
+
+def mark_suggest_index_stale():
+    global _stale
+    _stale = True
@@ -1,13 +1,20 @@
 # apps/topics/urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import CategoryViewSet, TopicViewSet, TopicListView, TopicDetailView
+from . import async_views
+from .views import CategoryViewSet, TopicViewSet, TopicListView, TopicDetailView, export_topics
 
 router = DefaultRouter()
 router.register(r'categories', CategoryViewSet)
 router.register(r'topics', TopicViewSet)
 
 urlpatterns = [
+    path('api/export/', export_topics, name='topic_export'),
+    # Async read-only versions of the viewset list/retrieve actions
+    path('api/async/topics/', async_views.topic_list, name='async-topic-list'),
+    path('api/async/topics/<int:pk>/', async_views.topic_detail, name='async-topic-detail'),
+    path('api/async/categories/', async_views.category_list, name='async-category-list'),
+    path('api/async/categories/<int:pk>/', async_views.category_detail, name='async-category-detail'),
     path('api/', include(router.urls)),
     path('', TopicListView.as_view(), name='topic_list'),
     path('<int:pk>/', TopicDetailView.as_view(), name='topic_detail'),
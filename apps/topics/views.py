@@ -1,59 +1,181 @@
 # apps/topics/views.py
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404
+from django.db.models import Count, Max, Prefetch
 from django.views.generic import ListView, DetailView
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from apps.core.db import ReplicaReadMixin
+from apps.core.pagination import InvalidCursor, paginate_keyset
+from .caching import GenerationCacheMixin
+from .conditional import (
+    ConditionalGetMixin, ConditionalResponseMixin, category_validators, queryset_validators,
+    topic_validators,
+)
+from .export import aiter_ndjson, iter_ndjson
+from .filters import TagFilterBackend, filter_by_tags, parse_tag_params
+from .highlighting import HIGHLIGHT_VERSION
 from .models import Category, Topic, CodeExample
-from .serializers import CategorySerializer, TopicSerializer
+from .serializers import CategorySerializer, TopicListSerializer, TopicSerializer, parse_fieldset
 
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Category.objects.all()
+# Keyset pagination keys, backed by the composite indexes on each model.
+# Topics group by category id rather than Category.order so the key never
+# needs the join to Category.
+CATEGORY_ORDERING = ('order', 'name', 'id')
+TOPIC_ORDERING = ('category_id', 'order', 'title', 'id')
+
+class CategoryViewSet(ReplicaReadMixin, ConditionalGetMixin, GenerationCacheMixin, viewsets.ReadOnlyModelViewSet):
+    # Topics within one category only need the per-category ordering, which
+    # avoids the join to Category implied by Topic.Meta.ordering.
+    queryset = Category.objects.annotate(topic_count=Count('topics')).order_by('order', 'name').prefetch_related(
+        Prefetch('topics', queryset=Topic.objects.with_details().order_by('order', 'title'))
+    )
     serializer_class = CategorySerializer
+    ordering = CATEGORY_ORDERING
+
+    def get_queryset(self):
+        if self.action == 'topics':
+            return Category.objects.all()
+        return super().get_queryset()
+
+    def get_validators(self, request, pk=None):
+        categories = Category.objects.all()
+        if pk is not None:
+            categories = categories.filter(pk=pk)
+        return category_validators(request, categories)
 
     @action(detail=True, methods=['get'])
     def topics(self, request, pk=None):
+        return self.conditional_response(request, self.cached_response, self._topics, pk=pk)
+
+    def _topics(self, request, pk=None):
         category = self.get_object()
-        topics = category.topics.all()
+        topics = category.topics.with_details().order_by('order', 'title')
         serializer = TopicSerializer(topics, many=True)
         return Response(serializer.data)
 
-class TopicViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Topic.objects.select_related('category').prefetch_related('code_examples', 'interview_questions')
+class TopicViewSet(ReplicaReadMixin, ConditionalGetMixin, GenerationCacheMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Topics API. List actions render ``TopicListSerializer``; every action
+    accepts ``?fields=`` and ``?expand=code_examples,interview_questions``.
+    """
+    queryset = Topic.objects.all()
     serializer_class = TopicSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['title', 'description', 'tags']
+    filter_backends = [TagFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ['title', 'description', 'tags__name']
     ordering_fields = ['created_at', 'title', 'difficulty']
+    ordering = TOPIC_ORDERING
+
+    def get_serializer_class(self):
+        if self.action == 'retrieve':
+            return TopicSerializer
+        return TopicListSerializer
+
+    def get_fieldset(self):
+        """Return the ``(fields, expand)`` sets requested in the query string"""
+        params = self.request.query_params
+        return parse_fieldset(params.get('fields')), parse_fieldset(params.get('expand'))
+
+    def get_serializer(self, *args, **kwargs):
+        fields, expand = self.get_fieldset()
+        kwargs.setdefault('fields', fields)
+        kwargs.setdefault('expand', expand)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        fields, expand = self.get_fieldset()
+        names = self.get_serializer_class().selected_fields(fields, expand)
+        if self.paginator is not None:
+            # Keep the pagination key loaded; cursors are built from it
+            names += [field.lstrip('-') for field in self.paginator.get_ordering(self.request, self)]
+        return super().get_queryset().for_fields(names)
+
+    def get_validators(self, request, pk=None):
+        if self.action == 'retrieve':
+            topics = Topic.objects.filter(pk=pk)
+        elif self.action == 'list':
+            topics = self.filter_queryset(Topic.objects.all())
+        else:
+            topics = Topic.objects.all()
+        # Highlighted code is rendered markup; a new renderer version changes it
+        return queryset_validators(request, topics, HIGHLIGHT_VERSION)
 
     @action(detail=False, methods=['get'])
     def featured(self, request):
-        featured_topics = self.queryset.filter(is_featured=True)
+        return self.conditional_response(request, self.cached_response, self._featured)
+
+    def _featured(self, request):
+        featured_topics = self.get_queryset().filter(is_featured=True)
         serializer = self.get_serializer(featured_topics, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def by_difficulty(self, request):
+        return self.conditional_response(request, self.cached_response, self._by_difficulty)
+
+    def _by_difficulty(self, request):
         difficulty = request.query_params.get('level', 'intermediate')
-        topics = self.queryset.filter(difficulty=difficulty)
+        topics = self.get_queryset().filter(difficulty=difficulty)
         serializer = self.get_serializer(topics, many=True)
         return Response(serializer.data)
     
+def export_topics(request):
+    """Stream every topic, with its code examples and questions, as NDJSON"""
+    # An async iterator under ASGI, which would otherwise buffer the whole export
+    lines = aiter_ndjson() if isinstance(request, ASGIRequest) else iter_ndjson()
+    response = StreamingHttpResponse(lines, content_type='application/x-ndjson; charset=utf-8')
+    response['Content-Disposition'] = 'attachment; filename="topics.ndjson"'
+    return response
+
 # Django Template Views
-class TopicListView(ListView):
+class TopicListView(ConditionalResponseMixin, ListView):
     model = Topic
     template_name = 'topics/topic_list.html'
     context_object_name = 'topics'
     paginate_by = 12
 
+    def get(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().get, *args, **kwargs)
+
+    def paginate_queryset(self, queryset, page_size):
+        try:
+            page = paginate_keyset(queryset, TOPIC_ORDERING, self.request.GET.get('cursor'), page_size)
+        except InvalidCursor:
+            raise Http404('Invalid cursor')
+        return None, page, page.object_list, page.has_next or page.has_previous
+
+    def get_validators(self, request):
+        # The category filter dropdown is part of the page too
+        categories = Category.objects.aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+        return queryset_validators(
+            request, self.get_filtered_queryset(), categories['last_modified'], categories['count'],
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['categories'] = Category.objects.all()
         context['selected_category'] = self.request.GET.get('category')
         context['selected_difficulty'] = self.request.GET.get('difficulty')
+        context['selected_tags'] = sorted(parse_tag_params(self.request.GET.getlist('tag')))
+        page = context['page_obj']
+        params = self.request.GET.copy()
+        params.pop('cursor', None)
+        context['first_query'] = params.urlencode()
+        if page.has_next:
+            params['cursor'] = page.next_cursor
+            context['next_query'] = params.urlencode()
+        if page.has_previous:
+            params['cursor'] = page.previous_cursor
+            context['previous_query'] = params.urlencode()
         return context
 
     def get_queryset(self):
-        queryset = Topic.objects.select_related('category')
+        return self.get_filtered_queryset().select_related('category').prefetch_related('tags').with_counts()
+
+    def get_filtered_queryset(self):
+        queryset = Topic.objects.all()
         category = self.request.GET.get('category')
         difficulty = self.request.GET.get('difficulty')
         
@@ -61,14 +183,23 @@ class TopicListView(ListView):
             queryset = queryset.filter(category__id=category)
         if difficulty:
             queryset = queryset.filter(difficulty=difficulty)
+        queryset = filter_by_tags(queryset, parse_tag_params(self.request.GET.getlist('tag')))
             
         return queryset
 
-class TopicDetailView(DetailView):
+class TopicDetailView(ConditionalResponseMixin, DetailView):
     model = Topic
+    queryset = Topic.objects.select_related('category').prefetch_related('tags')
     template_name = 'topics/topic_detail.html'
     context_object_name = 'topic'
 
+    def get(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().get, *args, **kwargs)
+
+    def get_validators(self, request, pk):
+        # The page shows the category too, so renaming it must change the validators
+        return topic_validators(request, Topic.objects.filter(pk=pk), HIGHLIGHT_VERSION)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['code_examples'] = self.object.code_examples.all()
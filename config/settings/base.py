@@ -87,23 +87,81 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 
+# Static files served as one file per bundle. With ASSETS_USE_BUNDLES on,
+# {% bundle %} links the minified bundle that `manage.py build_assets`
+# writes to static/bundles/; otherwise it links the sources one by one.
+ASSET_BUNDLES = {
+    'site.css': ['css/main.css', 'css/mobile.css', 'css/highlight.css'],
+    'site.js': ['js/main.js', 'js/syntax-highlight.js'],
+}
+ASSETS_USE_BUNDLES = False
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache backend: 'lru' keeps entries in each process (bounded by count and
+# size); 'file' shares one directory between gunicorn workers.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'lru')
+
+if CACHE_BACKEND == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'apps.core.cache.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache')),
+            'TIMEOUT': 300,
+            'OPTIONS': {'MAX_ENTRIES': 20000},
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'apps.core.cache.LRUCache',
+            'LOCATION': 'default',
+            'TIMEOUT': 300,
+            'OPTIONS': {'MAX_ENTRIES': 5000, 'MAX_BYTES': 64 * 1024 * 1024},
+        }
+    }
+
+# Seconds a cached topics API response may be served; writes invalidate
+# earlier through the generation counters in apps/topics/generations.py.
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', '300'))
+
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        # orjson-backed JSONRenderer; falls back to the stdlib encoder
+        'apps.core.renderers.FastJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'apps.core.pagination.KeysetPagination',
     'PAGE_SIZE': 20
 }
 
+# Maximum SQL queries per request, keyed by URL name. Enforced by
+# tests/test_views.py and reported by QueryCountMiddleware in development.
+QUERY_BUDGETS = {
+    'category-list': 7,
+    'category-detail': 6,
+    'category-topics': 6,
+    'topic-list': 5,
+    'topic-detail': 5,
+    'topic-featured': 4,
+    'async-topic-list': 5,
+    'async-topic-detail': 5,
+    'async-category-list': 7,
+    'async-category-detail': 6,
+    'home': 2,
+    'topic_list': 7,
+    'topic_detail': 5,
+    'api_search': 4,
+    'api_suggest': 3,
+    'api_stats': 1,
+}
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
@@ -3,6 +3,8 @@ from .base import *
 
 DEBUG = True
 
+MIDDLEWARE = ['apps.core.middleware.QueryCountMiddleware'] + MIDDLEWARE
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -1 +1,66 @@
-# This file is intentionally left blank.
\ No newline at end of file
+# config/settings/production.py
+"""
+Production settings. The database comes from ``DATABASE_URL``:
+
+    DATABASE_URL=postgresql://user:password@db:5432/interview_prep
+
+Connections are kept open for ``DATABASE_CONN_MAX_AGE`` seconds (default
+600) and health-checked before reuse, so a request no longer pays for a
+new PostgreSQL connection. Behind a transaction-pooling PgBouncer, append
+``?disable_server_side_cursors=true`` and set ``DATABASE_CONN_MAX_AGE=0``
+to let the pooler own the connections.
+
+Setting ``DATABASE_REPLICA_URL`` adds a ``replica`` alias that serves the
+read-only topic and category API. Cached responses are invalidated on
+write; a read from a lagging replica right after a write can be cached
+until the next write or ``API_CACHE_TIMEOUT``.
+"""
+from django.core.exceptions import ImproperlyConfigured
+
+from apps.core.db import REPLICA_ALIAS, parse_database_url
+
+from .base import *
+
+DEBUG = False
+
+# Compile each template once per process. Django picks the cached loader
+# itself when no loaders are given; spelling it out keeps it on regardless
+# of DEBUG or a later change to the defaults.
+TEMPLATES = [{
+    **TEMPLATES[0],
+    'APP_DIRS': False,
+    'OPTIONS': {
+        **TEMPLATES[0]['OPTIONS'],
+        'loaders': [
+            ('django.template.loaders.cached.Loader', [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ]),
+        ],
+    },
+}]
+
+# Content-hashed file names (cacheable forever) with .gz/.br variants;
+# run `manage.py build_assets` to build the bundles and collect them.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'apps.core.assets.CompressedManifestStaticFilesStorage'},
+}
+ASSETS_USE_BUNDLES = True
+
+try:
+    DATABASE_URL = os.environ['DATABASE_URL']
+except KeyError:
+    raise ImproperlyConfigured('Set DATABASE_URL to use the production settings')
+
+DATABASE_CONN_MAX_AGE = int(os.getenv('DATABASE_CONN_MAX_AGE', '600'))
+
+DATABASES = {
+    'default': parse_database_url(DATABASE_URL, conn_max_age=DATABASE_CONN_MAX_AGE, health_checks=True),
+}
+
+if os.getenv('DATABASE_REPLICA_URL'):
+    DATABASES[REPLICA_ALIAS] = parse_database_url(
+        os.environ['DATABASE_REPLICA_URL'], conn_max_age=DATABASE_CONN_MAX_AGE, health_checks=True,
+    )
+    DATABASE_ROUTERS = ['apps.core.db.ReplicaRouter']
@@ -0,0 +1,20 @@
+# config/settings/test_postgres.py
+"""
+Settings for running the test suite (notably tests/test_query_plans.py)
+against the PostgreSQL service from docker-compose.yml:
+
+    docker compose up -d db
+    python manage.py test --settings=config.settings.test_postgres
+"""
+from .development import *
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv('POSTGRES_DB', 'interview_prep'),
+        'USER': os.getenv('POSTGRES_USER', 'postgres'),
+        'PASSWORD': os.getenv('POSTGRES_PASSWORD', 'postgres'),
+        'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
+        'PORT': os.getenv('POSTGRES_PORT', '5432'),
+    }
+}
@@ -0,0 +1,21 @@
+# config/settings/test_replica.py
+"""
+Settings for running the test suite with a read replica, as two local
+SQLite databases, so tests/test_db.py can check which one the read-only
+API reads from:
+
+    python manage.py test tests.test_db --settings=config.settings.test_replica
+"""
+from apps.core.db import REPLICA_ALIAS
+
+from .development import *
+
+DATABASES = {
+    **DATABASES,
+    REPLICA_ALIAS: {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db_replica.sqlite3',
+    },
+}
+
+DATABASE_ROUTERS = ['apps.core.db.ReplicaRouter']
@@ -1 +1,2 @@
-# This file is intentionally left blank.
\ No newline at end of file
+/* static/js/syntax-highlight.js */
+/* Code examples are highlighted on the server (apps/topics/highlighting.py) */
@@ -0,0 +1,77 @@
+# tests/test_admin.py
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.pagination import EstimatedCountPaginator
+from apps.topics.models import Category, Topic, CodeExample, InterviewQuestion
+
+
+class AdminChangelistTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        for category_index in range(2):
+            category = Category.objects.create(name=f'Category {category_index}')
+            for topic_index in range(3):
+                topic = Topic.objects.create(title=f'Topic {category_index}.{topic_index}', description='...', category=category)
+                for n in range(3):
+                    CodeExample.objects.create(topic=topic, title=f'Example {n}', code=f'value_{topic.pk}_{n} = {n}')
+                    InterviewQuestion.objects.create(topic=topic, question=f'Question {n}?', sample_answer='Answer.')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def changelist_queries(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_changelists_do_not_query_per_row(self):
+        for url in ('/admin/topics/category/', '/admin/topics/topic/',
+                    '/admin/topics/codeexample/', '/admin/topics/interviewquestion/'):
+            _, before = self.changelist_queries(url)
+            topic = Topic.objects.create(title='Extra', description='...', category=Category.objects.first())
+            CodeExample.objects.create(topic=topic, title='Extra', code='pass')
+            InterviewQuestion.objects.create(topic=topic, question='Extra?', sample_answer='...')
+            _, after = self.changelist_queries(url)
+            self.assertEqual(before, after, url)
+
+    def test_category_topic_count_is_annotated(self):
+        response, _ = self.changelist_queries('/admin/topics/category/', o='2')
+        self.assertContains(response, '<td class="field-topic_count">3</td>', count=2, html=True)
+
+    def test_search_matches_prefixes_of_short_columns(self):
+        def search(url, term):
+            response, _ = self.changelist_queries(url, q=term)
+            return response.context['cl'].result_count
+
+        self.assertEqual(search('/admin/topics/topic/', 'topi'), 6)
+        self.assertEqual(search('/admin/topics/topic/', '1.2'), 0)
+        self.assertEqual(search('/admin/topics/codeexample/', 'exam'), 18)
+        # Code bodies are not searched
+        self.assertEqual(search('/admin/topics/codeexample/', 'value'), 0)
+        self.assertEqual(search('/admin/topics/interviewquestion/', 'quest'), 18)
+
+
+class SmallThreshold(EstimatedCountPaginator):
+    threshold = 10
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Category.objects.bulk_create([Category(name=f'Category {n}') for n in range(12)])
+
+    def test_uses_statistics_for_unfiltered_tables(self):
+        self.assertEqual(SmallThreshold(Category.objects.all(), 5).count, 12)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        Category.objects.create(name='Not counted yet')
+
+        self.assertEqual(SmallThreshold(Category.objects.all(), 5).count, 12)
+        self.assertEqual(SmallThreshold(Category.objects.filter(name__startswith='Category'), 5).count, 12)
+        self.assertEqual(SmallThreshold(Category.objects.exclude(name=''), 5).count, 13)
+        self.assertEqual(EstimatedCountPaginator(Category.objects.all(), 5).count, 13)
@@ -1 +1,557 @@
-# This file is intentionally left blank.
\ No newline at end of file
+# tests/test_api.py
+import json
+import threading
+from functools import partial
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+from urllib.parse import parse_qsl
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from apps.core import renderers
+from apps.core.cache import LRUCache
+from apps.topics.models import Category, Tag, Topic, CodeExample, InterviewQuestion
+from apps.topics.export import aiter_ndjson
+from apps.topics import suggest
+from apps.topics.search import reset_search_index
+from apps.topics.suggest import mark_suggest_index_stale
+
+
+class SearchAPITests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Python Fundamentals')
+        cls.topic = Topic.objects.create(
+            title='Python Generators',
+            description='Lazy iteration with yield and generator expressions',
+            category=cls.category,
+            estimated_time='20 minutes',
+        )
+        cls.topic.set_tags(['generators', 'iterators'])
+        cls.example = CodeExample.objects.create(
+            topic=cls.topic,
+            title='Fibonacci generator',
+            code='def fib():\n    a, b = 0, 1\n    while True:\n        yield a',
+        )
+        cls.question = InterviewQuestion.objects.create(
+            topic=cls.topic,
+            question='What is the difference between a list and a tuple?',
+            sample_answer='Tuples are immutable and hashable.',
+        )
+
+    def setUp(self):
+        reset_search_index()
+
+    def search(self, query):
+        response = self.client.get(reverse('api_search'), {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_ranks_title_matches_first(self):
+        results = self.search('generator')
+        self.assertEqual(results[0]['type'], 'topic')
+        self.assertEqual(results[0]['url'], self.topic.get_absolute_url())
+        self.assertIn('code_example', [r['type'] for r in results])
+
+    def test_searches_code_and_answers(self):
+        self.assertEqual(self.search('fib')[0]['id'], self.example.pk)
+        self.assertEqual(self.search('immutable')[0]['id'], self.question.pk)
+
+    def test_empty_query_returns_no_results(self):
+        self.assertEqual(self.search(''), [])
+        self.assertEqual(self.search('the'), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.search('warmup')  # build the index before writing
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.topic.title = 'Python Coroutines'
+            self.topic.save()
+        self.assertEqual(self.search('coroutines')[0]['id'], self.topic.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.question.delete()
+        self.assertEqual(self.search('immutable'), [])
+
+
+class SuggestAPITests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Django Framework')
+        for title, featured in [('Django ORM Basics', False), ('Django REST Framework', True)]:
+            topic = Topic.objects.create(
+                title=title,
+                description='...',
+                category=cls.category,
+                estimated_time='30 minutes',
+                is_featured=featured,
+            )
+            topic.set_tags(['django', 'orm'])
+
+    def setUp(self):
+        mark_suggest_index_stale()
+
+    def suggest(self, prefix):
+        response = self.client.get(reverse('api_suggest'), {'prefix': prefix})
+        self.assertEqual(response.status_code, 200)
+        return [(s['type'], s['text']) for s in response.json()['suggestions']]
+
+    def test_matches_any_word_ranked_by_popularity(self):
+        self.assertEqual(self.suggest('djan'), [
+            ('topic', 'Django REST Framework'),
+            ('tag', 'django'),
+            ('category', 'Django Framework'),
+            ('topic', 'Django ORM Basics'),
+        ])
+        self.assertEqual(self.suggest('frame')[0], ('topic', 'Django REST Framework'))
+
+    def test_no_queries_until_a_write_marks_index_stale(self):
+        self.suggest('dj')
+        with self.assertNumQueries(0):
+            self.suggest('orm')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(name='Databases')
+        self.assertEqual(self.suggest('data'), [('category', 'Databases')])
+
+
+class SuggestIndexConcurrencyTests(SimpleTestCase):
+    def test_callers_during_the_first_build_wait_for_it(self):
+        started, release, built = threading.Event(), threading.Event(), object()
+
+        def slow_build():
+            started.set()
+            release.wait(5)
+            return built
+
+        results = []
+        with mock.patch.object(suggest, '_index', None), mock.patch.object(suggest, '_stale', True), \
+                mock.patch.object(suggest, 'build_suggest_index', slow_build):
+            first = threading.Thread(target=lambda: results.append(suggest.get_suggest_index()))
+            first.start()
+            started.wait(5)
+            # The flag is already cleared while the first build runs
+            second = threading.Thread(target=lambda: results.append(suggest.get_suggest_index()))
+            second.start()
+            release.set()
+            first.join()
+            second.join()
+        self.assertEqual(results, [built, built])
+
+
+class TopicTagFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Python Fundamentals')
+        cls.topics = {}
+        for title, tags in [
+            ('Lists', ['data-structures', 'sequences']),
+            ('Tuples', ['data-structures', 'sequences', 'immutability']),
+            ('Dicts', ['data-structures', 'hashing']),
+        ]:
+            topic = Topic.objects.create(
+                title=title, description='...', category=category, estimated_time='10 minutes',
+            )
+            topic.set_tags(tags)
+            cls.topics[title] = topic
+
+    def setUp(self):
+        cache.clear()
+
+    def titles(self, query):
+        response = self.client.get(reverse('topic-list') + query)
+        self.assertEqual(response.status_code, 200)
+        return sorted(topic['title'] for topic in response.json()['results'])
+
+    def test_single_tag(self):
+        self.assertEqual(self.titles('?tag=hashing'), ['Dicts'])
+        self.assertEqual(self.titles('?tag=Data-Structures'), ['Dicts', 'Lists', 'Tuples'])
+
+    def test_multiple_tags_are_anded(self):
+        self.assertEqual(self.titles('?tag=sequences&tag=data-structures'), ['Lists', 'Tuples'])
+        self.assertEqual(self.titles('?tag=sequences,immutability'), ['Tuples'])
+        self.assertEqual(self.titles('?tag=sequences&tag=hashing'), [])
+
+    def test_unknown_tag_matches_nothing(self):
+        self.assertEqual(self.titles('?tag=sequences&tag=missing'), [])
+
+    def test_tags_are_serialized_from_the_relation(self):
+        response = self.client.get(reverse('topic-detail', args=[self.topics['Tuples'].pk]))
+        data = response.json()
+        self.assertEqual(data['tags_list'], ['data-structures', 'immutability', 'sequences'])
+        self.assertEqual(data['tags'], 'data-structures, immutability, sequences')
+
+
+class CategoryQueryCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def add_category(self, index):
+        category = Category.objects.create(name=f'Category {index}', order=index)
+        for topic_index in range(3):
+            topic = Topic.objects.create(
+                title=f'Topic {index}.{topic_index}', description='...',
+                category=category, estimated_time='5 minutes',
+            )
+            topic.set_tags([f'tag-{topic_index}'])
+            CodeExample.objects.create(topic=topic, title='Example', code='pass')
+            InterviewQuestion.objects.create(topic=topic, question='Q?', sample_answer='A.')
+        return category
+
+    def test_category_list_query_count_is_constant(self):
+        self.add_category(0)
+        # validators, count, categories, topics, tags, code examples, interview questions
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse('category-list'))
+        self.assertEqual(response.json()['results'][0]['topic_count'], 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(1, 5):
+                self.add_category(index)
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse('category-list'))
+        self.assertEqual(len(response.json()['results']), 5)
+
+    def test_category_detail_and_topics_query_counts(self):
+        category = self.add_category(0)
+        with self.assertNumQueries(6):
+            self.client.get(reverse('category-detail', args=[category.pk]))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('category-detail', args=[category.pk]))
+        self.assertEqual(response['X-Cache'], 'HIT')
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse('category-topics', args=[category.pk]))
+        self.assertEqual(len(response.json()), 3)
+
+
+class StatsAPITests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Python Fundamentals')
+        for difficulty in ['beginner', 'beginner', 'advanced']:
+            topic = Topic.objects.create(
+                title=f'{difficulty} topic', description='...', category=cls.category,
+                estimated_time='5 minutes', difficulty=difficulty,
+            )
+        CodeExample.objects.create(topic=topic, title='Query', code='SELECT 1', language='sql')
+        Category.objects.create(name='Empty')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_breakdowns(self):
+        with self.assertNumQueries(1):
+            stats = self.client.get(reverse('api_stats')).json()
+        self.assertEqual(stats['total_topics'], 3)
+        self.assertEqual(stats['total_categories'], 2)
+        self.assertEqual(stats['difficulty_breakdown'], {'beginner': 2, 'intermediate': 0, 'advanced': 1})
+        self.assertEqual(stats['language_breakdown']['sql'], 1)
+        empty, python = stats['categories']
+        self.assertEqual(empty['topic_count'], 0)
+        self.assertEqual(python['language_breakdown']['sql'], 1)
+
+    def test_snapshot_is_reused_until_a_write(self):
+        self.client.get(reverse('api_stats'))
+        with self.assertNumQueries(0):
+            self.client.get(reverse('api_stats'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Topic.objects.create(
+                title='New', description='...', category=self.category, estimated_time='1 minute',
+            )
+        self.assertEqual(self.client.get(reverse('api_stats')).json()['total_topics'], 4)
+
+
+class TopicResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Python Fundamentals')
+        cls.topic = Topic.objects.create(
+            title='Decorators', description='...', category=cls.category, estimated_time='5 minutes',
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_responses_are_cached_per_query_string(self):
+        url = reverse('topic-list')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+        self.assertEqual(self.client.get(url, {'search': 'deco'})['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url, {'search': 'deco'})['X-Cache'], 'HIT')
+
+    def test_child_writes_invalidate_parent_responses(self):
+        url = reverse('topic-detail', args=[self.topic.pk])
+        self.client.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            CodeExample.objects.create(topic=self.topic, title='Timer', code='...')
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['code_examples'][0]['title'], 'Timer')
+
+
+class TopicFieldsetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Python Fundamentals')
+        cls.topic = Topic.objects.create(
+            title='Decorators', description='...', category=category, estimated_time='5 minutes',
+        )
+        CodeExample.objects.create(topic=cls.topic, title='Timer', code='def timer(): ...')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_is_slim_by_default(self):
+        row = self.client.get(reverse('topic-list')).json()['results'][0]
+        self.assertNotIn('code_examples', row)
+        self.assertEqual(row['example_count'], 1)
+        self.assertEqual(row['question_count'], 0)
+
+    def test_expand_includes_children(self):
+        response = self.client.get(reverse('topic-list'), {'expand': 'code_examples'})
+        row = response.json()['results'][0]
+        self.assertEqual(row['code_examples'][0]['code'], 'def timer(): ...')
+        self.assertNotIn('interview_questions', row)
+
+    def test_fields_restricts_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('topic-list'), {'fields': 'id,title'})
+        self.assertEqual(response.json()['results'], [{'id': self.topic.pk, 'title': 'Decorators'}])
+        page_query = queries.captured_queries[-1]['sql']
+        self.assertIn('"title"', page_query)
+        self.assertNotIn('"description"', page_query)
+
+    def test_code_format_html_adds_highlighted_markup(self):
+        url = reverse('topic-detail', args=[self.topic.pk])
+        self.assertNotIn('code_html', self.client.get(url).json()['code_examples'][0])
+        example = self.client.get(url, {'code_format': 'html'}).json()['code_examples'][0]
+        self.assertTrue(example['code_html'].startswith('<div class="highlight">'))
+
+    def test_detail_accepts_fields(self):
+        url = reverse('topic-detail', args=[self.topic.pk])
+        self.assertEqual(self.client.get(url, {'fields': 'title'}).json(), {'title': 'Decorators'})
+        self.assertIn('code_examples', self.client.get(url).json())
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Python Fundamentals')
+        for title in ['Decorators', 'Generators', 'Iterators']:
+            topic = Topic.objects.create(title=title, description='...', category=category, estimated_time='5 minutes')
+            topic.set_tags(['python'])
+        cls.generators = Topic.objects.get(title='Generators')
+        for order in (2, 1):
+            CodeExample.objects.create(topic=cls.generators, title=f'Example {order}', code='...', order=order)
+        InterviewQuestion.objects.create(topic=cls.generators, question='Why?', sample_answer='...')
+
+    def test_streams_ndjson_with_nested_children(self):
+        response = self.client.get(reverse('topic_export'))
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        with self.assertNumQueries(4):
+            lines = b''.join(response.streaming_content).decode().splitlines()
+        documents = [json.loads(line) for line in lines]
+        self.assertEqual([document['title'] for document in documents], ['Decorators', 'Generators', 'Iterators'])
+        generators = documents[1]
+        self.assertEqual(generators['category'], 'Python Fundamentals')
+        self.assertEqual([example['title'] for example in generators['code_examples']], ['Example 1', 'Example 2'])
+        self.assertEqual(len(generators['interview_questions']), 1)
+        self.assertEqual(documents[2]['code_examples'], [])
+
+    def test_export_command_matches_endpoint(self):
+        stdout = StringIO()
+        call_command('export_content', stdout=stdout, stderr=StringIO())
+        response = self.client.get(reverse('topic_export'))
+        self.assertEqual(stdout.getvalue(), b''.join(response.streaming_content).decode())
+
+    async def test_streams_under_asgi(self):
+        expected = await sync_to_async(lambda: b''.join(self.client.get(reverse('topic_export')).streaming_content))()
+        with mock.patch('apps.topics.views.aiter_ndjson', partial(aiter_ndjson, chunk_size=1)):
+            response = await self.async_client.get(reverse('topic_export'))
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+        # One chunk per topic rather than the whole export at once
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(b''.join(chunks), expected)
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Python Fundamentals')
+        cls.topic = Topic.objects.create(
+            title='Decorators', description='...', category=cls.category, estimated_time='5 minutes',
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_matching_etag_returns_not_modified(self):
+        url = reverse('topic-detail', args=[self.topic.pk])
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        with self.assertNumQueries(1):
+            revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated['ETag'], response['ETag'])
+
+    def test_child_writes_change_parent_etag(self):
+        url = reverse('topic-detail', args=[self.topic.pk])
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            InterviewQuestion.objects.create(topic=self.topic, question='Why?', sample_answer='...')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_tag_renames_and_deletes_change_topic_etag(self):
+        self.topic.set_tags(['python'])
+        tag = Tag.objects.get(name='python')
+        url = reverse('topic-detail', args=[self.topic.pk])
+
+        def rename():
+            tag.name = 'python3'
+            tag.save()
+
+        for change in (rename, tag.delete):
+            etag = self.client.get(url)['ETag']
+            with self.captureOnCommitCallbacks(execute=True):
+                change()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200, change)
+            self.assertNotEqual(response['ETag'], etag)
+
+    def test_detail_page_tracks_its_category(self):
+        url = reverse('topic_detail', args=[self.topic.pk])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.category.name = 'Python Basics'
+        self.category.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Python Basics')
+
+    def test_category_list_etag_tracks_topics(self):
+        url = reverse('category-list')
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            Topic.objects.create(
+                title='Generators', description='...', category=self.category, estimated_time='5 minutes',
+            )
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class LRUCacheTests(SimpleTestCase):
+    def make_cache(self, **options):
+        backend = LRUCache(self.id(), {'OPTIONS': options})
+        backend.clear()
+        return backend
+
+    def test_evicts_least_recently_used_by_count(self):
+        backend = self.make_cache(MAX_ENTRIES=2)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        backend.get('a')
+        backend.set('c', 3)
+        self.assertEqual(backend.get_many(['a', 'b', 'c']), {'a': 1, 'c': 3})
+
+    def test_evicts_by_size(self):
+        backend = self.make_cache(MAX_BYTES=2500)
+        for key in 'abc':
+            backend.set(key, 'x' * 1000)
+        self.assertFalse(backend.has_key('a'))
+        self.assertTrue(backend.has_key('c'))
+
+    def test_expires_entries_and_counts_hits(self):
+        backend = self.make_cache()
+        backend.set('a', 1, timeout=0)
+        backend.set('b', 1)
+        self.assertIsNone(backend.get('a'))
+        self.assertEqual(backend.incr('b'), 2)
+        self.assertEqual(backend.get('b'), 2)
+        self.assertEqual(backend.stats.as_dict(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    data = {
+        'title': 'Décorateurs\u2028',
+        'when': datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        'price': Decimal('1.50'),
+        'label': gettext_lazy('Topics'),
+        'items': [1, None, True],
+    }
+
+    def test_matches_drf_renderer(self):
+        content = renderers.FastJSONRenderer().render(self.data)
+        self.assertIn(b'\\u2028', content)
+        self.assertEqual(json.loads(content), {
+            **json.loads(JSONRenderer().render(self.data)),
+            'when': '2024-05-01T12:30:00Z',
+        })
+
+    def test_falls_back_without_orjson(self):
+        with mock.patch.object(renderers, 'orjson', None):
+            content = renderers.FastJSONRenderer().render(self.data)
+        self.assertEqual(content, JSONRenderer().render(self.data))
+        indented = renderers.FastJSONRenderer().render(self.data, renderer_context={'indent': 4})
+        self.assertEqual(indented, JSONRenderer().render(self.data, renderer_context={'indent': 4}))
+
+
+class AsyncAPITests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Python Fundamentals')
+        for index in range(25):
+            topic = Topic.objects.create(
+                title=f'Topic {index:02}', description='...', category=cls.category, estimated_time='5 minutes',
+            )
+            topic.set_tags(['python'] if index % 2 else ['django'])
+        cls.topic = Topic.objects.first()
+        CodeExample.objects.create(topic=cls.topic, title='Timer', code='def timer(): ...')
+
+    def setUp(self):
+        cache.clear()
+
+    def assertSameAsViewSet(self, name, args=None, data=None):
+        expected = self.client.get(reverse(name, args=args), data).json()
+        actual = self.client.get(reverse(f'async-{name}', args=args), data).json()
+        for body in (expected, actual):
+            for link in ('next', 'previous'):
+                if body.get(link):
+                    body[link] = body[link].split('?', 1)[1]
+        self.assertEqual(actual, expected)
+        return actual
+
+    def test_topics_match_viewset(self):
+        first = self.assertSameAsViewSet('topic-list')
+        self.assertEqual(first['count'], 25)
+        second = self.assertSameAsViewSet('topic-list', data=dict(parse_qsl(first['next'])))
+        self.assertEqual(len(second['results']), 5)
+        self.assertSameAsViewSet('topic-list', data={'tag': 'python', 'fields': 'id,title', 'count': 'false'})
+        self.assertSameAsViewSet('topic-detail', args=[self.topic.pk])
+        self.assertSameAsViewSet('topic-detail', args=[self.topic.pk], data={'fields': 'title'})
+
+    def test_categories_match_viewset(self):
+        self.assertSameAsViewSet('category-list')
+        self.assertSameAsViewSet('category-detail', args=[self.category.pk])
+
+    def test_not_found_is_json(self):
+        response = self.client.get(reverse('async-topic-detail', args=[0]))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'detail': 'Not found.'})
+        response = self.client.get(reverse('async-topic-list'), {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'detail': 'Invalid cursor.'})
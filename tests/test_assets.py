@@ -0,0 +1,80 @@
+# tests/test_assets.py
+import gzip
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.assets import brotli, minify_css, minify_js
+
+MANIFEST_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'apps.core.assets.CompressedManifestStaticFilesStorage'},
+}
+
+
+class MinifyTests(SimpleTestCase):
+    def test_css(self):
+        source = """
+            /* header */
+            a > b , c { content: "a , b" ; margin : 0  auto; }
+            @media print { nav a :hover { color : red ; } }
+        """
+        self.assertEqual(
+            minify_css(source),
+            'a>b,c{content:"a , b";margin:0 auto}@media print{nav a :hover{color:red}}',
+        )
+
+    def test_js_keeps_strings_regexes_and_line_breaks(self):
+        source = (
+            "// comment\n"
+            "    const url = 'http://example.com'; /* note */\n"
+            "\n"
+            "    const re = /a\\/b[/]/g, half = total / 2\n"
+            "    const html = `<pre>\n  indented</pre>`\n"
+        )
+        self.assertEqual(minify_js(source), (
+            "const url = 'http://example.com';\n"
+            "const re = /a\\/b[/]/g, half = total / 2\n"
+            "const html = `<pre>\n  indented</pre>`"
+        ))
+
+
+class BuildAssetsTests(SimpleTestCase):
+    def setUp(self):
+        self.source_dir = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.static_root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        (self.source_dir / 'css').mkdir()
+        (self.source_dir / 'css' / 'one.css').write_text('/* one */\n.a {\n    color: red;\n}\n' * 50)
+        (self.source_dir / 'css' / 'two.css').write_text('.b { color: blue; }\n')
+        self.enterContext(override_settings(
+            STATICFILES_DIRS=[self.source_dir],
+            STATIC_ROOT=self.static_root,
+            ASSET_BUNDLES={'site.css': ['css/one.css', 'css/two.css']},
+        ))
+
+    def test_bundle_tag_links_sources_until_bundles_are_used(self):
+        html = Template("{% load assets %}{% bundle 'site.css' %}").render(Context())
+        self.assertEqual(html, (
+            '<link rel="stylesheet" href="/static/css/one.css">\n'
+            '<link rel="stylesheet" href="/static/css/two.css">'
+        ))
+
+    @override_settings(STORAGES=MANIFEST_STORAGES, ASSETS_USE_BUNDLES=True)
+    def test_builds_hashed_compressed_bundles(self):
+        call_command('build_assets', stdout=StringIO())
+        bundle = (self.source_dir / 'bundles' / 'site.css').read_text()
+        self.assertEqual(bundle, '.a{color:red}' * 50 + '\n.b{color:blue}\n')
+
+        html = Template("{% load assets %}{% bundle 'site.css' %}").render(Context())
+        hashed = html.split('href="/static/')[1].split('"')[0]
+        self.assertRegex(hashed, r'^bundles/site\.[0-9a-f]{12}\.css$')
+        self.assertEqual((self.static_root / hashed).read_text(), bundle)
+        self.assertEqual(gzip.decompress((self.static_root / f'{hashed}.gz').read_bytes()).decode(), bundle)
+        if brotli is not None:
+            self.assertEqual(brotli.decompress((self.static_root / f'{hashed}.br').read_bytes()).decode(), bundle)
+        # Too small to be worth compressing
+        self.assertFalse(list(self.static_root.glob('css/two.*.css.gz')))
@@ -0,0 +1,119 @@
+# tests/test_fastapi.py
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase
+
+from apps.examples.fastapi_examples.crud import (
+    DuplicateEmail, InMemoryUserRepository, SQLUserRepository, UserRepository,
+)
+from apps.examples.fastapi_examples.database import SQLiteDatabase
+from apps.examples.fastapi_examples.loadtest import ASGIClient, run_load_test
+
+
+class UserRepositoryTests(SimpleTestCase):
+    """Both stores behave the same; run every scenario against each"""
+
+    def run_with_repositories(self, scenario):
+        async def in_memory():
+            await scenario(InMemoryUserRepository())
+
+        async def sqlite(path):
+            database = SQLiteDatabase(path, pool_size=3)
+            await database.connect()
+            try:
+                users = SQLUserRepository(database)
+                await users.create_table()
+                await scenario(users)
+            finally:
+                await database.disconnect()
+
+        asyncio.run(in_memory())
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(sqlite(os.path.join(directory, 'users.db')))
+
+    def test_crud(self):
+        async def scenario(users):
+            ada = await users.create({'name': 'Ada', 'email': 'ada@example.com', 'age': 36})
+            bob = await users.create({'name': 'Bob', 'email': 'bob@example.com'})
+            self.assertEqual((await users.get(ada['id']))['name'], 'Ada')
+            self.assertEqual((await users.get_by_email('bob@example.com'))['id'], bob['id'])
+            self.assertEqual([user['name'] for user in await users.list(skip=1, limit=5)], ['Bob'])
+
+            updated = await users.update(ada['id'], {'email': 'ada@lovelace.org'})
+            self.assertEqual(updated['email'], 'ada@lovelace.org')
+            self.assertIsNone(await users.get_by_email('ada@example.com'))
+            self.assertIsNone(await users.update(999, {'name': 'Nobody'}))
+
+            self.assertTrue(await users.delete(bob['id']))
+            self.assertFalse(await users.delete(bob['id']))
+            self.assertIsNone(await users.get(bob['id']))
+
+        self.run_with_repositories(scenario)
+
+    def test_email_is_unique_under_concurrent_requests(self):
+        async def scenario(users):
+            results = await asyncio.gather(
+                *(users.create({'name': f'User {n}', 'email': 'same@example.com'}) for n in range(10)),
+                return_exceptions=True,
+            )
+            created = [result for result in results if isinstance(result, dict)]
+            self.assertEqual(len(created), 1)
+            self.assertTrue(all(isinstance(result, DuplicateEmail) for result in results if result not in created))
+
+            other = await users.create({'name': 'Other', 'email': 'other@example.com'})
+            with self.assertRaises(DuplicateEmail):
+                await users.update(other['id'], {'email': 'same@example.com'})
+
+        self.run_with_repositories(scenario)
+
+    def test_stores_must_implement_the_whole_interface(self):
+        class Partial(UserRepository):
+            async def get(self, user_id):
+                return None
+
+        with self.assertRaises(TypeError):
+            Partial()
+
+
+class ConcurrentCreateTests(SimpleTestCase):
+    def test_in_memory_store_from_threads(self):
+        users = InMemoryUserRepository()
+
+        def create(n):
+            try:
+                return asyncio.run(users.create({'name': f'User {n}', 'email': f'user{n % 100}@example.com'}))
+            except DuplicateEmail:
+                return None
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            created = [user for user in pool.map(create, range(400)) if user]
+        self.assertEqual(len(created), 100)
+        self.assertEqual(len({user['id'] for user in created}), 100)
+        self.assertEqual(len(users.by_id), len(users.by_email))
+
+    def test_load_test_harness(self):
+        from apps.examples.fastapi_examples.main import app
+
+        async def run():
+            async with app.router.lifespan_context(app):
+                return await run_load_test(ASGIClient(app), creates=300, concurrency=50, duplicates=3)
+
+        summary = asyncio.run(run())
+        self.assertEqual(summary['problems'], [])
+        self.assertEqual(summary['created'], 100)
+
+    def test_list_rejects_negative_paging(self):
+        from apps.examples.fastapi_examples.main import app
+
+        async def run():
+            async with app.router.lifespan_context(app):
+                client = ASGIClient(app)
+                return [
+                    (await client.request('GET', f'/users/?{query}'))[0]
+                    for query in ('skip=0&limit=5', 'skip=-1', 'limit=-1')
+                ]
+
+        self.assertEqual(asyncio.run(run()), [200, 422, 422])
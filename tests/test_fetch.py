@@ -0,0 +1,162 @@
+# tests/test_fetch.py
+import asyncio
+import threading
+from io import StringIO
+
+from aiohttp import web
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from apps.core.fetch import FetchEngine
+from apps.topics.models import Category, Topic, CodeExample
+
+
+class StubServer:
+    """aiohttp app on a background loop, recording requests in flight"""
+
+    def __init__(self):
+        self.in_flight = self.max_in_flight = 0
+        self.attempts = {}
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    async def handle(self, request):
+        name = request.match_info['name']
+        self.attempts[name] = self.attempts.get(name, 0) + 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if name == 'slow':
+                await asyncio.sleep(2)
+            await asyncio.sleep(0.02)
+            if name == 'missing':
+                return web.Response(status=404)
+            if name == 'flaky' and self.attempts[name] < 3:
+                return web.Response(status=503)
+            if name == 'no-head' and request.method == 'HEAD':
+                return web.Response(status=405)
+            if name == 'bad-charset':
+                return web.Response(body=b'\xff\xfe\xfa', content_type='text/plain', charset='utf-8')
+            return web.Response(text=f'page {name}')
+        finally:
+            self.in_flight -= 1
+
+    def start(self):
+        async def setup():
+            app = web.Application()
+            app.router.add_route('*', '/{name}', self.handle)
+            self.runner = web.AppRunner(app)
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, '127.0.0.1', 0)
+            await site.start()
+            return self.runner.addresses[0][1]
+
+        self.thread.start()
+        port = asyncio.run_coroutine_threadsafe(setup(), self.loop).result()
+        self.base_url = f'http://127.0.0.1:{port}'
+
+    def stop(self):
+        async def shutdown():
+            await self.runner.cleanup()
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class StubServerMixin:
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = StubServer()
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.attempts.clear()
+        self.server.max_in_flight = 0
+
+    def url(self, name):
+        return f'{self.server.base_url}/{name}'
+
+
+class FetchEngineTests(StubServerMixin, SimpleTestCase):
+    def fetch_all(self, urls, engine=None, **options):
+        engine = engine or FetchEngine(**options)
+
+        async def collect():
+            return [result async for result in engine.fetch_all(urls)]
+        return {result.url: result for result in asyncio.run(asyncio.wait_for(collect(), 10))}
+
+    def test_concurrency_is_bounded(self):
+        urls = [self.url(f'page-{n}') for n in range(30)]
+        results = self.fetch_all(urls, concurrency=5, per_host=3)
+        self.assertEqual(set(results), set(urls))
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(results[urls[0]].body, 'page page-0')
+        self.assertLessEqual(self.server.max_in_flight, 3)
+
+    def test_retries_and_failures(self):
+        results = self.fetch_all(
+            [self.url('flaky'), self.url('missing'), self.url('slow'), 'http://127.0.0.1:1/closed'],
+            retries=2, backoff=0.01, timeout=0.5,
+        )
+        flaky = results[self.url('flaky')]
+        self.assertTrue(flaky.ok)
+        self.assertEqual(flaky.attempts, 3)
+        self.assertEqual(results[self.url('missing')].status, 404)
+        self.assertEqual(results[self.url('missing')].attempts, 1)
+        self.assertIsNotNone(results[self.url('slow')].error)
+        self.assertIsNotNone(results['http://127.0.0.1:1/closed'].error)
+
+    def test_head_falls_back_to_get(self):
+        result = self.fetch_all([self.url('no-head')], method='HEAD', read_body=False)[self.url('no-head')]
+        self.assertTrue(result.ok)
+        self.assertIsNone(result.body)
+
+    def test_undecodable_body_is_replaced(self):
+        result = self.fetch_all([self.url('bad-charset')])[self.url('bad-charset')]
+        self.assertTrue(result.ok)
+        self.assertEqual(result.body, '\ufffd' * 3)
+
+    def test_unexpected_errors_are_raised_after_the_other_urls(self):
+        class BrokenEngine(FetchEngine):
+            async def fetch(self, session, url):
+                if url.endswith('broken'):
+                    raise RuntimeError('parser bug')
+                return await super().fetch(session, url)
+
+        fetched = []
+
+        async def collect():
+            async for result in BrokenEngine(concurrency=2).fetch_all([self.url('broken'), self.url('a'), self.url('b')]):
+                fetched.append(result.url)
+
+        with self.assertRaisesMessage(RuntimeError, 'parser bug'):
+            asyncio.run(asyncio.wait_for(collect(), 10))
+        self.assertEqual(sorted(fetched), [self.url('a'), self.url('b')])
+
+
+class CheckGithubLinksTests(StubServerMixin, TestCase):
+    def test_reports_broken_links(self):
+        topic = Topic.objects.create(title='Generators', description='yield', category=Category.objects.create(name='Python'))
+        CodeExample.objects.create(topic=topic, title='Good', code='pass', github_url=self.url('good'))
+        CodeExample.objects.create(topic=topic, title='Gone', code='pass', github_url=self.url('missing'))
+        CodeExample.objects.create(topic=topic, title='Unlinked', code='pass')
+
+        stdout = StringIO()
+        with self.assertRaisesMessage(CommandError, '1 broken link(s)'):
+            call_command('check_github_links', stdout=stdout)
+        output = stdout.getvalue()
+        self.assertIn(f'(Gone): {self.url("missing")} -> HTTP 404', output)
+        self.assertNotIn('Good', output)
+        self.assertIn('Checked 2 links', output)
@@ -1 +1,160 @@
-# This file is intentionally left blank.
\ No newline at end of file
+# tests/test_models.py
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.topics.highlighting import highlight_key
+from apps.topics.models import Category, Tag, Topic, CodeExample, InterviewQuestion
+
+
+class TagModelTests(TestCase):
+    def test_from_names_normalizes_and_reuses_rows(self):
+        existing = Tag.objects.create(name='orm')
+        tags = Tag.objects.from_names([' ORM', 'queries', '', 'queries'])
+        self.assertEqual(sorted(tag.name for tag in tags), ['orm', 'queries'])
+        self.assertIn(existing, tags)
+        self.assertEqual(Tag.objects.count(), 2)
+
+    def test_set_tags_replaces_relation(self):
+        category = Category.objects.create(name='Databases')
+        topic = Topic.objects.create(
+            title='Indexes', description='...', category=category, estimated_time='5 minutes',
+        )
+        topic.set_tags(['sql', 'performance'])
+        topic.set_tags(['sql', 'b-tree'])
+        self.assertEqual(topic.get_tags_list(), ['b-tree', 'sql'])
+
+
+class ImportContentTests(TestCase):
+    records = [
+        {'type': 'category', 'name': 'Databases', 'order': 4},
+        {'type': 'topic', 'title': 'Indexes', 'description': '...', 'category': 'Databases',
+         'estimated_time': '5 minutes', 'tags': 'sql, performance'},
+        {'type': 'interview_question', 'topic': 'Indexes', 'question': 'What is a B-tree?', 'sample_answer': 'A tree.'},
+        {'type': 'interview_question', 'topic': 'Missing', 'question': 'Orphan?', 'sample_answer': '...'},
+    ]
+
+    def write_jsonl(self, records):
+        handle, path = tempfile.mkstemp(suffix='.jsonl')
+        with os.fdopen(handle, 'w') as stream:
+            stream.writelines(json.dumps(record) + '\n' for record in records)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def import_content(self, *args):
+        stdout, stderr = StringIO(), StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('import_content', *args, batch_size=2, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_imports_and_resolves_parents_by_name(self):
+        stdout, stderr = self.import_content(self.write_jsonl(self.records))
+        topic = Topic.objects.get(title='Indexes')
+        self.assertEqual(topic.category.name, 'Databases')
+        self.assertEqual(topic.get_tags_list(), ['performance', 'sql'])
+        self.assertEqual(topic.interview_questions.get().question, 'What is a B-tree?')
+        self.assertIn("unknown topic 'Missing'", stderr)
+        self.assertIn('1 rejected', stdout)
+
+    def test_existing_rows_are_skipped_or_updated(self):
+        path = self.write_jsonl(self.records[:3])
+        self.import_content(path)
+        stdout, _ = self.import_content(path)
+        self.assertIn('interview_question: 0 created, 0 updated, 1 skipped', stdout)
+
+        changed = dict(self.records[2], sample_answer='A balanced tree.')
+        self.import_content(self.write_jsonl([changed]), '--update')
+        self.assertEqual(InterviewQuestion.objects.get().sample_answer, 'A balanced tree.')
+        self.assertEqual(Category.objects.count(), 1)
+
+    def test_update_leaves_fields_a_record_omits(self):
+        Category.objects.create(name='Py', description='old desc', icon='snake')
+        Category.objects.create(name='Dj', description='web framework', icon='code')
+        self.import_content(self.write_jsonl([
+            {'type': 'category', 'name': 'Py', 'description': 'new desc'},
+            {'type': 'category', 'name': 'Dj', 'icon': 'tree'},
+        ]), '--update')
+        self.assertEqual(
+            set(Category.objects.values_list('name', 'description', 'icon')),
+            {('Py', 'new desc', 'snake'), ('Dj', 'web framework', 'tree')},
+        )
+
+    def test_update_rehighlights_only_when_code_or_language_is_set(self):
+        topic = Topic.objects.create(title='T', description='...', category=Category.objects.create(name='C'))
+        example = CodeExample.objects.create(topic=topic, title='E', code='def f():\n    return 1')
+        highlighted = example.highlighted_code
+
+        self.import_content(self.write_jsonl([
+            {'type': 'code_example', 'topic': 'T', 'title': 'E', 'explanation': 'new'},
+        ]), '--update')
+        example.refresh_from_db()
+        self.assertEqual((example.explanation, example.highlighted_code), ('new', highlighted))
+
+        self.import_content(self.write_jsonl([
+            {'type': 'code_example', 'topic': 'T', 'title': 'E', 'language': 'javascript'},
+        ]), '--update')
+        example.refresh_from_db()
+        self.assertEqual(example.code, 'def f():\n    return 1')
+        self.assertEqual(example.highlight_key, highlight_key(example.code, 'javascript'))
+        self.assertIn('return', example.highlighted_code)
+
+    def test_rejects_fields_of_the_wrong_type(self):
+        stdout, stderr = self.import_content(self.write_jsonl([
+            {'type': 'category', 'name': 'Bad', 'order': 'first'},
+            {'type': 'category', 'name': 'Good', 'order': '2'},
+        ]))
+        self.assertIn("invalid 'order'", stderr)
+        self.assertIn('1 rejected', stdout)
+        self.assertEqual(list(Category.objects.values_list('name', 'order')), [('Good', 2)])
+
+    def test_load_sample_data_is_idempotent(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('load_sample_data', stdout=StringIO())
+            call_command('load_sample_data', stdout=StringIO())
+        self.assertEqual(Category.objects.count(), 5)
+        self.assertEqual(Topic.objects.get(title='FastAPI Async Operations').category.name, 'FastAPI')
+
+
+class CodeHighlightingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Python Fundamentals')
+        cls.topic = Topic.objects.create(
+            title='Decorators', description='...', category=category, estimated_time='5 minutes',
+        )
+
+    def test_save_renders_and_rerenders_on_change(self):
+        example = CodeExample.objects.create(topic=self.topic, title='Timer', code='def timer(): pass')
+        self.assertIn('<span class="k">def</span>', example.highlighted_code)
+        key = example.highlight_key
+        example.code = 'SELECT 1'
+        example.language = 'sql'
+        example.save(update_fields=['code', 'language'])
+        example.refresh_from_db()
+        self.assertNotEqual(example.highlight_key, key)
+        self.assertIn('<span class="k">SELECT</span>', example.highlighted_code)
+
+    def test_backfill_renders_stale_rows(self):
+        CodeExample.objects.bulk_create([
+            CodeExample(topic=self.topic, title=f'Example {index}', code='x = 1') for index in range(3)
+        ])
+        stdout = StringIO()
+        call_command('highlight_code', workers=1, stdout=stdout)
+        self.assertIn('Highlighted 3 code examples', stdout.getvalue())
+        self.assertFalse(CodeExample.objects.filter(highlighted_code='').exists())
+        call_command('highlight_code', workers=1, stdout=stdout)
+        self.assertIn('Highlighted 0 code examples', stdout.getvalue())
+
+    def test_backfill_in_worker_processes(self):
+        CodeExample.objects.bulk_create([
+            CodeExample(topic=self.topic, title=f'Example {index}', code=f'x = {index}') for index in range(5)
+        ])
+        stdout = StringIO()
+        call_command('highlight_code', workers=2, batch_size=2, verbosity=2, stdout=stdout)
+        self.assertIn('Highlighted 5 code examples', stdout.getvalue())
+        self.assertIn('render: 3 items', stdout.getvalue())
+        self.assertFalse(CodeExample.objects.filter(highlighted_code='').exists())
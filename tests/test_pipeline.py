@@ -0,0 +1,76 @@
+# tests/test_pipeline.py
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from apps.core.pipeline import Pipeline, Stage
+
+
+class PipelineTests(SimpleTestCase):
+    def test_stages_run_in_order_and_drop_none(self):
+        pipeline = Pipeline([
+            Stage('double', lambda n: n * 2, workers=3),
+            Stage('odd_tens', lambda n: n if n % 20 else None, workers=2),
+        ])
+        results = sorted(pipeline.run(range(100)))
+        self.assertEqual(results, [n * 2 for n in range(100) if (n * 2) % 20])
+        self.assertEqual([metrics.items for metrics in pipeline.metrics], [100, 100])
+        self.assertTrue(pipeline.summary()[0].startswith('double: 100 items'))
+
+    def test_slow_stage_applies_backpressure(self):
+        pulled, lock = [], threading.Lock()
+
+        def source():
+            for n in range(40):
+                with lock:
+                    pulled.append(n)
+                yield n
+
+        def slow(n):
+            time.sleep(0.005)
+            return n
+
+        outstanding = []
+        pipeline = Pipeline([Stage('slow', slow, workers=2, queue_size=2)], output_size=2)
+        for count, _ in enumerate(pipeline.run(source()), 1):
+            outstanding.append(len(pulled) - count)
+        self.assertEqual(len(outstanding), 40)
+        # input queue + workers + output queue + the item being fed
+        self.assertLessEqual(max(outstanding), 2 + 2 + 2 + 1)
+
+    def test_errors_stop_the_pipeline(self):
+        def fail_on_seven(n):
+            if n == 7:
+                raise ValueError('bad item')
+            return n
+
+        pipeline = Pipeline([Stage('check', fail_on_seven, workers=2)])
+        with self.assertRaisesMessage(ValueError, 'bad item'):
+            list(pipeline.run(range(1000)))
+        self.assertLess(pipeline.metrics[0].items, 1000)
+        self.assertFalse(any(thread.name.startswith('check-') for thread in threading.enumerate()))
+
+    def test_consumer_can_stop_early(self):
+        pipeline = Pipeline([Stage('identity', lambda n: n, workers=2)])
+        for result in pipeline.run(range(1000)):
+            break
+        self.assertFalse(any(thread.name.startswith('identity-') for thread in threading.enumerate()))
+
+    def test_shuts_down_with_full_queues(self):
+        def slow(n):
+            time.sleep(0.002)
+            return n
+
+        pipelines = [
+            Pipeline([Stage('identity', lambda n: n, workers=4), Stage('slow', slow)]),
+            Pipeline([Stage('identity', lambda n: n, workers=8), Stage('slow', slow)]),
+            Pipeline([Stage('identity', lambda n: n, workers=4, queue_size=1)], output_size=1),
+        ]
+        for pipeline in pipelines:
+            results = []
+            runner = threading.Thread(target=lambda: results.extend(pipeline.run(range(60))), daemon=True)
+            runner.start()
+            runner.join(10)
+            self.assertFalse(runner.is_alive(), pipeline.summary())
+            self.assertEqual(sorted(results), list(range(60)))
@@ -0,0 +1,57 @@
+# tests/test_query_plans.py
+"""
+EXPLAIN the hot-path queries of the topics views and fail on full table
+scans. Runs against SQLite by default; use config.settings.test_postgres to
+check the same plans on PostgreSQL.
+"""
+from django.test import TestCase
+
+from apps.core.pagination import keyset_filter
+from apps.core.testing import QueryPlanMixin
+from apps.topics.filters import filter_by_tags
+from apps.topics.models import Category, Topic, CodeExample, InterviewQuestion
+from apps.topics.views import CATEGORY_ORDERING, TOPIC_ORDERING
+
+
+class TopicQueryPlanTests(QueryPlanMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Python Fundamentals')
+        cls.topic = Topic.objects.create(
+            title='Decorators', description='...', category=cls.category, estimated_time='5 minutes',
+        )
+        cls.topic.set_tags(['python', 'functions'])
+        cls.page_key = [cls.category.pk, 0, 'Decorators', cls.topic.pk]
+
+    def test_listing_pages(self):
+        topics = Topic.objects.order_by(*TOPIC_ORDERING)
+        self.assertUsesIndex(topics[:21], 'topic_keyset_idx')
+        self.assertUsesIndex(
+            topics.filter(keyset_filter(TOPIC_ORDERING, self.page_key))[:21], 'topic_keyset_idx', seek=True,
+        )
+        self.assertUsesIndex(
+            topics.filter(keyset_filter(TOPIC_ORDERING, self.page_key, reverse=True))[:21],
+            'topic_keyset_idx', seek=True,
+        )
+
+    def test_listing_filters(self):
+        topics = Topic.objects.order_by(*TOPIC_ORDERING)
+        self.assertUsesIndex(topics.filter(category_id=self.category.pk)[:13], 'topic_keyset_idx', seek=True)
+        self.assertUsesIndex(topics.filter(difficulty='advanced')[:13], 'topic_difficulty_idx', seek=True)
+        self.assertUsesIndex(topics.filter(is_featured=True)[:21], 'topic_featured_idx')
+        # Tag matches are looked up by primary key, then sorted
+        self.assertUsesIndex(filter_by_tags(topics, {'python', 'functions'})[:13], sort=True)
+
+    def test_featured_on_home_page(self):
+        # Meta.ordering sorts by Category.order, but only the featured rows
+        self.assertUsesIndex(Topic.objects.filter(is_featured=True)[:6], 'topic_featured_idx', sort=True)
+
+    def test_topic_children(self):
+        self.assertUsesIndex(CodeExample.objects.filter(topic=self.topic), 'codeexample_topic_order_idx')
+        self.assertUsesIndex(InterviewQuestion.objects.filter(topic=self.topic), 'question_topic_order_idx')
+        # Prefetches for a page of topics merge several index ranges
+        self.assertUsesIndex(CodeExample.objects.filter(topic__in=[self.topic.pk, 0]), sort=True)
+        self.assertUsesIndex(InterviewQuestion.objects.filter(topic__in=[self.topic.pk, 0]), sort=True)
+
+    def test_category_listing(self):
+        self.assertUsesIndex(Category.objects.order_by(*CATEGORY_ORDERING)[:21], 'category_keyset_idx')
@@ -1 +1,209 @@
-# This file is intentionally left blank.
\ No newline at end of file
+# tests/test_views.py
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import Client, TestCase, override_settings
+from django.urls import include, path
+from django.utils import timezone
+
+from apps.core.querycount import fingerprint
+from apps.core.testing import QueryBudgetMixin
+from apps.topics.models import Category, Tag, Topic, CodeExample, InterviewQuestion
+from apps.topics.search import reset_search_index
+from apps.topics.suggest import mark_suggest_index_stale
+
+
+def create_catalogue(categories=3, topics_per_category=4):
+    for category_index in range(categories):
+        category = Category.objects.create(name=f'Category {category_index}', order=category_index)
+        for topic_index in range(topics_per_category):
+            topic = Topic.objects.create(
+                title=f'Topic {category_index}.{topic_index}',
+                description='Understanding generators and iterators in depth',
+                category=category,
+                estimated_time='15 minutes',
+                difficulty=Topic.DIFFICULTY_CHOICES[topic_index % 3][0],
+                is_featured=topic_index == 0,
+            )
+            topic.set_tags(['python', f'tag-{topic_index}'])
+            for example_index in range(2):
+                CodeExample.objects.create(topic=topic, title=f'Example {example_index}', code='pass')
+                InterviewQuestion.objects.create(topic=topic, question='Why?', sample_answer='Because.')
+
+
+class QueryBudgetTests(QueryBudgetMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_catalogue()
+        cls.category = Category.objects.first()
+        cls.topic = Topic.objects.first()
+
+    def setUp(self):
+        cache.clear()
+        reset_search_index()
+        mark_suggest_index_stale()
+
+    def test_category_endpoints(self):
+        self.assertWithinQueryBudget('category-list')
+        self.assertWithinQueryBudget('category-detail', args=[self.category.pk])
+        self.assertWithinQueryBudget('category-topics', args=[self.category.pk])
+
+    def test_topic_endpoints(self):
+        self.assertWithinQueryBudget('topic-list')
+        self.assertWithinQueryBudget('topic-detail', args=[self.topic.pk])
+        self.assertWithinQueryBudget('topic-featured')
+        self.assertWithinQueryBudget('topic_detail', args=[self.topic.pk])
+
+    def test_async_endpoints(self):
+        self.assertWithinQueryBudget('async-topic-list')
+        self.assertWithinQueryBudget('async-topic-list', data={'tag': 'python'})
+        self.assertWithinQueryBudget('async-topic-detail', args=[self.topic.pk])
+        self.assertWithinQueryBudget('async-category-list')
+        self.assertWithinQueryBudget('async-category-detail', args=[self.category.pk])
+
+    def test_html_list_pages(self):
+        response = self.assertWithinQueryBudget('home')
+        self.assertEqual(response.context['total_topics'], 12)
+        self.assertEqual(response.context['total_categories'], 3)
+        self.assertContains(response, '4 topics')
+
+        response = self.assertWithinQueryBudget('topic_list')
+        self.assertContains(response, '2 examples')
+        self.assertContains(response, '2 questions')
+        self.assertWithinQueryBudget('topic_list', data={'tag': 'python', 'difficulty': 'beginner'})
+
+    def test_core_endpoints(self):
+        self.assertWithinQueryBudget('api_search', data={'q': 'generators'})
+        self.assertWithinQueryBudget('api_suggest', data={'prefix': 'top'})
+        self.assertWithinQueryBudget('api_stats')
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_catalogue(categories=3, topics_per_category=9)
+        cls.expected = list(Topic.objects.order_by('category_id', 'order', 'title', 'id').values_list('title', flat=True))
+
+    def setUp(self):
+        cache.clear()
+
+    def test_api_walks_forwards_and_backwards(self):
+        first = self.client.get('/topics/api/topics/').json()
+        self.assertEqual(first['count'], 27)
+        self.assertIsNone(first['previous'])
+        second = self.client.get(first['next']).json()
+        self.assertIsNone(second['next'])
+        titles = [row['title'] for row in first['results'] + second['results']]
+        self.assertEqual(titles, self.expected)
+        back = self.client.get(second['previous']).json()
+        self.assertEqual(back['results'], first['results'])
+        self.assertIsNone(back['previous'])
+
+    def test_api_walks_sub_millisecond_timestamps(self):
+        # Ten topics per millisecond, so a cursor rounded to milliseconds misses rows
+        started = timezone.now().replace(microsecond=0)
+        for n, pk in enumerate(Topic.objects.order_by('?').values_list('pk', flat=True)):
+            Topic.objects.filter(pk=pk).update(created_at=started + timedelta(microseconds=n * 100 + 1))
+        for ordering in ('created_at', '-created_at'):
+            expected = list(Topic.objects.order_by(ordering, 'id').values_list('title', flat=True))
+            titles, url = [], f'/topics/api/topics/?ordering={ordering}&count=false'
+            while url:
+                body = self.client.get(url).json()
+                titles += [row['title'] for row in body['results']]
+                url = body['next']
+            self.assertEqual(titles, expected, ordering)
+
+    def test_api_can_skip_count_and_rejects_bad_cursors(self):
+        body = self.client.get('/topics/api/topics/', {'count': 'false'}).json()
+        self.assertNotIn('count', body)
+        self.assertEqual(self.client.get('/topics/api/topics/', {'cursor': 'bogus'}).status_code, 404)
+
+    def test_html_list_keeps_filters_in_cursor_links(self):
+        response = self.client.get('/topics/', {'tag': 'python'})
+        self.assertEqual(len(response.context['topics']), 12)
+        self.assertIn('tag=python', response.context['next_query'])
+        titles = []
+        query = response.context['first_query']
+        while query is not None:
+            response = self.client.get('/topics/?' + query)
+            titles += [topic.title for topic in response.context['topics']]
+            query = response.context.get('next_query')
+        self.assertEqual(titles, self.expected)
+
+
+def category_topic_counts(request):
+    # Deliberate N+1: one COUNT per category
+    counts = [category.topics.count() for category in Category.objects.all()]
+    return HttpResponse(str(counts))
+
+
+urlpatterns = [
+    path('n-plus-one/', category_topic_counts, name='n_plus_one'),
+    path('', include('config.urls')),
+]
+
+
+@override_settings(ROOT_URLCONF='tests.test_views')
+class QueryCountMiddlewareTests(TestCase):
+    def test_fingerprint_collapses_literals_and_in_lists(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'x'  LIMIT 21"),
+            fingerprint("SELECT * FROM t WHERE id IN (%s) AND name = 'y' LIMIT 5"),
+        )
+
+    @override_settings(DEBUG=True)
+    def test_reports_query_headers_and_repeated_queries(self):
+        create_catalogue()
+        client = Client()
+        with self.assertLogs('apps.core.middleware', 'WARNING') as logs:
+            response = client.get('/n-plus-one/')
+        self.assertEqual(response['X-Query-Count'], '4')
+        self.assertIn('X-Query-Time-Ms', response)
+        self.assertEqual(response['X-Query-Repeated'], '3')
+        self.assertIn('Possible N+1 in n_plus_one', logs.output[0])
+
+        response = client.get('/topics/api/categories/')
+        self.assertEqual(response['X-Query-Budget'], '7')
+        self.assertNotIn('X-Query-Repeated', response)
+
+
+class FragmentCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_catalogue(categories=1, topics_per_category=2)
+        cls.topic = Topic.objects.get(title='Topic 0.0')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_topic_cards_follow_updates(self):
+        self.assertContains(self.client.get('/topics/'), '2 examples', count=2)
+        CodeExample.objects.create(topic=self.topic, title='Example 2', code='pass')
+        self.assertContains(self.client.get('/topics/'), '3 examples', count=1)
+
+        self.topic.category.name = 'Renamed'
+        self.topic.category.save()
+        # Both cards and the category filter
+        self.assertContains(self.client.get('/topics/'), 'Renamed', count=3)
+
+        self.topic.title = 'Featured generators'
+        self.topic.save()
+        self.assertContains(self.client.get('/'), 'Featured generators')
+
+    def test_topic_cards_follow_tag_renames_and_deletes(self):
+        self.assertContains(self.client.get('/topics/'), 'tag-1')
+        tag = Tag.objects.get(name='tag-1')
+        tag.name = 'renamed-tag'
+        tag.save()
+        response = self.client.get('/topics/')
+        self.assertContains(response, 'renamed-tag')
+        self.assertNotContains(response, 'tag-1')
+
+        tag.delete()
+        self.assertNotContains(self.client.get('/topics/'), 'renamed-tag')
+
+    def test_cards_are_served_from_the_cache(self):
+        self.client.get('/topics/')
+        Topic.objects.filter(pk=self.topic.pk).update(title='Not re-rendered')
+        self.assertNotContains(self.client.get('/topics/'), 'Not re-rendered')